@@ -0,0 +1,47 @@
+#! /usr/bin/env python3
+""" Query messages from a log recorded with uvm.base.uvm_msg_database.
+
+Examples:
+    uvm_msg_query.py sim_msgs.umdb --severity UVM_ERROR
+    uvm_msg_query.py sim_msgs.umdb --id BUS_ERR --from 1000 --to 2000 --limit 10
+    uvm_msg_query.py sim_msgs.umdb --count
+"""
+
+import argparse
+import sys
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("file", help="Message database file")
+    parser.add_argument("--severity", help="UVM_INFO/UVM_WARNING/UVM_ERROR/UVM_FATAL")
+    parser.add_argument("--id", help="Message ID")
+    parser.add_argument("--from", dest="t_min", type=float, help="Min time in NS")
+    parser.add_argument("--to", dest="t_max", type=float, help="Max time in NS")
+    parser.add_argument("--limit", type=int, help="Max number of messages")
+    parser.add_argument("--count", action="store_true",
+        help="Print only the number of matching messages")
+    parser.add_argument("--reindex", action="store_true",
+        help="Update the index file to cover the whole log")
+    args = parser.parse_args(argv)
+
+    # uvm reads plusargs from sys.argv on import. Keep the banners off stdout.
+    sys.argv = [sys.argv[0], "+UVM_NO_RELNOTES", "+UVM_VERBOSITY=UVM_LOW"]
+    from uvm.base.uvm_msg_database import UVMMsgLog
+
+    with UVMMsgLog(args.file) as log:
+        if args.reindex:
+            log.reindex()
+        recs = log.query(severity=args.severity, id=args.id, t_min=args.t_min,
+            t_max=args.t_max, limit=args.limit)
+        if args.count:
+            print(len(recs))
+        else:
+            for rec in recs:
+                print(UVMMsgLog.format_record(log.get_record(rec)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,6 +14,7 @@ from .uvm_global_vars import *
 from .uvm_globals import *
 from .uvm_mailbox import *
 from .uvm_misc import *
+from .uvm_msg_database import *
 from .uvm_object import *
 from .uvm_object_globals import *
 from .uvm_objection import *
@@ -28,7 +29,9 @@ from .uvm_report_catcher import *
 from .uvm_report_handler import *
 from .uvm_report_message import *
 from .uvm_report_object import *
+from .uvm_report_profiler import *
 from .uvm_report_server import *
+from .uvm_report_sink import *
 from .uvm_resource import *
 from .uvm_resource_db import *
 from .uvm_root import *
@@ -28,6 +28,7 @@ access. cocotb is already hiding these details from us.
 from inspect import getframeinfo, stack
 import re
 import random
+from types import MappingProxyType
 from typing import List, Any
 
 import cocotb
@@ -334,14 +335,45 @@ class sv_obj(crv.Randomized):
 
     num_objs = 0
 
+    # Not part of SV UVM. Most objects are never randomized, so the
+    # randomization bookkeeping is not created per instance. Until an object
+    # adds random variables or constraints (see m_init_rand), it reads these
+    # shared read-only tables of the class. The random state is stored only
+    # after the first randomize(). Before that, it is the state right after
+    # seeding with _sv_seed.
+    _randVariables = MappingProxyType({})
+    _simpleConstraints = MappingProxyType({})
+    _implConstraints = MappingProxyType({})
+    _implDistributions = MappingProxyType({})
+    _simpleDistributions = MappingProxyType({})
+    _solve_order = ()
+    _sv_rand_obj = ()
+    _sv_rand_state = None
+    _rand_mode = True
+
     def __init__(self):
-        crv.Randomized.__init__(self)
         self._sv_seed = sv.urandom()
-        self._sv_rand_obj = []
         random.seed(self._sv_seed)
-        self._sv_rand_state = random.getstate()
-        self._rand_mode = True
         sv_obj.num_objs += 1
+
+    def do_recycle(self):
+        """
+        Not part of SV UVM. Returns the randomization state of a recycled
+        object to the state left by the constructor, see
+        `UVMObject.do_recycle`. The object is seeded again as in the
+        constructor, and rand_mode is switched on.
+        """
+        self.__dict__.pop("_rand_mode", None)
+        self.__dict__.pop("_sv_rand_state", None)
+        self._sv_seed = sv.urandom()
+        random.seed(self._sv_seed)
+        sv_obj.num_objs += 1
+
+    def m_init_rand(self):
+        """ Creates the per-instance randomization tables if not done yet """
+        if "_randVariables" not in self.__dict__:
+            crv.Randomized.__init__(self)
+            self._sv_rand_obj = []
         # print("Created SVObj@{}: Seed {}, State: {}".format(sv_obj.num_objs,
         # self._sv_seed, self._sv_rand_state))
 
@@ -373,6 +405,7 @@ class sv_obj(crv.Randomized):
             key (str): Name of the property.
             val_list (list|range): Optional constraints for randomisation.
         """
+        self.m_init_rand()
         if hasattr(key, "randomize"):
             if val_list is None:
                 self._sv_rand_obj.append(key)
@@ -401,8 +434,12 @@ class sv_obj(crv.Randomized):
         """
         if self._rand_mode is False:
             return True
+        self.m_init_rand()
         try:
-            random.setstate(self._sv_rand_state)
+            if self._sv_rand_state is None:
+                random.seed(self._sv_seed)
+            else:
+                random.setstate(self._sv_rand_state)
             self.pre_randomize()
             ok = True
             if recurse:
@@ -423,6 +460,7 @@ class sv_obj(crv.Randomized):
     def randomize_with(self, *constr):
         if self._rand_mode is False:
             return True
+        self.m_init_rand()
         try:
             self.pre_randomize()
             ok = True
@@ -439,6 +477,23 @@ class sv_obj(crv.Randomized):
             # return False
 
 
+def m_sv_obj_rand_method(name):
+    method = getattr(crv.Randomized, name)
+
+    def rand_method(self, *args, **kwargs):
+        self.m_init_rand()
+        return method(self, *args, **kwargs)
+    rand_method.__name__ = name
+    rand_method.__doc__ = method.__doc__
+    return rand_method
+
+
+# Methods of crv.Randomized which modify the randomization tables
+for _name in ["add_rand", "addRand", "add_constraint", "addConstraint",
+        "del_constraint", "delConstraint", "solve_order", "solveOrder"]:
+    setattr(sv_obj, _name, m_sv_obj_rand_method(_name))
+
+
 class semaphore():
 
     def __init__(self, count=1):
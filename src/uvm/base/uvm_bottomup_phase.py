@@ -61,7 +61,7 @@ class UVMBottomupPhase(UVMPhase):
             phase (UVMPhase):
             state:
         """
-        uvm_debug(self, 'traverse', self.get_name() + ' traversing bottomup phase now with ' +
+        uvm_debug(self, 'traverse', lambda: self.get_name() + ' traversing bottomup phase now with ' +
                 comp.get_name())
         name = ""
         phase_domain = phase.get_domain()
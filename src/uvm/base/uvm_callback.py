@@ -101,6 +101,9 @@ class UVMCallbacksBase(UVMObject):
     m_b_inst = None
     m_pool = UVMPool()  # uvm_object -> uvm_queue#(uvm_callback)
     m_tracing = True
+    # Not part of SV UVM. Incremented whenever a callback queue has been
+    # modified, so that callback queues can be cached (see UVMReportCatcher).
+    m_generation = 0
 
     def __init__(self, name):
         super().__init__(name)
@@ -356,6 +359,9 @@ class UVMTypedCallbacks(UVMCallbacksBase):  # (type T=uvm_object) extends uvm_ca
                     break
                 #end while(m_t_inst.m_pool.next(obj))
 
+        # Bumped only after the queues are modified, see UVMCallbacks.add
+        UVMCallbacksBase.m_generation += 1
+
         for i in range(len(self.m_derived_types)):
             cb_pair = UVMTypeIDBase.typeid_map[self.m_derived_types[i]]
             if cb_pair != self:
@@ -714,7 +720,6 @@ class UVMCallbacks(UVMTypedCallbacks):
                      + nm + " (" + tnm + ")", UVM_NONE)
             return
 
-
         if not cls.m_base_inst.check_registration(obj,cb):
             nm, tnm = cls.get_obj_and_typename(obj)
 
@@ -778,6 +783,9 @@ class UVMCallbacks(UVMTypedCallbacks):
                     q.append(cb)
                 else:
                     q.insert(0, cb)
+                # Bumped only after the queue is modified. Reports issued
+                # above would otherwise cache the old queues.
+                UVMCallbacksBase.m_generation += 1
 
         #  endfunction
 
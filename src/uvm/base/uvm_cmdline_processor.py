@@ -450,7 +450,7 @@ class UVMCmdlineProcessor(UVMReportObject):
 
         chars = len(match)
         for i in range(len(self.m_argv)):
-            uvm_debug(self, 'get_arg_values', 'Checking ' + self.m_argv[i] + ' - '
+            uvm_debug(self, 'get_arg_values', lambda: 'Checking ' + self.m_argv[i] + ' - '
                 + match)
             if len(self.m_argv[i]) >= chars:
                 argv_str = self.m_argv[i][0:chars]
@@ -522,12 +522,12 @@ class UVMCmdlineProcessor(UVMReportObject):
             self.m_argv.append(arg)
             if arg[0] == "+":
                 self.m_plus_argv.append(arg[0])
-                uvm_debug(self, '__init__', "Simple UVM plusarg %s" % (arg))
+                uvm_debug(self, '__init__', "Simple UVM plusarg %s", arg)
             sub = arg[1:4]
             sub = sub.upper()
             if sub == "UVM":
                 self.m_uvm_argv.append(arg)
-                uvm_debug(self, '__init__', "Found UVM plusarg %s" % (arg))
+                uvm_debug(self, '__init__', "Found UVM plusarg %s", arg)
 
 
     def m_convert_verb(self, verb_str):
@@ -92,7 +92,7 @@ class UVMBuildPhase(UVMTopdownPhase):
         Returns:
             UVMBuildPhase:
         """
-        uvm_debug(cls, 'get', 'called with ' + str(cls))
+        uvm_debug(cls, 'get', lambda: 'called with ' + str(cls))
         if UVMBuildPhase.m_inst is None:
             uvm_debug(cls, 'get', "UVMBuildPhase is none. Returning new class")
             UVMBuildPhase.m_inst = UVMBuildPhase()
@@ -293,7 +293,7 @@ class UVMRunPhase(UVMTaskPhase):
 
 
     async def exec_task(self, comp, phase):
-        uvm_debug(self, 'exec_task', comp.get_name() + ' yielding comp.run_phase()')
+        uvm_debug(self, 'exec_task', lambda: comp.get_name() + ' yielding comp.run_phase()')
         # tpoikela, modification  of original to allow handle for proc
         #yield comp.run_phase(phase)
         comp.m_run_process = cocotb.fork(comp.run_phase(phase))
@@ -306,7 +306,7 @@ class UVMRunPhase(UVMTaskPhase):
         #else:
         #    if parent is not None:
         #            comp.get_name())
-        uvm_debug(self, 'exec_task', comp.get_name() + ' returned from comp.run_phase()')
+        uvm_debug(self, 'exec_task', lambda: comp.get_name() + ' returned from comp.run_phase()')
 
     m_inst = None  # static uvm_run_phase
     type_name = "uvm_run_phase"
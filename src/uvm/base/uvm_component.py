@@ -575,7 +575,7 @@ class UVMComponent(UVMReportObject):
 
         The run_phase task should never be called directly.
         """
-        uvm_debug(self, 'run_phase', self.get_name() + ' yielding self.run()')
+        uvm_debug(self, 'run_phase', lambda: self.get_name() + ' yielding self.run()')
         # self.m_run_process = cocotb.fork(self.run())
         # yield self.m_run_process
         await self.run()
@@ -584,7 +584,7 @@ class UVMComponent(UVMReportObject):
     # extern virtual task run()
 
     async def run(self):
-        uvm_debug(self, 'run', self.get_name() + ' yield Timer(0) in self.run()')
+        uvm_debug(self, 'run', lambda: self.get_name() + ' yield Timer(0) in self.run()')
         await uvm_zero_delay()
 
     async def pre_reset_phase(self, phase):
@@ -1224,6 +1224,8 @@ class UVMComponent(UVMReportObject):
         #  // entry to indicate string, uvm_bitstream_t, or object. That way,
         #  // we call 'get' for specific fields of specific types rather than
         #  // the search-and-cast approach here.
+        # lookup_scope() uses a scope index of the pool, so only resources
+        # visible to this component are visited.
         rq = rp.lookup_scope(self.get_full_name())
         rq = UVMResourcePool.sort_by_precedence(rq)
 
@@ -1251,7 +1253,7 @@ class UVMComponent(UVMReportObject):
                 continue
 
             if verbose:
-                uvm_info("CFGAPL",sv.sformatf("applying configuration to field %s", name),UVM_NONE)
+                uvm_info("CFGAPL", "applying configuration to field %s", UVM_NONE, name)
 
             val = r.read(self)
             if isinstance(val, int):
@@ -1263,7 +1265,7 @@ class UVMComponent(UVMReportObject):
             elif isinstance(val, str):
                 self.set_string_local(name, val)
             elif verbose:
-                uvm_info("CFGAPL", sv.sformatf("field %s has an unsupported type", name), UVM_NONE)
+                uvm_info("CFGAPL", "field %s has an unsupported type", UVM_NONE, name)
         T_cont.field_array.clear()
 
 
@@ -20,12 +20,14 @@
 #//   permissions and limitations under the License.
 #//----------------------------------------------------------------------
 
+import json
+
 from cocotb.triggers import Event
 
-from .uvm_resource import UVMResourceBase, UVMResource, UVMResourcePool, PRI_HIGH
+from .uvm_resource import (UVMResourceBase, UVMResource, UVMResourcePool, PRI_HIGH,
+    m_compile_scope)
 from .uvm_resource_db import UVMResourceDb
 from .uvm_pool import UVMPool
-from .sv import uvm_re_match, uvm_glob_to_re
 from .uvm_debug import uvm_debug
 
 """
@@ -78,8 +80,17 @@ class UVMConfigDb(UVMResourceDb):
 
     #  // Internal waiter list for wait_modified
     #  static local uvm_queue#(m_uvm_waiter) m_waiters[string];
+    # Waiters are bucketed by field name and then by exact instance name:
+    # m_waiters[field_name][inst_name] = [m_uvm_waiter, ...]
     m_waiters = {}
 
+    # Cache of get() results keyed by (inst_name, field_name, T). Valid while
+    # UVMResourcePool.m_generation does not change.
+    m_get_cache = {}
+    m_get_cache_gen = -1
+    m_get_cache_pool = None
+    max_get_cache = 4096
+
     @classmethod
     def get(cls, cntxt, inst_name, field_name, value, T=None):
         """
@@ -89,6 +100,10 @@ class UVMConfigDb(UVMResourceDb):
         instance that the configuration object applies to. `field_name`
         is the specific field in the scope that is being searched for.
 
+        Results are cached until the resource database is modified by a
+        set, a priority change, a scope or precedence change or a resource
+        write.
+
         The basic ~get_config_*~ methods from `UVMComponent` are mapped to
         this function as:
 
@@ -124,10 +139,22 @@ class UVMConfigDb(UVMResourceDb):
         elif cntxt.get_full_name() != "":
             inst_name = cntxt.get_full_name() + "." + inst_name
 
-        #rq = rp.lookup_regex_names(inst_name, field_name, uvm_resource#(T)::get_type());
-        rq = rp.lookup_regex_names(inst_name, field_name)
-        uvm_debug(cls, 'get', 'rq size is ' + str(rq))
-        r = UVMResource.get_highest_precedence(rq, T)
+        if (UVMConfigDb.m_get_cache_gen != UVMResourcePool.m_generation
+                or UVMConfigDb.m_get_cache_pool is not rp
+                or len(UVMConfigDb.m_get_cache) >= UVMConfigDb.max_get_cache):
+            UVMConfigDb.m_get_cache = {}
+            UVMConfigDb.m_get_cache_gen = UVMResourcePool.m_generation
+            UVMConfigDb.m_get_cache_pool = rp
+
+        key = (inst_name, field_name, T)
+        if key in UVMConfigDb.m_get_cache:
+            r = UVMConfigDb.m_get_cache[key]
+        else:
+            #rq = rp.lookup_regex_names(inst_name, field_name, uvm_resource#(T)::get_type());
+            rq = rp.lookup_regex_names(inst_name, field_name)
+            uvm_debug(cls, 'get', lambda: 'rq size is ' + str(rq))
+            r = UVMResource.get_highest_precedence(rq, T)
+            UVMConfigDb.m_get_cache[key] = r
 
         if UVMConfigDbOptions.is_tracing():
             UVMResourceDb.m_show_msg("CFGDB/GET", "Configuration","read", inst_name,
@@ -232,6 +259,7 @@ class UVMConfigDb(UVMResourceDb):
             r.precedence = UVMResourceBase.default_precedence
 
         r.write(value, cntxt)
+        UVMResourcePool.m_generation += 1
 
         if exists:
             rp = UVMResourcePool.get()
@@ -242,11 +270,7 @@ class UVMConfigDb(UVMResourceDb):
 
         # trigger any waiters
         if field_name in UVMConfigDb.m_waiters:
-            w = None
-            for i in range(len(UVMConfigDb.m_waiters[field_name])):
-                w = UVMConfigDb.m_waiters[field_name].get(i)
-                if uvm_re_match(uvm_glob_to_re(inst_name),w.inst_name) == 0:
-                    w.trigger.set()
+            UVMConfigDb.m_trigger_waiters(inst_name, UVMConfigDb.m_waiters[field_name])
 
         if p is not None:
             p.set_randstate(rstate)
@@ -254,6 +278,125 @@ class UVMConfigDb(UVMResourceDb):
         if UVMConfigDbOptions.is_tracing():
             UVMResourceDb.m_show_msg("CFGDB/SET", "Configuration","set", inst_name, field_name, cntxt, r)
 
+    @classmethod
+    def set_bulk(cls, settings, T=None):
+        """
+        Not part of SV UVM. Applies many configuration settings in one pass.
+        The result is identical to calling `set` for each setting in order,
+        but the name queues of the resource pool are updated once per field
+        name.
+
+        Args:
+            settings (iterable): (cntxt, inst_name, field_name, value) tuples.
+                `cntxt` is a component, the full name of a component or None.
+            T: As in `set`.
+        Returns:
+            int: Number of settings applied.
+        """
+        from .uvm_coreservice import UVMCoreService
+        cs = UVMCoreService.get()
+        top = cs.get_root()
+        curr_phase = top.m_current_phase
+        in_build = curr_phase is not None and curr_phase.get_name() == "build"
+        tracing = UVMConfigDbOptions.is_tracing()
+        cntxts = {}  # Full name -> component
+        created = []  # New resources
+        moved = {}  # field_name -> {resource: None} in the order of last move
+        count = 0
+
+        for (cntxt, inst_name, field_name, value) in settings:
+            if isinstance(cntxt, str):
+                if cntxt not in cntxts:
+                    cntxts[cntxt] = top if cntxt == "" else top.find(cntxt)
+                if cntxts[cntxt] is None:
+                    continue  # find() has already warned about it
+                cntxt = cntxts[cntxt]
+            if field_name == "":
+                # Anonymous resources are not kept in the name map
+                cls.set(cntxt, inst_name, field_name, value, T)
+                count += 1
+                continue
+
+            if cntxt is None:
+                cntxt = top
+            if inst_name == "":
+                inst_name = cntxt.get_full_name()
+            elif cntxt.get_full_name() != "":
+                inst_name = cntxt.get_full_name() + "." + inst_name
+
+            if cntxt not in UVMConfigDb.m_rsc:
+                UVMConfigDb.m_rsc[cntxt] = UVMPool()
+            pool = UVMConfigDb.m_rsc[cntxt]
+            lookup = inst_name + "__M_UVM__" + field_name
+
+            exists = pool.exists(lookup)
+            if not exists:
+                r = UVMResource(field_name, inst_name)
+                pool.add(lookup, r)
+            else:
+                r = pool.get(lookup)
+
+            if in_build:
+                r.precedence = UVMResourceBase.default_precedence - cntxt.get_depth()
+            else:
+                r.precedence = UVMResourceBase.default_precedence
+
+            r.write(value, cntxt)
+
+            if exists:
+                if field_name not in moved:
+                    moved[field_name] = {}
+                moved[field_name].pop(r, None)
+                moved[field_name][r] = None
+            else:
+                created.append(r)
+
+            if field_name in UVMConfigDb.m_waiters:
+                UVMConfigDb.m_trigger_waiters(inst_name, UVMConfigDb.m_waiters[field_name])
+            if tracing:
+                UVMResourceDb.m_show_msg("CFGDB/SET", "Configuration","set", inst_name,
+                    field_name, cntxt, r)
+            count += 1
+
+        UVMResourcePool.get().m_set_bulk(created,
+            {name: list(rsrcs) for (name, rsrcs) in moved.items()})
+        return count
+
+    @classmethod
+    def load_file(cls, filename):
+        """
+        Not part of SV UVM. Applies configuration settings from a JSON file
+        using `set_bulk`. The file contains a list of settings, each either a
+        list `[cntxt, inst_name, field_name, value]` or an object with keys
+        "cntxt", "inst_name", "field_name" and "value". `cntxt` is the full
+        name of a component, "" for the top. It can be omitted in objects.
+
+        .. code-block:: json
+
+          [["", "uvm_test_top.env.*", "num_items", 10],
+           {"inst_name": "*.agent", "field_name": "is_active", "value": 0}]
+
+        This method is called for files given with `+uvm_set_config_file=`.
+
+        Args:
+            filename (str): JSON file.
+        Returns:
+            int: Number of settings applied.
+        Raises:
+            Exception: If a setting is not valid.
+        """
+        with open(filename, "r") as fh:
+            entries = json.load(fh)
+        settings = []
+        for entry in entries:
+            if isinstance(entry, dict):
+                entry = [entry.get("cntxt", ""), entry["inst_name"], entry["field_name"],
+                    entry["value"]]
+            if len(entry) != 4:
+                raise Exception("Invalid setting in " + filename + ": " + str(entry))
+            settings.append(entry)
+        return cls.set_bulk(settings)
+
     @classmethod
     def exists(cls, cntxt, inst_name, field_name, spell_chk=False):
         """
@@ -284,50 +427,85 @@ class UVMConfigDb(UVMResourceDb):
         found_val = UVMResourceDb.get_by_name(inst_name,field_name,spell_chk)
         return found_val is not None
 
-    #  // Function: wait_modified
-    #  //
-    #  // Wait for a configuration setting to be set for ~field_name~
-    #  // in ~cntxt~ and ~inst_name~. The task blocks until a new configuration
-    #  // setting is applied that effects the specified field.
-    #
-    #  static task wait_modified(UVMComponent cntxt, string inst_name,
-    #      string field_name);
-    #    process p = process::self();
-    #    string rstate = p.get_randstate();
-    #    m_uvm_waiter waiter;
-    #    uvm_coreservice_t cs = uvm_coreservice_t::get();
-    #
-    #    if(cntxt == null)
-    #      cntxt = cs.get_root();
-    #    if(cntxt != cs.get_root()) begin
-    #      if(inst_name != "")
-    #        inst_name = {cntxt.get_full_name(),".",inst_name};
-    #      else
-    #        inst_name = cntxt.get_full_name();
-    #    end
-    #
-    #    waiter = new(inst_name, field_name);
-    #
-    #    if(!m_waiters.exists(field_name))
-    #      m_waiters[field_name] = new;
-    #    m_waiters[field_name].push_back(waiter);
-    #
-    #    p.set_randstate(rstate);
-    #
-    #    // wait on the waiter to trigger
-    #    @waiter.trigger;
-    #
-    #    // Remove the waiter from the waiter list
-    #    for(int i=0; i<m_waiters[field_name].size(); ++i) begin
-    #      if(m_waiters[field_name].get(i) == waiter) begin
-    #        m_waiters[field_name].delete(i);
-    #        break;
-    #      end
-    #    end
-    #  endtask
-    #
-    #
-    #endclass
+    @classmethod
+    async def wait_modified(cls, cntxt, inst_name, field_name):
+        """
+        Wait for a configuration setting to be set for `field_name`
+        in `cntxt` and `inst_name`. The task blocks until a new configuration
+        setting is applied that effects the specified field.
+
+        Args:
+            cntxt (UVMComponent): Context of the wait.
+            inst_name (str): Instance name relative to `cntxt`.
+            field_name (str): Field to wait for.
+        """
+        from .uvm_coreservice import UVMCoreService
+        cs = UVMCoreService.get()
+
+        if cntxt is None:
+            cntxt = cs.get_root()
+        if cntxt != cs.get_root():
+            if inst_name != "":
+                inst_name = cntxt.get_full_name() + "." + inst_name
+            else:
+                inst_name = cntxt.get_full_name()
+
+        waiter = UVMConfigDb.m_add_waiter(inst_name, field_name)
+
+        # wait on the waiter to trigger
+        await waiter.trigger.wait()
+
+        # Remove the waiter from the waiter list
+        UVMConfigDb.m_remove_waiter(waiter)
+
+    @classmethod
+    def m_add_waiter(cls, inst_name, field_name):
+        waiter = m_uvm_waiter(inst_name, field_name)
+        if field_name not in UVMConfigDb.m_waiters:
+            UVMConfigDb.m_waiters[field_name] = {}
+        by_inst = UVMConfigDb.m_waiters[field_name]
+        if inst_name not in by_inst:
+            by_inst[inst_name] = []
+        by_inst[inst_name].append(waiter)
+        return waiter
+
+    @classmethod
+    def m_remove_waiter(cls, waiter):
+        by_inst = UVMConfigDb.m_waiters.get(waiter.field_name)
+        if by_inst is None or waiter.inst_name not in by_inst:
+            return
+        waiters = by_inst[waiter.inst_name]
+        if waiter in waiters:
+            waiters.remove(waiter)
+        if len(waiters) == 0:
+            del by_inst[waiter.inst_name]
+            if len(by_inst) == 0:
+                del UVMConfigDb.m_waiters[waiter.field_name]
+
+    @classmethod
+    def m_trigger_waiters(cls, inst_name, by_inst):
+        """
+        Triggers the waiters whose instance name is matched by the set
+        `inst_name`. The glob is converted once per set, and literal
+        globs are matched as substrings without regexes. Each waiter
+        instance name is checked only once.
+
+        Args:
+            inst_name (str): Glob or regex given to `set`.
+            by_inst (dict): Waiters of a field bucketed by instance name.
+        """
+        (_, lit, rex) = m_compile_scope(inst_name)
+        if lit == "":
+            names = list(by_inst)
+        elif lit is not None:
+            names = [name for name in by_inst if lit in name]
+        else:
+            names = [name for name in by_inst if rex.search(name) is not None]
+        for name in names:
+            for w in by_inst[name]:
+                w.trigger.set()
+
+#endclass
 
 #// Section: Types
 #
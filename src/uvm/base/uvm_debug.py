@@ -20,6 +20,7 @@
 
 import inspect
 from inspect import getframeinfo, stack
+import os
 import re
 
 
@@ -46,10 +47,26 @@ class UVMDebug:
         UVMDebug.DEBUG = False
 
 
-def uvm_debug(self_or_cls, fname, msg):
+def uvm_debug(self_or_cls, fname, msg, *args):
     """ Prints similar info as uvm_info etc functions, but is controlled by
-    UVMDebug.ENABLED. It is not advised to use this in user code """
+    UVMDebug.DEBUG. It is not advised to use this in user code.
+
+    The message is built only if debugging is enabled. It can be a string,
+    a %-format string followed by its args, or a callable returning the
+    string::
+
+        uvm_debug(self, 'get', 'rq size is %d', len(rq))
+        uvm_debug(self, 'm_raise', lambda: obj.get_name() + " raised")
+
+    If the environment variable UVM_STRIP_DEBUG is set to non-zero when uvm
+    is imported, this function is replaced with a no-op, and UVMDebug.DEBUG
+    has no effect.
+    """
     if UVMDebug.DEBUG is True:
+        if len(args) > 0:
+            msg = msg % args
+        elif callable(msg):
+            msg = msg()
         sup_caller = getframeinfo(stack()[1][0])
         filename = sup_caller.filename
         lineno = sup_caller.lineno
@@ -69,5 +86,11 @@ def uvm_debug(self_or_cls, fname, msg):
             print("[DEBUG] {} L{} {} - {}() - {}".format(
                 filename, str(lineno), name, fname, msg) + caller)
         else:
-            if re.search(UVMDebug.ONLY, name):
+            if re.search(UVMDebug.ONLY, str(name)):
                 print("[DEBUG] {} - {}() - {}".format(name, fname, msg) + caller)
+
+
+if os.environ.get("UVM_STRIP_DEBUG", "0") not in ("", "0"):
+    def uvm_debug(self_or_cls, fname, msg, *args):  # noqa: F811
+        """ No-op, debug messages are stripped by UVM_STRIP_DEBUG """
+        pass
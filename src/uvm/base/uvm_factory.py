@@ -25,9 +25,10 @@
 
 # pytype: disable=attribute-error,not-writable
 
+import re
 from typing import List, Optional
 
-from .sv import sv
+from .sv import sv, uvm_glob_to_re
 from .uvm_queue import UVMQueue
 from .uvm_pool import UVMPool
 from .uvm_globals import (uvm_report_error, uvm_report_fatal, uvm_report_warning,
@@ -50,6 +51,58 @@ class uvm_factory_queue_class:
     def __init__(self):
         self.queue = UVMQueue()
 
+#------------------------------------------------------------------------------
+#
+# CLASS- UVMInstOverrideMatcher
+#
+# Internal class. Not part of SV UVM. Compiled matcher over the
+# full_inst_path globs of a queue of instance overrides. All paths are
+# combined into a single regular expression with one alternative per
+# override, tried in registration order, so that a lookup returns the same
+# override as matching each entry with uvm_is_match in turn.
+#------------------------------------------------------------------------------
+
+class UVMInstOverrideMatcher:
+
+    def __init__(self, overrides):
+        self.overrides = list(overrides)
+        self.m_rex = None
+        self.m_searches = None
+        alts = []
+        for i, override in enumerate(self.overrides):
+            path = override.full_inst_path
+            if len(path) > 1 and path[0] == "/" and path[-1] == "/":
+                # Raw regexes may use numbered groups, keep them separate
+                alts = None
+                break
+            # Lazy prefix gives the unanchored re.search semantics of
+            # uvm_is_match while keeping the alternatives ordered
+            alts.append("(?P<o{}>[\\s\\S]*?(?:{}))".format(i, uvm_glob_to_re(path)))
+        if alts is None:
+            self.m_searches = [re.compile(uvm_glob_to_re(o.full_inst_path)).search
+                for o in self.overrides]
+        elif len(alts) > 0:
+            self.m_rex = re.compile("|".join(alts))
+        else:
+            self.m_searches = []
+
+    def first(self, full_inst_path):
+        """
+        Args:
+            full_inst_path (str): Full instance path to match.
+        Returns:
+            UVMFactoryOverride: First matching override, or None.
+        """
+        if self.m_rex is not None:
+            m = self.m_rex.match(full_inst_path)
+            if m is None:
+                return None
+            return self.overrides[int(m.lastgroup[1:])]
+        for i, search in enumerate(self.m_searches):
+            if search(full_inst_path) is not None:
+                return self.overrides[i]
+        return None
+
 #------------------------------------------------------------------------------
 #
 # CLASS- UVMFactoryOverride
@@ -158,7 +211,21 @@ class UVMDefaultFactory(UVMFactory):
         self.m_inst_override_queues = {}  # [uvm_object_wrapper] -> queue
         self.m_inst_override_name_queues = {}  # [string] -> queue
         self.m_wildcard_inst_overrides = UVMQueue()
-
+        # Not part of SV UVM. Resolved overrides of create_* calls, keyed by
+        # (requested type, requested type name, full_inst_path). Each entry
+        # holds the result and the overrides used to reach it, so that the
+        # used-counters can be replayed on a hit. Any change to the override
+        # tables bumps m_override_gen, which invalidates the cache.
+        self.m_override_cache = {}
+        self.m_override_cache_gen = 0
+        self.m_override_gen = 0
+        # Not part of SV UVM. Compiled inst override matchers, see
+        # m_get_inst_matcher. Invalidated together with m_override_cache.
+        self.m_inst_matchers = {}
+        self.m_inst_matchers_gen = 0
+
+    # Max number of entries in the resolved-override cache
+    max_override_cache = 4096
 
     def register(self, obj) -> None:
         """
@@ -188,6 +255,7 @@ class UVMDefaultFactory(UVMFactory):
                                  + "' already registered with factory. "), UVM_NONE)
         else:
             self.m_types.add(obj, 1)
+            self.m_override_gen += 1
             # If a named override happens before the type is registered, need to copy
             # the override queue.
             # Note:Registration occurs via static initialization, which occurs ahead of
@@ -220,6 +288,7 @@ class UVMDefaultFactory(UVMFactory):
             replace:
         """
         replaced = False
+        self.m_override_gen += 1
 
         # check that old and new are not the same
         if original_type == override_type:
@@ -290,6 +359,7 @@ class UVMDefaultFactory(UVMFactory):
         replaced = False
         original_type = None
         override_type = None
+        self.m_override_gen += 1
 
         if self.m_type_names.exists(original_type_name):
             original_type = self.m_type_names.get(original_type_name)
@@ -404,6 +474,7 @@ class UVMDefaultFactory(UVMFactory):
         if self.check_inst_override_exists(original_type,override_type,full_inst_path):
             return
 
+        self.m_override_gen += 1
         if original_type not in self.m_inst_override_queues:
             self.m_inst_override_queues[original_type] = UVMQueue()
 
@@ -416,64 +487,59 @@ class UVMDefaultFactory(UVMFactory):
         self.m_inst_override_queues[original_type].push_back(override)
 
 
-    # set_inst_override_by_name
-    # -------------------------
-    # TODO
-    #function void uvm_default_factory::set_inst_override_by_name (
-    # string original_type_name,
-    #                                                      string override_type_name,
-    #                                                      string full_inst_path)
-    #
-    #  uvm_factory_override override
-    #  uvm_object_wrapper original_type
-    #  uvm_object_wrapper override_type
-    #
-    #  if(self.m_type_names.exists(original_type_name))
-    #    original_type = self.m_type_names[original_type_name]
-    #
-    #  if(self.m_type_names.exists(override_type_name))
-    #    override_type = self.m_type_names[override_type_name]
-    #
-    #  // check that type is registered with the factory
-    #  if (override_type  is None):
-    #    uvm_report_error("TYPNTF", {"Cannot register instance override with type name '",
-    #    original_type_name,"' and instance path '",full_inst_path,"' because the type it's supposed ",
-    #    "to produce, '",override_type_name,"', is not registered with the factory."}, UVM_NONE)
-    #    return
-    #  end
-    #
-    #  if (original_type  is None)
-    #      m_lookup_strs[original_type_name] = 1
-    #
-    #  override = new(.full_inst_path(full_inst_path),
-    #                 .orig_type(original_type),
-    #                 .orig_type_name(original_type_name),
-    #                 .ovrd_type(override_type))
-    #
-    #  if(original_type != null):
-    #    if (check_inst_override_exists(original_type,override_type,full_inst_path))
-    #      return
-    #    if(!m_inst_override_queues.exists(original_type))
-    #      m_inst_override_queues[original_type] = new
-    #    m_inst_override_queues[original_type].queue.push_back(override)
-    #  end
-    #  else:
-    #    if(m_has_wildcard(original_type_name)):
-    #       foreach(self.m_type_names[i]):
-    #         if(uvm_is_match(original_type_name,i)):
-    #           this.set_inst_override_by_name(i, override_type_name, full_inst_path)
-    #         end
-    #       end
-    #       m_wildcard_inst_overrides.push_back(override)
-    #    end
-    #    else:
-    #      if(!self.m_inst_override_name_queues.exists(original_type_name))
-    #        self.m_inst_override_name_queues[original_type_name] = new
-    #      self.m_inst_override_name_queues[original_type_name].queue.push_back(override)
-    #    end
-    #  end
-    #
-    #endfunction
+    def set_inst_override_by_name(self, original_type_name, override_type_name,
+            full_inst_path):
+        """
+        set_inst_override_by_name
+        -------------------------
+        Args:
+            original_type_name (str):
+            override_type_name (str):
+            full_inst_path (str):
+        """
+        original_type = None
+        override_type = None
+
+        if self.m_type_names.exists(original_type_name):
+            original_type = self.m_type_names.get(original_type_name)
+
+        if self.m_type_names.exists(override_type_name):
+            override_type = self.m_type_names.get(override_type_name)
+
+        # check that type is registered with the factory
+        if override_type is None:
+            uvm_report_error("TYPNTF", ("Cannot register instance override with type name '"
+                + original_type_name + "' and instance path '" + full_inst_path
+                + "' because the type it's supposed to produce, '" + override_type_name
+                + "', is not registered with the factory."), UVM_NONE)
+            return
+
+        if original_type is None:
+            self.m_lookup_strs[original_type_name] = 1
+
+        override = UVMFactoryOverride(full_inst_path=full_inst_path,
+                orig_type=original_type,
+                orig_type_name=original_type_name,
+                ovrd_type=override_type)
+
+        self.m_override_gen += 1
+        if original_type is not None:
+            if self.check_inst_override_exists(original_type, override_type, full_inst_path):
+                return
+            if original_type not in self.m_inst_override_queues:
+                self.m_inst_override_queues[original_type] = UVMQueue()
+            self.m_inst_override_queues[original_type].push_back(override)
+        else:
+            if m_has_wildcard(original_type_name):
+                for type_name in list(self.m_type_names.keys()):
+                    if uvm_is_match(original_type_name, type_name):
+                        self.set_inst_override_by_name(type_name, override_type_name,
+                            full_inst_path)
+                self.m_wildcard_inst_overrides.push_back(override)
+            else:
+                if original_type_name not in self.m_inst_override_name_queues:
+                    self.m_inst_override_name_queues[original_type_name] = UVMQueue()
+                self.m_inst_override_name_queues[original_type_name].push_back(override)
 
     def create_object_by_name(self, requested_type_name, parent_inst_path="",
               name=""):
@@ -489,7 +555,7 @@ class UVMDefaultFactory(UVMFactory):
         inst_path = self._get_inst_path(parent_inst_path, name)
 
         self.m_override_info.clear()
-        wrapper = self.find_override_by_name(requested_type_name, inst_path)
+        wrapper = self.m_find_override_cached(None, requested_type_name, inst_path)
 
         # if no override exists, try to use requested_type_name directly
         if wrapper is None:
@@ -516,7 +582,7 @@ class UVMDefaultFactory(UVMFactory):
         full_inst_path = self._get_inst_path(parent_inst_path, name)
 
         self.m_override_info.clear()
-        requested_type = self.find_override_by_type(requested_type, full_inst_path)
+        requested_type = self.m_find_override_cached(requested_type, "", full_inst_path)
         if requested_type is None:
             uvm_report_fatal("REQ_TYPE_NONE", "Requested type object was None after override")
         return requested_type.create_object(name)
@@ -547,7 +613,7 @@ class UVMDefaultFactory(UVMFactory):
         inst_path = self._get_inst_path(parent_inst_path, name)
 
         self.m_override_info.clear()
-        wrapper = self.find_override_by_name(requested_type_name, inst_path)
+        wrapper = self.m_find_override_cached(None, requested_type_name, inst_path)
 
         # if no override exists, try to use requested_type_name directly
         if wrapper is None:
@@ -575,7 +641,7 @@ class UVMDefaultFactory(UVMFactory):
         full_inst_path = self._get_inst_path(parent_inst_path, name)
 
         self.m_override_info.clear()
-        requested_type = self.find_override_by_type(requested_type, full_inst_path)
+        requested_type = self.m_find_override_cached(requested_type, "", full_inst_path)
         return requested_type.create_component(name, parent)
 
     # find_wrapper_by_name
@@ -614,7 +680,15 @@ class UVMDefaultFactory(UVMFactory):
                 if rtype in self.m_inst_override_queues:
                     qc = self.m_inst_override_queues[rtype]
 
-            if qc is not None:
+            if qc is not None and not UVMDefaultFactory.m_debug_pass:
+                override = self.m_get_inst_matcher(requested_type_name, qc).first(full_inst_path)
+                if override is not None:
+                    self.m_override_info.append(override)
+                    override.used += 1
+                    if override.ovrd_type.get_type_name() == requested_type_name:
+                        return override.ovrd_type
+                    return self.find_override_by_type(override.ovrd_type, full_inst_path)
+            elif qc is not None:
                 for index in range(0, qc.size()):
                     match_ok = uvm_is_match(qc[index].orig_type_name, requested_type_name)
                     if match_ok and uvm_is_match(qc[index].full_inst_path, full_inst_path):
@@ -633,6 +707,7 @@ class UVMDefaultFactory(UVMFactory):
 
         ovrd_ok = rtype not in self.m_inst_override_queues and self.m_wildcard_inst_overrides.size() > 0
         if rtype is not None and ovrd_ok:
+            self.m_override_gen += 1
             self.m_inst_override_queues[rtype] = UVMQueue()
             for i in range(0, self.m_wildcard_inst_overrides.size()):
                 if uvm_is_match(self.m_wildcard_inst_overrides.get(i).orig_type_name,
@@ -659,6 +734,79 @@ class UVMDefaultFactory(UVMFactory):
         # No override found
         return None
 
+    def m_find_override_cached(self, requested_type, requested_type_name,
+            full_inst_path):
+        """
+        Not part of SV UVM. Resolves the override for a create_* call, using
+        `find_override_by_type` if `requested_type` is given, otherwise
+        `find_override_by_name`. Results are cached until the override tables
+        change. On a hit, the `used` counters of the overrides in the chain
+        are incremented and `m_override_info` is filled exactly as
+        a full lookup would do. The debug pass never uses the cache.
+
+        Args:
+            requested_type (UVMObjectWrapper): Requested type or None.
+            requested_type_name (str): Requested type name if no type given.
+            full_inst_path (str): Full instance path of the created object.
+        Returns:
+            UVMObjectWrapper: Override wrapper (or None if by name and no override).
+        """
+        if UVMDefaultFactory.m_debug_pass:
+            if requested_type is not None:
+                return self.find_override_by_type(requested_type, full_inst_path)
+            return self.find_override_by_name(requested_type_name, full_inst_path)
+
+        if self.m_override_cache_gen != self.m_override_gen:
+            self.m_override_cache = {}
+            self.m_override_cache_gen = self.m_override_gen
+        key = (requested_type, requested_type_name, full_inst_path)
+        entry = self.m_override_cache.get(key)
+        if entry is not None:
+            (result, chain) = entry
+            for override in chain:
+                override.used += 1
+            self.m_override_info.extend(chain)
+            return result
+
+        gen = self.m_override_gen
+        if requested_type is not None:
+            result = self.find_override_by_type(requested_type, full_inst_path)
+        else:
+            result = self.find_override_by_name(requested_type_name, full_inst_path)
+        if gen == self.m_override_gen:
+            if len(self.m_override_cache) >= self.max_override_cache:
+                self.m_override_cache = {}
+            self.m_override_cache[key] = (result, list(self.m_override_info))
+        return result
+
+    def m_get_inst_matcher(self, requested, qc) -> UVMInstOverrideMatcher:
+        """
+        Not part of SV UVM. Returns the compiled matcher over the instance
+        overrides in `qc` which apply to `requested`. The matchers are built
+        once after each change to the override tables.
+
+        Args:
+            requested: Requested type (UVMObjectWrapper) or type name (str).
+            qc (UVMQueue): Queue of instance overrides.
+        Returns:
+            UVMInstOverrideMatcher: Matcher returning the first override in
+            registration order.
+        """
+        if self.m_inst_matchers_gen != self.m_override_gen:
+            self.m_inst_matchers = {}
+            self.m_inst_matchers_gen = self.m_override_gen
+        matcher = self.m_inst_matchers.get(requested)
+        if matcher is None:
+            if isinstance(requested, str):
+                overrides = [qc[i] for i in range(qc.size())
+                    if uvm_is_match(qc[i].orig_type_name, requested)]
+            else:
+                overrides = [qc[i] for i in range(qc.size())
+                    if self.args_are_ok_again(qc[i], requested)]
+            matcher = UVMInstOverrideMatcher(overrides)
+            self.m_inst_matchers[requested] = matcher
+        return matcher
+
     def find_override_by_type(self, requested_type, full_inst_path):
         """
         find_override_by_type
@@ -677,6 +825,8 @@ class UVMDefaultFactory(UVMFactory):
         for index in range(0, len(self.m_override_info)):
             if self.m_override_info[index].orig_type == requested_type:
                 uvm_report_error("OVRDLOOP", "Recursive loop detected while finding override.", UVM_NONE)
+                # Never cache a result reached through a loop
+                self.m_override_gen += 1
                 if UVMDefaultFactory.m_debug_pass is False:
                     self.debug_create_by_type(requested_type, full_inst_path)
 
@@ -684,7 +834,15 @@ class UVMDefaultFactory(UVMFactory):
                 return requested_type
 
         # inst override; return first match; takes precedence over type overrides
-        if full_inst_path != "" and qc is not None:
+        if full_inst_path != "" and qc is not None and not UVMDefaultFactory.m_debug_pass:
+            inst_override = self.m_get_inst_matcher(requested_type, qc).first(full_inst_path)
+            if inst_override is not None:
+                self.m_override_info.append(inst_override)
+                inst_override.used += 1
+                if inst_override.ovrd_type == requested_type:
+                    return requested_type
+                return self.find_override_by_type(inst_override.ovrd_type, full_inst_path)
+        elif full_inst_path != "" and qc is not None:
             for index in range(0, qc.size()):
                 if self.are_args_ok(qc[index], requested_type, full_inst_path):
                     self.m_override_info.append(qc[index])
@@ -33,7 +33,8 @@ from .uvm_object_globals import (UVM_CALL_HOOK, UVM_COUNT, UVM_DISPLAY, UVM_ERRO
                                  UVM_FATAL, UVM_INFO, UVM_LOG, UVM_LOW, UVM_MEDIUM, UVM_NONE,
                                  UVM_NO_ACTION, UVM_RM_RECORD, UVM_STOP, UVM_WARNING)
 from .sv import uvm_glob_to_re, uvm_re_match
-from inspect import getframeinfo, stack
+from inspect import getsourcefile
+import sys
 
 # from .uvm_scheduler import uvm_default_scheduler
 # Title: Globals
@@ -114,18 +115,85 @@ def uvm_report_enabled(verbosity, severity=UVM_INFO, id=""):
 #endfunction
 
 
+#// Group: Caller location
+#//
+#// The reporting macros and the global uvm_report_* functions need the
+#// file/line of their caller. inspect.stack() reads the source context of
+#// every frame on the stack, so only the immediate caller frame is read here,
+#// and the (code object, line) to (filename, line) mapping is cached.
+
+_uvm_report_file_line = True
+_uvm_location_cache = {}
+
+
+def uvm_set_report_file_line(enable):
+    """
+    Enables/disables file/line capture for reports. When disabled, messages
+    are issued with an empty filename and line 0, and no frame lookup is done
+    at all. Equivalent to UVM_REPORT_DISABLE_FILE_LINE in SV.
+
+    Args:
+        enable (bool): True to capture file and line, False to skip it.
+    """
+    global _uvm_report_file_line
+    _uvm_report_file_line = enable
+
+
+def uvm_get_report_file_line():
+    """
+    Returns:
+        bool: True if file/line capture for reports is enabled.
+    """
+    return _uvm_report_file_line
+
+
+def uvm_frame_location(frame):
+    """
+    Returns the (filename, line) of the given frame. Filenames are resolved
+    identically to inspect.getframeinfo(), but only once per call site.
+
+    Args:
+        frame: Python frame object
+    Returns:
+        tuple: (filename, line), or ("", 0) if file/line capture is disabled.
+    """
+    if not _uvm_report_file_line:
+        return ("", 0)
+    key = (frame.f_code, frame.f_lineno)
+    loc = _uvm_location_cache.get(key)
+    if loc is None:
+        code = frame.f_code
+        loc = (getsourcefile(code) or code.co_filename, frame.f_lineno)
+        _uvm_location_cache[key] = loc
+    return loc
+
+
+def uvm_caller_location(depth=1):
+    """
+    Returns the (filename, line) of the caller of the function calling this
+    function. Increase depth to skip additional wrapper functions.
+
+    Args:
+        depth (int): Number of frames to skip above the calling function.
+    Returns:
+        tuple: (filename, line), or ("", 0) if file/line capture is disabled.
+    """
+    if not _uvm_report_file_line:
+        return ("", 0)
+    return uvm_frame_location(sys._getframe(depth + 1))
+
+
 def uvm_report_info(id, message, verbosity=UVM_MEDIUM, filename="", line=0,
         context_name="", report_enabled_checked=False):
     if uvm_report_enabled(verbosity, UVM_INFO, id):
         cs = get_cs()
         top = cs.get_root()
-        # tpoikela: Do not refactor
-        if filename == "":
-            caller = getframeinfo(stack()[1][0])
-            filename = caller.filename
-        if line == 0:
-            caller = getframeinfo(stack()[1][0])
-            line = caller.lineno
+        if filename == "" or line == 0:
+            fname, lineno = uvm_caller_location()
+            if filename == "":
+                filename = fname
+            if line == 0:
+                line = lineno
         top.uvm_report_info(id, message, verbosity, filename, line, context_name,
                 report_enabled_checked)
 
@@ -135,13 +203,12 @@ def uvm_report_error(id, message, verbosity=UVM_LOW, filename="", line=0,
     if uvm_report_enabled(verbosity, UVM_ERROR, id):
         cs = get_cs()
         top = cs.get_root()
-        # tpoikela: Do not refactor
-        if filename == "":
-            caller = getframeinfo(stack()[1][0])
-            filename = caller.filename
-        if line == 0:
-            caller = getframeinfo(stack()[1][0])
-            line = caller.lineno
+        if filename == "" or line == 0:
+            fname, lineno = uvm_caller_location()
+            if filename == "":
+                filename = fname
+            if line == 0:
+                line = lineno
         top.uvm_report_error(id, message, verbosity, filename, line, context_name,
                 report_enabled_checked)
 
@@ -151,13 +218,12 @@ def uvm_report_warning(id, message, verbosity=UVM_LOW, filename="", line=0,
     if uvm_report_enabled(verbosity, UVM_WARNING, id):
         cs = get_cs()
         top = cs.get_root()
-        # tpoikela: Do not refactor
-        if filename == "":
-            caller = getframeinfo(stack()[1][0])
-            filename = caller.filename
-        if line == 0:
-            caller = getframeinfo(stack()[1][0])
-            line = caller.lineno
+        if filename == "" or line == 0:
+            fname, lineno = uvm_caller_location()
+            if filename == "":
+                filename = fname
+            if line == 0:
+                line = lineno
         top.uvm_report_warning(id, message, verbosity, filename, line, context_name,
                 report_enabled_checked)
 
@@ -178,13 +244,12 @@ def uvm_report_fatal(id, message, verbosity=UVM_NONE, filename="", line=0,
     if uvm_report_enabled(verbosity, UVM_FATAL, id):
         cs = get_cs()
         top = cs.get_root()
-        # tpoikela: Do not refactor
-        if filename == "":
-            caller = getframeinfo(stack()[1][0])
-            filename = caller.filename
-        if line == 0:
-            caller = getframeinfo(stack()[1][0])
-            line = caller.lineno
+        if filename == "" or line == 0:
+            fname, lineno = uvm_caller_location()
+            if filename == "":
+                filename = fname
+            if line == 0:
+                line = lineno
         top.uvm_report_fatal(id, message, verbosity, filename, line, context_name,
                 report_enabled_checked)
 
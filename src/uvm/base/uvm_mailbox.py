@@ -26,9 +26,9 @@ from .uvm_debug import UVMDebug, uvm_debug
 from typing import List, Any
 
 
-def _uvm_debug(self, func, msg):
+def _uvm_debug(self, func, msg, *args):
     if self.debug_enabled or UVMDebug.DEBUG:
-        uvm_debug(self, func, msg)
+        uvm_debug(self, func, msg, *args)
 
 OutputItem = List[Any]
 
@@ -56,7 +56,7 @@ class UVMMailbox():
             can_put = self.can_put()
         _uvm_debug(self, 'put', 'Putting an event into item queue')
         self.m_queue.push_back(item)
-        _uvm_debug(self, 'put', 'ZZZ pushed to queue, can_get is ' + str(self.can_get()))
+        _uvm_debug(self, 'put', lambda: 'ZZZ pushed to queue, can_get is ' + str(self.can_get()))
         self.m_write_event.set()
         _uvm_debug(self, 'put', 'Finished')
 
@@ -68,7 +68,7 @@ class UVMMailbox():
             self.m_write_event.clear()
             await self.m_write_event.wait()
             self.m_write_event.clear()
-            _uvm_debug(self, 'get', 'event cleared, can_get ' + str(self.can_get()))
+            _uvm_debug(self, 'get', lambda: 'event cleared, can_get ' + str(self.can_get()))
             can_get = self.can_get()
 
         _uvm_debug(self, 'get', 'wait write event DONE')
@@ -88,7 +88,7 @@ class UVMMailbox():
             self.m_write_event.clear()
             await self.m_write_event.wait()
             self.m_write_event.clear()
-            _uvm_debug(self, 'get', 'event cleared, can_get ' + str(self.can_get()))
+            _uvm_debug(self, 'get', lambda: 'event cleared, can_get ' + str(self.can_get()))
         item = self.m_queue.front()
         itemq.append(item)
 
@@ -97,7 +97,7 @@ class UVMMailbox():
         if self.can_put() is True:
             _uvm_debug(self, 'try_put', 'can_put is True')
             self.m_queue.push_back(item)
-            _uvm_debug(self, 'try_put', 'pushed to queue, can_get is ' + str(self.can_get()))
+            _uvm_debug(self, 'try_put', lambda: 'pushed to queue, can_get is ' + str(self.can_get()))
             self.m_write_event.set()
             _uvm_debug(self, 'try_put', 'try_put finishing OK')
             return True
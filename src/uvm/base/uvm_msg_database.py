@@ -0,0 +1,655 @@
+#//
+#//------------------------------------------------------------------------------
+#//   Copyright 2020 Tuomas Poikela (tpoikela)
+#//   All Rights Reserved Worldwide
+#//
+#//   Licensed under the Apache License, Version 2.0 (the
+#//   "License"); you may not use this file except in
+#//   compliance with the License.  You may obtain a copy of
+#//   the License at
+#//
+#//       http://www.apache.org/licenses/LICENSE-2.0
+#//
+#//   Unless required by applicable law or agreed to in
+#//   writing, software distributed under the License is
+#//   distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+#//   CONDITIONS OF ANY KIND, either express or implied.  See
+#//   the License for the specific language governing
+#//   permissions and limitations under the License.
+#//------------------------------------------------------------------------------
+"""
+Title: Binary Message Database
+
+Not part of SV UVM. `UVMMsgDatabase` is a `UVMTrDatabase` for recording
+`UVMReportMessage` objects into a compact, indexed binary log, instead of
+re-parsing text logs afterwards::
+
+    db = UVMMsgDatabase("msg_db")
+    db.set_file_name("sim_msgs.umdb")
+    srv = UVMReportServer.get_server()
+    srv.set_message_database(db)
+    srv.record_all_messages = True  # Or use UVM_RM_RECORD action per id
+
+The log can be queried with `UVMMsgLog` or the `bin/uvm_msg_query.py` command.
+
+Data file layout (little-endian). After the header, the file is a sequence
+of chunks, each starting with a tag byte:
+
+- TAG_STR: u32 index, u32 length, utf-8 bytes. Defines an interned string
+  (ids, report object names, contexts, filenames, element names).
+- TAG_MSG: f64 time (NS), u8 severity, i32 verbosity, u32 line, and u32
+  string indices of id, report object, context and filename. Then u32
+  length + utf-8 message, u32 number of elements, and per element:
+  u32 name index, u8 kind, value (i64 for ELEM_INT, u32 length + signed
+  two's complement bytes for ELEM_BIGINT, u32 length + utf-8 otherwise).
+
+The index file (data file name + ".idx") contains the string table, and
+offset, time, severity and id columns of all records, plus per-id and
+per-severity posting lists. It is written when the database is flushed or
+closed. Records appended after the index was written are found by scanning
+only the tail of the data file.
+"""
+
+import array
+import atexit
+import os
+import struct
+import sys
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional
+
+from ..dap.uvm_simple_lock_dap import uvm_simple_lock_dap
+from ..macros.uvm_object_defines import uvm_object_utils
+from ..macros.uvm_message_defines import uvm_warning
+from .uvm_object_globals import UVM_INFO, UVM_SEVERITY_NAMES
+from .uvm_globals import uvm_sim_time, uvm_string_to_severity
+from .uvm_recorder import UVMRecorder
+from .uvm_tr_database import UVMTrDatabase
+from .uvm_tr_stream import UVMTrStream
+
+DATA_MAGIC = b"UVMMSGDB"
+INDEX_MAGIC = b"UVMMSGIX"
+DB_VERSION = 1
+
+TAG_STR = 1
+TAG_MSG = 2
+
+ELEM_INT = 0
+ELEM_STR = 1
+ELEM_BIGINT = 2  # Int which does not fit into i64
+
+_HEADER = struct.Struct("<8sH")
+_U8 = struct.Struct("<B")
+_U32 = struct.Struct("<I")
+_STR_HDR = struct.Struct("<II")
+_MSG_HDR = struct.Struct("<dBiIIIII")
+_ELEM_HDR = struct.Struct("<IB")
+_I64 = struct.Struct("<q")
+_IDX_HDR = struct.Struct("<8sHQIB")
+_I64_MIN = -(1 << 63)
+_I64_MAX = (1 << 63) - 1
+
+# Fixed record fields, see UVMReportMessage.do_record
+_STR_FIELDS = ("severity", "id", "message", "filename", "context_name")
+_INT_FIELDS = ("severity", "verbosity", "line")
+
+
+def _write_array(f, arr) -> None:
+    f.write(_U32.pack(len(arr)))
+    if sys.byteorder == "big":
+        arr = array.array(arr.typecode, arr)
+        arr.byteswap()
+    f.write(arr.tobytes())
+
+
+def _read_array(f, typecode) -> array.array:
+    arr = array.array(typecode)
+    n = _U32.unpack(f.read(4))[0]
+    arr.frombytes(f.read(n * arr.itemsize))
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return arr
+
+
+def _pack_str(s: str) -> bytes:
+    b = s.encode("utf-8", "replace")
+    return _U32.pack(len(b)) + b
+
+
+def _pack_bigint(value: int) -> bytes:
+    b = value.to_bytes(value.bit_length() // 8 + 1, "little", signed=True)
+    return _U32.pack(len(b)) + b
+
+
+class UVMMsgIndex:
+    """
+    In-memory index of a message log: string table, per-record columns and
+    posting lists. Shared by the writer (`UVMMsgDatabase`) and the reader
+    (`UVMMsgLog`).
+    """
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self.str_idx: Dict[str, int] = {}
+        self.offsets = array.array("Q")
+        self.times = array.array("d")
+        self.severities = array.array("B")
+        self.ids = array.array("I")
+        self.by_id: Dict[int, array.array] = {}
+        self.by_severity: Dict[int, array.array] = {}
+        self.time_sorted = True
+        self.data_size = _HEADER.size  # Bytes of data file covered by index
+
+    def add_string(self, s: str) -> int:
+        idx = len(self.strings)
+        self.strings.append(s)
+        self.str_idx[s] = idx
+        return idx
+
+    def add_record(self, offset, time, severity, id_idx) -> None:
+        rec = len(self.offsets)
+        if rec > 0 and time < self.times[-1]:
+            self.time_sorted = False
+        self.offsets.append(offset)
+        self.times.append(time)
+        self.severities.append(severity)
+        self.ids.append(id_idx)
+        if id_idx not in self.by_id:
+            self.by_id[id_idx] = array.array("I")
+        self.by_id[id_idx].append(rec)
+        if severity not in self.by_severity:
+            self.by_severity[severity] = array.array("I")
+        self.by_severity[severity].append(rec)
+
+    def write(self, filename) -> None:
+        tmp_name = filename + ".tmp"
+        with open(tmp_name, "wb") as f:
+            f.write(_IDX_HDR.pack(INDEX_MAGIC, DB_VERSION, self.data_size,
+                len(self.strings), int(self.time_sorted)))
+            for s in self.strings:
+                f.write(_pack_str(s))
+            _write_array(f, self.offsets)
+            _write_array(f, self.times)
+            _write_array(f, self.severities)
+            _write_array(f, self.ids)
+            for postings in (self.by_id, self.by_severity):
+                f.write(_U32.pack(len(postings)))
+                for key in postings:
+                    f.write(_U32.pack(key))
+                    _write_array(f, postings[key])
+        os.replace(tmp_name, filename)
+
+    @classmethod
+    def read(cls, filename) -> Optional['UVMMsgIndex']:
+        """ Returns None if the index file is missing or has wrong format """
+        if not os.path.exists(filename):
+            return None
+        idx = UVMMsgIndex()
+        with open(filename, "rb") as f:
+            magic, version, data_size, n_str, time_sorted = _IDX_HDR.unpack(
+                f.read(_IDX_HDR.size))
+            if magic != INDEX_MAGIC or version != DB_VERSION:
+                return None
+            idx.data_size = data_size
+            idx.time_sorted = bool(time_sorted)
+            for _ in range(n_str):
+                n = _U32.unpack(f.read(4))[0]
+                idx.add_string(f.read(n).decode("utf-8"))
+            idx.offsets = _read_array(f, "Q")
+            idx.times = _read_array(f, "d")
+            idx.severities = _read_array(f, "B")
+            idx.ids = _read_array(f, "I")
+            for postings in (idx.by_id, idx.by_severity):
+                n_keys = _U32.unpack(f.read(4))[0]
+                for _ in range(n_keys):
+                    key = _U32.unpack(f.read(4))[0]
+                    postings[key] = _read_array(f, "I")
+        return idx
+
+
+class UVMMsgDatabase(UVMTrDatabase):
+    """
+    Records report messages into an indexed binary log file.
+
+    Each recorded message holds severity, id, verbosity, sim time (NS),
+    report object name, context, file/line, message text and the elements of
+    its `UVMReportMessageElementContainer`.
+    """
+
+    def __init__(self, name="unnamed-UVMMsgDatabase"):
+        UVMTrDatabase.__init__(self, name)
+        self.m_filename_dap = uvm_simple_lock_dap("filename_dap")
+        self.m_filename_dap.set("msg_db.umdb")
+        self.m_file = None
+        self.m_index: Optional[UVMMsgIndex] = None
+
+    def set_file_name(self, filename: str) -> None:
+        """
+        Sets the file name used for output. Can only be called prior to
+        `open_db`. The index is written into filename + ".idx".
+
+        Args:
+            filename (str): Name of the data file.
+        """
+        if filename == "":
+            uvm_warning("UVM/MSG_DB/EMPTY_NAME",
+                "Ignoring attempt to set file name to ''!")
+            return
+        if self.m_filename_dap.is_locked():
+            uvm_warning("UVM/MSG_DB/SET_AFTER_OPEN",
+                "Ignoring attempt to change file name after opening the db!")
+            return
+        self.m_filename_dap.set(filename)
+
+    def get_file_name(self) -> str:
+        return self.m_filename_dap.get()
+
+    def do_open_db(self) -> bool:
+        if self.m_file is None:
+            self.m_file = open(self.m_filename_dap.get(), "wb")
+            self.m_file.write(_HEADER.pack(DATA_MAGIC, DB_VERSION))
+            self.m_index = UVMMsgIndex()
+            self.m_filename_dap.lock()
+            atexit.register(self.close_db)
+        return True
+
+    def do_close_db(self) -> bool:
+        if self.m_file is not None:
+            self.flush()
+            self.m_file.close()
+            self.m_file = None
+            self.m_filename_dap.unlock()
+            atexit.unregister(self.close_db)
+        return True
+
+    def flush(self) -> None:
+        """
+        Flushes the data file and writes the index file, so that the log
+        can be queried while the simulation is running.
+        """
+        if self.m_file is not None:
+            self.m_file.flush()
+            self.m_index.data_size = self.m_file.tell()
+            self.m_index.write(self.m_filename_dap.get() + ".idx")
+
+    def do_open_stream(self, name, scope, type_name) -> 'UVMMsgStream':
+        return UVMMsgStream.type_id.create(name)
+
+    def do_establish_link(self, link) -> None:
+        # Links between messages are not recorded
+        pass
+
+    def m_intern(self, s: str) -> int:
+        idx = self.m_index.str_idx.get(s)
+        if idx is None:
+            idx = self.m_index.add_string(s)
+            b = s.encode("utf-8", "replace")
+            self.m_file.write(_U8.pack(TAG_STR) + _STR_HDR.pack(idx, len(b)) + b)
+        return idx
+
+    def m_write_message(self, rec: 'UVMMsgRecorder') -> None:
+        """
+        Appends the message collected by the recorder into the log.
+
+        Args:
+            rec (UVMMsgRecorder): Closed recorder
+        """
+        if self.m_file is None:
+            return
+        f = rec.m_fields
+        id_idx = self.m_intern(f.get("id", ""))
+        obj_idx = self.m_intern(rec.m_object_name)
+        ctxt_idx = self.m_intern(f.get("context_name", ""))
+        file_idx = self.m_intern(f.get("filename", ""))
+        elems = []
+        for (name, value) in rec.m_elements:
+            name_idx = self.m_intern(name)
+            if isinstance(value, int):
+                if _I64_MIN <= value <= _I64_MAX:
+                    elems.append(_ELEM_HDR.pack(name_idx, ELEM_INT))
+                    elems.append(_I64.pack(value))
+                else:
+                    elems.append(_ELEM_HDR.pack(name_idx, ELEM_BIGINT))
+                    elems.append(_pack_bigint(value))
+            else:
+                elems.append(_ELEM_HDR.pack(name_idx, ELEM_STR))
+                elems.append(_pack_str(value))
+
+        severity = f.get("severity", 0)
+        offset = self.m_file.tell()
+        self.m_file.write(b"".join([_U8.pack(TAG_MSG),
+            _MSG_HDR.pack(rec.m_time, severity, f.get("verbosity", 0),
+                f.get("line", 0), id_idx, obj_idx, ctxt_idx, file_idx),
+            _pack_str(f.get("message", "")), _U32.pack(len(rec.m_elements))]
+            + elems))
+        self.m_index.add_record(offset, rec.m_time, severity, id_idx)
+
+
+uvm_object_utils(UVMMsgDatabase)
+
+
+class UVMMsgStream(UVMTrStream):
+    """
+    Stream of `UVMMsgDatabase`. One stream is opened per report
+    object/handler pair by `UVMReportServer`. A freed recorder is reused
+    for the next message.
+    """
+
+    def __init__(self, name="unnamed-UVMMsgStream"):
+        UVMTrStream.__init__(self, name)
+        self.m_msg_db = None
+        self.m_spare_recorder = None
+
+    def do_open(self, db, scope, stream_type_name):
+        self.m_msg_db = db
+
+    def do_open_recorder(self, name, open_time, type_name):
+        if self.m_msg_db.open_db():
+            rec = self.m_spare_recorder
+            if rec is None:
+                return UVMMsgRecorder.type_id.create(name)
+            self.m_spare_recorder = None
+            rec.set_name(name)
+            return rec
+        return None
+
+    def m_free_recorder(self, recorder):
+        UVMTrStream.m_free_recorder(self, recorder)
+        self.m_spare_recorder = recorder
+
+
+uvm_object_utils(UVMMsgStream)
+
+
+class UVMMsgRecorder(UVMRecorder):
+    """
+    Recorder of `UVMMsgDatabase`. Collects the fields recorded by
+    `UVMReportMessage.do_record` and writes the message when closed. Fields
+    other than the fixed message fields are stored as message elements.
+    """
+
+    def __init__(self, name="unnamed-UVMMsgRecorder"):
+        UVMRecorder.__init__(self, name)
+        self.m_msg_db = None
+        self.m_fields = {}
+        self.m_elements = []
+        self.m_object_name = ""
+        self.m_time = 0.0
+
+    def do_open(self, stream, open_time, type_name):
+        self.m_msg_db = stream.get_db()
+        self.m_fields = {}
+        self.m_elements = []
+        self.m_object_name = stream.get_name()
+        self.m_time = float(uvm_sim_time('NS'))
+
+    def do_close(self, close_time):
+        if self.m_msg_db is not None:
+            self.m_msg_db.m_write_message(self)
+
+    def do_free(self):
+        self.m_msg_db = None
+        self.m_fields = {}
+        self.m_elements = []
+
+    def do_record_field(self, name, value, size, radix):
+        if name in _INT_FIELDS and self.recording_depth == 1:
+            self.m_fields[name] = int(value)
+        else:
+            self.m_elements.append((name, int(value)))
+
+    def do_record_field_int(self, name, value, size, radix):
+        self.do_record_field(name, value, size, radix)
+
+    def do_record_string(self, name, value):
+        if name in _STR_FIELDS and self.recording_depth == 1:
+            if name == "severity":
+                self.m_fields[name] = uvm_string_to_severity(value, UVM_INFO)
+            else:
+                self.m_fields[name] = value
+        else:
+            self.m_elements.append((name, value))
+
+    def do_record_object(self, name, value):
+        if value is None:
+            self.m_elements.append((name, "<null>"))
+        else:
+            self.m_elements.append((name, value.convert2string()))
+
+    def do_record_time(self, name, value):
+        self.m_elements.append((name, int(value)))
+
+    def do_record_generic(self, name, value, type_name):
+        self.m_elements.append((name, value))
+
+
+uvm_object_utils(UVMMsgRecorder)
+
+
+class UVMMsgLog:
+    """
+    Read-only access to a message log written by `UVMMsgDatabase`.
+
+    The index file is used if it exists. Records appended after the index
+    was written are indexed by scanning only the tail of the data file.
+
+    Args:
+        filename (str): Name of the data file.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.index_name = filename + ".idx"
+        self.m_file = open(filename, "rb")
+        magic, version = _HEADER.unpack(self.m_file.read(_HEADER.size))
+        if magic != DATA_MAGIC or version != DB_VERSION:
+            raise ValueError("Not a UVM message database: " + filename)
+        self.index = UVMMsgIndex.read(self.index_name)
+        self.m_index_stale = False
+        if self.index is None:
+            self.index = UVMMsgIndex()
+        self.m_scan_tail()
+
+    def close(self) -> None:
+        self.m_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self.index.offsets)
+
+    def reindex(self) -> None:
+        """ Writes the index file to cover the whole data file """
+        if self.m_index_stale:
+            self.index.write(self.index_name)
+            self.m_index_stale = False
+
+    def m_scan_tail(self) -> None:
+        """ Indexes records after the part of the data file covered by index """
+        f = self.m_file
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        offset = self.index.data_size
+        while offset < end:
+            f.seek(offset)
+            tag = f.read(1)
+            if len(tag) == 0:
+                break
+            if tag[0] == TAG_STR:
+                hdr = f.read(_STR_HDR.size)
+                if len(hdr) < _STR_HDR.size:
+                    break
+                (_, n) = _STR_HDR.unpack(hdr)
+                data = f.read(n)
+                if len(data) < n:
+                    break  # Truncated at the end of file
+                self.index.add_string(data.decode("utf-8"))
+            elif tag[0] == TAG_MSG:
+                rec = self.m_read_record_at(offset)
+                if rec is None:
+                    break
+                self.index.add_record(offset, rec[0], rec[1], rec[2])
+            else:
+                raise ValueError("Corrupted message database {} at offset {}".format(
+                    self.filename, offset))
+            offset = f.tell()
+            self.index.data_size = offset
+            self.m_index_stale = True
+
+    def m_read_record_at(self, offset):
+        """ Returns (time, severity, id, verbosity, line, obj, ctxt, file,
+        message, elements) with string indices, or None if truncated. """
+        f = self.m_file
+        f.seek(offset + 1)
+        hdr = f.read(_MSG_HDR.size)
+        if len(hdr) < _MSG_HDR.size:
+            return None
+        (time, sev, verb, line, id_idx, obj_idx, ctxt_idx, file_idx) = _MSG_HDR.unpack(hdr)
+        msg = self.m_read_str()
+        n_elems = self.m_read_u32()
+        if msg is None or n_elems is None:
+            return None
+        elems = []
+        for _ in range(n_elems):
+            ehdr = f.read(_ELEM_HDR.size)
+            if len(ehdr) < _ELEM_HDR.size:
+                return None
+            (name_idx, kind) = _ELEM_HDR.unpack(ehdr)
+            if kind == ELEM_INT:
+                data = f.read(_I64.size)
+                if len(data) < _I64.size:
+                    return None
+                value = _I64.unpack(data)[0]
+            elif kind == ELEM_BIGINT:
+                data = self.m_read_bytes()
+                if data is None:
+                    return None
+                value = int.from_bytes(data, "little", signed=True)
+            else:
+                value = self.m_read_str()
+                if value is None:
+                    return None
+            elems.append((name_idx, value))
+        return (time, sev, id_idx, verb, line, obj_idx, ctxt_idx, file_idx, msg, elems)
+
+    def m_read_u32(self):
+        data = self.m_file.read(4)
+        if len(data) < 4:
+            return None
+        return _U32.unpack(data)[0]
+
+    def m_read_bytes(self):
+        n = self.m_read_u32()
+        if n is None:
+            return None
+        data = self.m_file.read(n)
+        if len(data) < n:
+            return None
+        return data
+
+    def m_read_str(self):
+        data = self.m_read_bytes()
+        if data is None:
+            return None
+        return data.decode("utf-8")
+
+    def get_record(self, rec_num) -> dict:
+        """
+        Args:
+            rec_num (int): Record number, in recording order.
+        Returns:
+            dict: Message with keys time, severity, id, verbosity, line,
+            object, context, filename, message and elements.
+        """
+        r = self.m_read_record_at(self.index.offsets[rec_num])
+        strs = self.index.strings
+        return {
+            "time": r[0], "severity": r[1], "id": strs[r[2]], "verbosity": r[3],
+            "line": r[4], "object": strs[r[5]], "context": strs[r[6]],
+            "filename": strs[r[7]], "message": r[8],
+            "elements": [(strs[n], v) for (n, v) in r[9]],
+        }
+
+    def query(self, severity=None, id=None, t_min=None, t_max=None, limit=None):
+        """
+        Returns the record numbers of messages matching all given filters,
+        in recording order. Only the index is used, the data file is not read.
+
+        Args:
+            severity (int|str): Severity, e.g. UVM_ERROR or "UVM_ERROR".
+            id (str): Message ID.
+            t_min (float): Min sim time (NS), inclusive.
+            t_max (float): Max sim time (NS), inclusive.
+            limit (int): Max number of records to return.
+        Returns:
+            list[int]: Matching record numbers.
+        """
+        idx = self.index
+        if isinstance(severity, str):
+            severity = uvm_string_to_severity(severity, None)
+
+        lo, hi = 0, len(idx.offsets)
+        time_filter = t_min is not None or t_max is not None
+        if time_filter and idx.time_sorted:
+            if t_min is not None:
+                lo = bisect_left(idx.times, t_min)
+            if t_max is not None:
+                hi = bisect_right(idx.times, t_max)
+            time_filter = False
+
+        # Use the shortest posting list as candidates, and check the
+        # remaining filters from the index columns.
+        candidates = None
+        if id is not None:
+            id_idx = idx.str_idx.get(id)
+            if id_idx is None:
+                return []
+            candidates = idx.by_id.get(id_idx, [])
+        if severity is not None:
+            sev_list = idx.by_severity.get(severity, [])
+            if candidates is None or len(sev_list) < len(candidates):
+                candidates = sev_list
+        if candidates is None:
+            candidates = range(lo, hi)
+        else:
+            candidates = candidates[bisect_left(candidates, lo):bisect_left(candidates, hi)]
+
+        res = []
+        for rec in candidates:
+            if severity is not None and idx.severities[rec] != severity:
+                continue
+            if id is not None and idx.strings[idx.ids[rec]] != id:
+                continue
+            if time_filter:
+                t = idx.times[rec]
+                if (t_min is not None and t < t_min) or (t_max is not None and t > t_max):
+                    continue
+            res.append(rec)
+            if limit is not None and len(res) >= limit:
+                break
+        return res
+
+    @classmethod
+    def format_record(cls, rec: dict) -> str:
+        """
+        Formats a record like the default `UVMReportServer.compose_report_message`.
+        """
+        sev = rec["severity"]
+        sev_str = UVM_SEVERITY_NAMES[sev] if sev < len(UVM_SEVERITY_NAMES) else str(sev)
+        file_line = ""
+        if rec["filename"] != "":
+            file_line = "{}({}) ".format(rec["filename"], rec["line"])
+        context = ""
+        if rec["context"] != "":
+            context = "@@" + rec["context"]
+        time = rec["time"]
+        time_str = str(int(time)) if time == int(time) else str(time)
+        res = "{}{}@ {}NS: {}{} [{}] {}".format(sev_str, " " + file_line if file_line
+            else " ", time_str, rec["object"], context, rec["id"], rec["message"])
+        for (name, value) in rec["elements"]:
+            res += "\n +{}: {}".format(name, value)
+        return res
@@ -294,6 +294,23 @@ class UVMObject(sv_obj):
             tmp.copy(self)
         return tmp
 
+    def do_recycle(self, name: str) -> None:
+        """
+        Not part of SV UVM. Called by the factory when a recycled object,
+        see `UVMObjectRegistry.enable_recycling`, is handed out again instead of
+        constructing a new one. It must return the object to the state left
+        by its constructor, with the given `name`. Derived classes adding
+        their own state override this and call `super().do_recycle(name)`.
+
+        Args:
+            name (str): Name of the recycled object.
+        """
+        sv_obj.do_recycle(self)
+        self.name = name
+        self.leaf_name = name
+        self.inst_id = UVMObject.m_inst_count
+        UVMObject.m_inst_count += 1
+
     def print_obj(self, printer=None) -> None:
         """
         Group: Printing
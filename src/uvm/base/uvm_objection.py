@@ -377,7 +377,7 @@ class UVMObjection(UVMReportObject):
             obj = self.m_top
         self.m_cleared = 0
         self.m_top_all_dropped = 0
-        uvm_debug(self, 'raise_objection', obj.get_name() + " Starting to raise objection")
+        uvm_debug(self, 'raise_objection', lambda: obj.get_name() + " Starting to raise objection")
         self.m_raise(obj, obj, description, count)
 
     #  // Function- m_raise
@@ -439,7 +439,7 @@ class UVMObjection(UVMReportObject):
                 del self.m_forked_contexts[obj]
                 # Kill the drain
 
-        uvm_debug(self, 'm_raise', obj.get_name() + " ENDING FUNC")
+        uvm_debug(self, 'm_raise', lambda: obj.get_name() + " ENDING FUNC")
         # TODO
         #if UVM_USE_PROCESS_CONTAINER:
         #    self.m_drain_proc[obj].kill()
@@ -447,12 +447,12 @@ class UVMObjection(UVMReportObject):
         #else:
         #    self.m_drain_proc[obj].p.kill()
         #    del self.m_drain_proc[obj]
-        uvm_debug(self, 'm_raise', obj.get_name() + " NEVER GETS HERE")
+        uvm_debug(self, 'm_raise', lambda: obj.get_name() + " NEVER GETS HERE")
 
         if ctxt is None:
             # If there were no drains, just propagate as usual
             if not self.m_prop_mode and obj != self.m_top:
-                uvm_debug(self, 'm_raise', obj.get_name() + " XXX NEVER GETS HERE")
+                uvm_debug(self, 'm_raise', lambda: obj.get_name() + " XXX NEVER GETS HERE")
                 self.m_raise(self.m_top,source_obj,description,count)
             elif obj != self.m_top:
                 self.m_propagate(obj, source_obj, description, count, 1, 0)
@@ -551,7 +551,7 @@ class UVMObjection(UVMReportObject):
     def drop_objection(self, obj=None, description="", count=1):
         if obj is None:
             obj = self.m_top
-        uvm_debug(self, 'drop_objection', obj.get_name() + " Starting to drop objection")
+        uvm_debug(self, 'drop_objection', lambda: obj.get_name() + " Starting to drop objection")
         self.m_drop(obj, obj, description, count, 0)
 
     #  // Function- m_drop
@@ -966,7 +966,7 @@ class UVMObjection(UVMReportObject):
             return 0
         else:
             cnt = self.m_total_count[obj]
-            uvm_debug(self, 'get_objection_total', 'Returning cnt ' + str(cnt))
+            uvm_debug(self, 'get_objection_total', lambda: 'Returning cnt ' + str(cnt))
             return self.m_total_count[obj]
         #endfunction
 
@@ -54,7 +54,7 @@ from .uvm_objection import UVMObjection
 from .sv import sv
 
 def UVM_PH_TRACE(ID,MSG,PH,VERB):
-    uvm_info(ID, (sv.sformatf("Phase '%0s' (id=%0d) ", PH.get_full_name(),
+    uvm_info(ID, lambda: (sv.sformatf("Phase '%0s' (id=%0d) ", PH.get_full_name(),
         PH.get_inst_id()) + MSG), UVM_LOW)
 
 
@@ -316,7 +316,7 @@ class UVMPhase(UVMObject):
     def set_state(self, state):
         if state is None:
             raise Exception('Proper state not given. Must be ' + str(UVM_PHASE2STR))
-        uvm_debug(self, 'set_state', (self.get_name() + ': ' +
+        uvm_debug(self, 'set_state', lambda: (self.get_name() + ': ' +
                 ph2str(self.m_state) + ' => ' + ph2str(state)))
         self.m_state = state
         self.m_phase_set_state_event.set()
@@ -358,7 +358,7 @@ class UVMPhase(UVMObject):
     #  domain.
     #
     def find(self, phase, stay_in_scope=True):
-        uvm_debug(self, "find()", "called with self as {}, phase {}".format(self, phase))
+        uvm_debug(self, "find()", lambda: "called with self as {}, phase {}".format(self, phase))
         if phase is None:
             raise Exception('UVMPhase.find(): Phase is None')
         # TBD full search
@@ -481,7 +481,7 @@ class UVMPhase(UVMObject):
 
         # If we are inserting a new "leaf node"
         if phase.get_phase_type() == UVM_PHASE_IMP:
-            uvm_debug(self, 'add', 'ph_type == UVM_PHASE_IMP ph_name: ' +
+            uvm_debug(self, 'add', lambda: 'ph_type == UVM_PHASE_IMP ph_name: ' +
                     phase.get_name())
             new_node = UVMPhase(phase.get_name(),UVM_PHASE_NODE,self)
             new_node.m_imp = phase
@@ -496,11 +496,11 @@ class UVMPhase(UVMObject):
                 #    DEPRECATED
                 #    new_node.phase_done = uvm_test_done_objection.get()
                 #else: # Other task based phase
-                uvm_debug(self, 'add', ("Adding objection to phase " +
+                uvm_debug(self, 'add', lambda: ("Adding objection to phase " +
                     phase.get_name()))
                 new_node.phase_done = UVMObjection(phase.get_name() + "_objection")
             else:
-                uvm_debug(self, 'add', (phase.get_name() +
+                uvm_debug(self, 'add', lambda: (phase.get_name() +
                     " is not task-based phase, so no objections"))
         else:  # We are inserting an existing schedule
             uvm_debug(self, "add", "We are inserting an existing schedule")
@@ -575,7 +575,7 @@ class UVMPhase(UVMObject):
             tmp_node = phase
         else:
             tmp_node = new_node
-        uvm_debug(self, "add", "GOT here. tmp_node is: " + tmp_node.convert2string())
+        uvm_debug(self, "add", lambda: "GOT here. tmp_node is: " + tmp_node.convert2string())
         state_chg = UVMPhaseStateChange.type_id.create(tmp_node.get_name())
         state_chg.m_phase = tmp_node
         state_chg.m_jump_to = None
@@ -792,7 +792,7 @@ class UVMPhase(UVMObject):
     def raise_objection(self, obj, description="", count=1):
         if self.phase_done is not None:
             if obj is not None:
-                uvm_debug(self, 'raise_objection', 'obj: {}'.format(obj.get_name()))
+                uvm_debug(self, 'raise_objection', lambda: 'obj: {}'.format(obj.get_name()))
             self.phase_done.raise_objection(obj, description, count)
         else:
             self.m_report_null_objection(obj, description, count, "raise")
@@ -1000,29 +1000,29 @@ class UVMPhase(UVMObject):
     #// ------------------
     #
     def m_find_predecessor(self, phase: 'UVMPhase', stay_in_scope=True, orig_phase=None):
-        uvm_debug(self, 'm_find_pred', "called with phase as {}, orig_phase {}".format(
+        uvm_debug(self, 'm_find_pred', lambda: "called with phase as {}, orig_phase {}".format(
             phase, orig_phase))
         if phase is None:
             return None
-        uvm_debug(self, 'm_find_pred', "  Comparing now {} to {} and self {}".format(phase, self.m_imp,
+        uvm_debug(self, 'm_find_pred', lambda: "  Comparing now {} to {} and self {}".format(phase, self.m_imp,
                 self))
         if phase == self.m_imp or phase == self:
             uvm_debug(self, 'm_find_pred', "returning self now from")
             return self
         for key in self.m_predecessors.keys():
-            uvm_debug(self, 'm_find_pred', "  key is now {}".format(key))
+            uvm_debug(self, 'm_find_pred', lambda: "  key is now {}".format(key))
             pred = key
             if orig_phase is None:
                 orig = self
             else:
                 orig = orig_phase
-            uvm_debug(self, 'm_find_pred', "pred is {}, orig is {}".format(pred, orig))
+            uvm_debug(self, 'm_find_pred', lambda: "pred is {}, orig is {}".format(pred, orig))
             if (not stay_in_scope or
                     (pred.get_schedule() == orig.get_schedule()) or
                     (pred.get_domain() == orig.get_domain())):
                 found = pred.m_find_predecessor(phase,stay_in_scope,orig)
                 return found
-        uvm_debug(self, 'm_find_pred', "Did not find precessors for " +
+        uvm_debug(self, 'm_find_pred', lambda: "Did not find precessors for " +
                 str(phase))
         return None
 
@@ -1040,7 +1040,7 @@ class UVMPhase(UVMObject):
         if phase == self.m_imp or phase == self:
             return self
         for succ in self.m_successors.keys():
-            uvm_debug(self, 'm_find_succ', "succ is now {}".format(succ))
+            uvm_debug(self, 'm_find_succ', lambda: "succ is now {}".format(succ))
             orig = None
             if orig_phase is None:
                 orig = self
@@ -1098,7 +1098,7 @@ class UVMPhase(UVMObject):
             #for pred in successors[s].m_predecessors:
             for pred in successors[s].m_predecessors:
                 if pred == self:
-                    uvm_debug(self, 'get_predecessors_for_successor', self.get_name()
+                    uvm_debug(self, 'get_predecessors_for_successor', lambda: self.get_name()
                         + " ZZZ self found from pred_of_succ")
                 pred_of_succ[pred] = 1
 
@@ -1210,7 +1210,7 @@ class UVMPhase(UVMObject):
             qphase = []
             await UVMPhase.m_phase_hopper.get(qphase)  # Should block?
             #fork
-            uvm_debug(cls, 'm_run_phases', 'Calling execute phase with |' +
+            uvm_debug(cls, 'm_run_phases', lambda: 'Calling execute phase with |' +
                     str(qphase[0].get_name()) + '|')
             cocotb.fork(qphase[0].execute_phase())
             #join_none
@@ -1226,7 +1226,7 @@ class UVMPhase(UVMObject):
 
         cs = get_cs()
         top = cs.get_root()  # UVMRoot
-        uvm_debug(self, 'execute_phase', 'Waiting predecessors to finish ' +
+        uvm_debug(self, 'execute_phase', lambda: 'Waiting predecessors to finish ' +
             self.get_name())
 
         # If we got here by jumping forward, we must wait for
@@ -1234,7 +1234,7 @@ class UVMPhase(UVMObject):
         # (the next conditional speeds this up)
         # Also, this helps us fast-forward through terminal (end) nodes
         await self._wait_all_predecessors_done()
-        uvm_debug(self, 'execute_phase', 'All predecessors are DONE ' +
+        uvm_debug(self, 'execute_phase', lambda: 'All predecessors are DONE ' +
             self.get_name())
 
         # If DONE (by, say, a forward jump), return immed
@@ -1260,7 +1260,7 @@ class UVMPhase(UVMObject):
         uvm_debug(self, 'execute_phase', 'Checking for wait_phases_synced')
 
         if len(self.m_sync) > 0:
-            uvm_debug(self, 'execute_phase', 'Waiting for wait_phases_synced ' +
+            uvm_debug(self, 'execute_phase', lambda: 'Waiting for wait_phases_synced ' +
                 self.get_name())
             await self._wait_phases_synced()
 
@@ -1332,7 +1332,7 @@ class UVMPhase(UVMObject):
 
                 await uvm_wait_for_nba_region()  # Give sequences, etc. a chance to object
                 await self.wait_for_criterion_for_end_phase(state_chg)
-                uvm_debug(self, 'execute_phase', "End criterion reached for " +
+                uvm_debug(self, 'execute_phase', lambda: "End criterion reached for " +
                         top.get_name())
         #  end # PHASE_NODE
 
@@ -1405,7 +1405,7 @@ class UVMPhase(UVMObject):
             # CLEANUP:
             #---------
             # kill this phase's threads
-            uvm_debug(self, "execute_phase", "Starting cleanup of |"
+            uvm_debug(self, "execute_phase", lambda: "Starting cleanup of |"
                     + self.m_imp.get_name() + "|")
             state_chg.m_prev_state = self.m_state
             if self.m_premature_end:
@@ -1418,10 +1418,10 @@ class UVMPhase(UVMObject):
                 self.m_phase_proc = None
             await uvm_zero_delay()
             #0; // LET ANY WAITERS WAKE UP
-            uvm_debug(self, "execute_phase", "Cleanup DONE |" + self.m_imp.get_name() + "|")
+            uvm_debug(self, "execute_phase", lambda: "Cleanup DONE |" + self.m_imp.get_name() + "|")
             if self.phase_done is not None:
                 nn = self.get_name()
-                uvm_debug(self, "execute_phase", nn + "| clear() now after DONE |" +
+                uvm_debug(self, "execute_phase", lambda: nn + "| clear() now after DONE |" +
                         self.m_imp.get_name() + "|")
                 self.phase_done.clear()
 
@@ -1458,13 +1458,13 @@ class UVMPhase(UVMObject):
         # If more successors, schedule them to run now
         elif len(self.m_successors) == 0:
             #top.m_phase_all_done= True
-            uvm_debug(self, 'execute_phase', ('name: ' + self.get_name() +
+            uvm_debug(self, 'execute_phase', lambda: ('name: ' + self.get_name() +
                 ' - notify phases done OK'))
             top.m_phase_all_done_event.set()
         else:
             # execute all the successors
             for key in self.m_successors.keys():
-                uvm_debug(self, 'execute_phase', self.get_name() +
+                uvm_debug(self, 'execute_phase', lambda: self.get_name() +
                     ' has more successors')
                 succ = key
                 if succ.m_state < UVM_PHASE_SCHEDULED:
@@ -1485,21 +1485,21 @@ class UVMPhase(UVMObject):
     async def _wait_all_predecessors_done(self):
         nn = self.get_name()
         if self.has_predecessors():
-            uvm_debug(self, '_wait_all_predecessors_done', nn + '| has predecessors() OK')
+            uvm_debug(self, '_wait_all_predecessors_done', lambda: nn + '| has predecessors() OK')
             events = []
             for pred in self.m_predecessors:
-                uvm_debug(self, '_wait_all_predecessors_done', 'pred is now ' + str(pred))
+                uvm_debug(self, '_wait_all_predecessors_done', lambda: 'pred is now ' + str(pred))
                 #wait (pred.m_state == UVM_PHASE_DONE)
                 #events.append(pred.get_phase_done_event())
                 events.append(pred.get_phase_done_event().wait())
 
-            uvm_debug(self, '_wait_all_predecessors_done', nn + "| Before combining events")
+            uvm_debug(self, '_wait_all_predecessors_done', lambda: nn + "| Before combining events")
             await Combine(*events)  # Combine expects *args, not list
-            uvm_debug(self, '_wait_all_predecessors_done', nn + "| After combining events")
+            uvm_debug(self, '_wait_all_predecessors_done', lambda: nn + "| After combining events")
         else:
-            uvm_debug(self, '_wait_all_predecessors_done', nn + '| before yield Timer(0)')
+            uvm_debug(self, '_wait_all_predecessors_done', lambda: nn + '| before yield Timer(0)')
             await uvm_zero_delay()
-            uvm_debug(self, '_wait_all_predecessors_done', nn + '| after yield Timer(0)')
+            uvm_debug(self, '_wait_all_predecessors_done', lambda: nn + '| after yield Timer(0)')
 
 
     async def _wait_phases_synced(self):
@@ -1622,9 +1622,9 @@ class UVMPhase(UVMObject):
             if (UVMPhase.m_phase_trace):
                 UVM_PH_TRACE("PH/TRC/SKIP","No objections raised, skipping phase",self,UVM_LOW)
 
-        uvm_debug(self, '_wait_for_all_dropped', self.get_name() + ' waiting siblings to drop')
+        uvm_debug(self, '_wait_for_all_dropped', lambda: self.get_name() + ' waiting siblings to drop')
         await self.wait_for_self_and_siblings_to_drop()
-        uvm_debug(self, '_wait_for_all_dropped', self.get_name() + ' all siblings have dropped')
+        uvm_debug(self, '_wait_for_all_dropped', lambda: self.get_name() + ' all siblings have dropped')
         do_ready_to_end = True
 
         # --------------
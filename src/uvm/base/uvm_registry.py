@@ -214,6 +214,38 @@ class UVMComponentRegistry(UVMObjectWrapper):
         factory.set_inst_override_by_type(self.get(),override_type,inst_path)
 
 
+class UVMRecyclePool:
+    """
+    Not part of SV UVM. Bounded free list of released objects of one type,
+    together with usage statistics. See `UVMObjectRegistry.enable_recycling`.
+    """
+
+    def __init__(self, max_free=1024, auto_release=False):
+        self.max_free = max_free
+        self.auto_release = auto_release
+        self.free = []
+        self.m_free_ids = set()
+        self.hits = 0
+        self.misses = 0
+        self.released = 0
+        self.dropped = 0
+
+    def get_hit_rate(self) -> float:
+        """
+        Returns:
+            float: Fraction of creates served from the free list.
+        """
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    def convert2string(self) -> str:
+        return "hits: {}, misses: {}, hit rate: {:.2f}, released: {}, dropped: {}, free: {}".format(
+            self.hits, self.misses, self.get_hit_rate(), self.released, self.dropped,
+            len(self.free))
+
+
 class UVMObjectRegistry(UVMObjectWrapper):
 
     # dict of UVMObjectRegistry
@@ -221,11 +253,14 @@ class UVMObjectRegistry(UVMObjectWrapper):
     registered = {}  # tname -> bool
     # Stores the actual constructors
     objs = {}
+    # Number of types with automatic release enabled
+    m_num_auto_release = 0
 
     def __init__(self, Constr, tname):
         self.Constr = Constr
         self.tname = tname
         self.type_name = tname
+        self.m_recycle_pool = None
         if tname in UVMObjectRegistry.registry_db:
             uvm_report_warning("COMP_REGD", (tname + ' has already been'
                 + ' added into the UVMObjectRegistry'))
@@ -239,6 +274,7 @@ class UVMObjectRegistry(UVMObjectWrapper):
         UVMObjectRegistry.registry_db.clear()
         UVMObjectRegistry.registered.clear()
         UVMObjectRegistry.objs.clear()
+        UVMObjectRegistry.m_num_auto_release = 0
 
     # Function: create_object
     #
@@ -248,8 +284,95 @@ class UVMObjectRegistry(UVMObjectWrapper):
     # You should not call this method directly. Call <create> instead.
 
     def create_object(self, name=""):
+        pool = self.m_recycle_pool
+        if pool is not None:
+            if len(pool.free) > 0:
+                obj = pool.free.pop()
+                pool.m_free_ids.discard(id(obj))
+                pool.hits += 1
+                obj.do_recycle(name)
+                return obj
+            pool.misses += 1
         return UVMObjectRegistry.objs[self.tname](name)
 
+    # Group: Recycling
+    #
+    # Not part of SV UVM. Objects of high-rate types, such as sequence items,
+    # can be recycled instead of constructed for each create. Released objects
+    # are kept in a bounded free list and returned by later creates after
+    # calling their `do_recycle` hook, which resets them to constructor state.
+    # Releasing an object which is still referenced elsewhere is an error that
+    # cannot be detected, so recycling is opt-in per type.
+
+    def enable_recycling(self, max_free=1024, auto_release=False) -> UVMRecyclePool:
+        """
+        Enables recycling of objects of this type.
+
+        Args:
+            max_free (int): Max number of objects kept in the free list.
+            auto_release (bool): If True, sequence items are released when
+                `UVMSequenceBase.finish_item` returns, after `item_done` and
+                `end_tr`. The sequence must not use the item after that.
+        Returns:
+            UVMRecyclePool: The pool holding the statistics.
+        """
+        self.disable_recycling()
+        self.m_recycle_pool = UVMRecyclePool(max_free, auto_release)
+        if auto_release:
+            UVMObjectRegistry.m_num_auto_release += 1
+        return self.m_recycle_pool
+
+    def disable_recycling(self) -> None:
+        """ Disables recycling and drops the free list of this type. """
+        if self.m_recycle_pool is not None:
+            if self.m_recycle_pool.auto_release:
+                UVMObjectRegistry.m_num_auto_release -= 1
+            self.m_recycle_pool = None
+
+    def get_recycle_pool(self):
+        """
+        Returns:
+            UVMRecyclePool: Recycling pool, or None if recycling is disabled.
+        """
+        return self.m_recycle_pool
+
+    def release(self, obj) -> bool:
+        """
+        Returns `obj` into the free list. Caller must not use it afterwards.
+        Objects of another type, including derived types, are dropped with a
+        warning, since later creates would return them as this type.
+
+        Args:
+            obj (UVMObject): Object created through this registry.
+        Returns:
+            bool: True if the object was added into the free list.
+        """
+        pool = self.m_recycle_pool
+        if pool is None or id(obj) in pool.m_free_ids:
+            return False
+        if (type(obj) is not UVMObjectRegistry.objs[self.tname]
+                or obj.get_object_type() is not self):
+            uvm_report_warning("RECYCLE/TYPE", ("Cannot release object of type "
+                + type(obj).__name__ + " into the free list of " + self.tname))
+            pool.dropped += 1
+            return False
+        if len(pool.free) >= pool.max_free:
+            pool.dropped += 1
+            return False
+        pool.free.append(obj)
+        pool.m_free_ids.add(id(obj))
+        pool.released += 1
+        return True
+
+    @staticmethod
+    def m_auto_release(obj) -> None:
+        """ Releases `obj` if its type has automatic release enabled """
+        type_id = obj.get_object_type()
+        if isinstance(type_id, UVMObjectRegistry):
+            pool = type_id.m_recycle_pool
+            if pool is not None and pool.auto_release:
+                type_id.release(obj)
+
     def get_type_name(self):
         """
         Function: get_type_name
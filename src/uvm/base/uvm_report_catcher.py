@@ -153,6 +153,26 @@ class UVMReportCatcher(UVMCallback):
     def __init__(self, name="uvm_report_catcher"):
         super().__init__(name)
         UVMReportCatcher.do_report = True
+        self.m_catch_ids = None
+        self.m_catch_severities = None
+
+    def set_catch_filter(self, ids=None, severities=None):
+        """
+        Not part of SV UVM. Declares the message IDs and severities this
+        catcher is interested in. The catcher is not invoked for other
+        messages, which avoids calling `catch` for every message issued.
+
+        Args:
+            ids (list[str]|str): IDs to catch, or None for all IDs.
+            severities (list[int]|int): Severities to catch, or None for all.
+        """
+        if isinstance(ids, str):
+            ids = [ids]
+        if isinstance(severities, int):
+            severities = [severities]
+        self.m_catch_ids = None if ids is None else frozenset(ids)
+        self.m_catch_severities = None if severities is None else frozenset(severities)
+        UVMCallbacksBase.m_generation += 1  # Invalidates the catcher index
 
     #// Group: Current Message State
     #
@@ -512,13 +532,19 @@ class UVMReportCatcher(UVMCallback):
 
 
     in_catcher = 0
+
+    # Catcher index, rebuilt when callbacks are added or filters changed
+    m_catchers_gen = -1  # UVMCallbacksBase.m_generation of the index
+    m_any_catchers = False
+    m_index = {}  # report object -> (catchers, {id: [(pos, catcher)]})
+
     #//process_all_report_catchers
     #//method called by report_server.report to process catchers
     #//
     @classmethod
     def process_all_report_catchers(cls, rm):
-        _iter = UVMCallback("_iter")
-        catcher = None  # uvm_report_catcher
+        if cls.m_catchers_gen == UVMCallbacksBase.m_generation and not cls.m_any_catchers:
+            return 1
         thrown = 1
         orig_severity = 0  # uvm_severity
         #cls.in_catcher = 0  # static bit in_catcher
@@ -527,32 +553,39 @@ class UVMReportCatcher(UVMCallback):
         if cls.in_catcher == 1:
             return 1
 
+        l_id = rm.get_id()
+        candidates = cls.m_get_catchers(l_report_object, l_id)
+        if len(candidates) == 0:
+            return 1
+
         cls.in_catcher = 1
         UVMCallbacksBase.m_tracing = 0  # turn off cb tracing so catcher stuff doesn't print
 
         orig_severity = rm.get_severity()  # cast to 'uvm_severity' removed
         cls.m_modified_report_message = rm
 
-        catcher = UVMReportCb.get_first(_iter, l_report_object)
-        if catcher is not None:
-            if cls.m_debug_flags & cls.DO_NOT_MODIFY:
-                #process p = process::self(); // Keep random stability
-                p = None
-                randstate = ""
-                if p is not None:
-                    randstate = p.get_randstate()
-                cls.m_orig_report_message = rm.clone()
-                #sv.cast(m_orig_report_message, rm.clone()) # have to clone, rm can be extended type
-                if p is not None:
-                    p.set_randstate(randstate)
-
-        while catcher is not None:
+        if cls.m_debug_flags & cls.DO_NOT_MODIFY:
+            #process p = process::self(); // Keep random stability
+            p = None
+            randstate = ""
+            if p is not None:
+                randstate = p.get_randstate()
+            cls.m_orig_report_message = rm.clone()
+            #sv.cast(m_orig_report_message, rm.clone()) # have to clone, rm can be extended type
+            if p is not None:
+                p.set_randstate(randstate)
+
+        k = 0
+        while k < len(candidates):
+            (pos, catcher) = candidates[k]
+            k += 1
             prev_sev = 0  # uvm_severity
 
-            if catcher.callback_mode() is False:
-                catcher = UVMReportCb.get_next(_iter, l_report_object)
+            if catcher.is_enabled() is False:
+                continue
+            if (catcher.m_catch_severities is not None and
+                    rm.get_severity() not in catcher.m_catch_severities):
                 continue
-
 
             prev_sev = cls.m_modified_report_message.get_severity()
             cls.m_set_action_called = False
@@ -577,7 +610,14 @@ class UVMReportCatcher(UVMCallback):
                 elif orig_severity == UVM_WARNING:
                     cls.m_caught_warning += 1
                 break
-            catcher = UVMReportCb.get_next(_iter,l_report_object)
+
+            # If the catcher changed the ID, the remaining catchers are
+            # selected using the new ID.
+            if rm.get_id() != l_id:
+                l_id = rm.get_id()
+                candidates = [(i, c) for (i, c) in cls.m_get_catchers(l_report_object, l_id)
+                    if i > pos]
+                k = 0
 
         # update counters if message was returned with demoted severity
         if orig_severity == UVM_FATAL:
@@ -594,6 +634,48 @@ class UVMReportCatcher(UVMCallback):
         UVMCallbacksBase.m_tracing = 1  # turn tracing stuff back on
         return thrown
 
+    @classmethod
+    def m_get_catchers(cls, l_report_object, id):
+        """
+        Returns the catchers registered for the report object, whose ID filter
+        accepts the given ID, as (position, catcher) pairs in calling order.
+        Disabled catchers are included.
+        """
+        if cls.m_catchers_gen != UVMCallbacksBase.m_generation:
+            cls.m_index = {}
+            cls.m_catchers_gen = UVMCallbacksBase.m_generation
+            cls.m_any_catchers = cls.m_has_catchers()
+        if not cls.m_any_catchers:
+            return []
+        entry = cls.m_index.get(l_report_object)
+        if entry is None:
+            typed_cbs = UVMReportCb._get_typed_cbs(l_report_object, UVMReportCatcher)
+            q = typed_cbs.m_get_q(l_report_object, UVMReportCatcher)
+            if q is None:
+                q = []
+            entry = ([cb for cb in q if isinstance(cb, UVMReportCatcher)], {})
+            cls.m_index[l_report_object] = entry
+        (catchers, by_id) = entry
+        candidates = by_id.get(id)
+        if candidates is None:
+            candidates = [(i, c) for (i, c) in enumerate(catchers)
+                if c.m_catch_ids is None or id in c.m_catch_ids]
+            by_id[id] = candidates
+        return candidates
+
+    @classmethod
+    def m_has_catchers(cls):
+        """ Returns True if any report catcher is registered """
+        UVMReportCb.get()
+        queues = [UVMReportCb.m_t_inst.m_tw_cb_q]
+        queues.extend(UVMReportCb.m_base_inst.m_pool.pool.values())
+        for q in queues:
+            if q is not None:
+                for cb in q:
+                    if isinstance(cb, UVMReportCatcher):
+                        return True
+        return False
+
 
     #//process_report_catcher
     #//internal method to call user <catch()> method
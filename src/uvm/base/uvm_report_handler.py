@@ -50,10 +50,19 @@ class UVMReportHandler(UVMObject):
 
     The relationship between UVMReportHandler and `UVMReportServer` is many
     to one.
+
+    uvm-python: The effective verbosity, severity override, action and file
+    handle for each ~(severity,id)~ pair are memoized in `m_decisions`. All
+    set_* methods invalidate the memo. The pools below must not be modified
+    directly, or `m_invalidate_decisions` must be called afterwards.
     """
 
+    # Memo is cleared when it grows beyond this many (severity,id) pairs
+    max_decisions = 4096
+
     def __init__(self, name=""):
         UVMObject.__init__(self, name)
+        self.m_decisions = {}  # (severity, id) -> (verb, new_sev, action, file)
         self.m_max_verbosity_level = 0
 
         # id verbosity settings : default and severity
@@ -305,20 +314,63 @@ class UVMReportHandler(UVMObject):
         id = report_message.get_id()
         severity = report_message.get_severity()
 
-        # Check for severity overrides and apply them before calling the server.
-        # An id specific override has precedence over a generic severity override.
+        key = (severity, id)
+        decision = self.m_decisions.get(key)
+        if decision is None:
+            decision = self.m_get_decision(severity, id)
+
+        # Severity overrides are resolved in m_get_decision
+        if decision[1] != severity:
+            report_message.set_severity(decision[1])
+        report_message.set_file(decision[3])
+        report_message.set_report_handler(self)
+        report_message.set_action(decision[2])
+        srvr.process_report_message(report_message)
+
+    def m_get_severity_override(self, severity, id):
+        """
+        Returns the severity after applying severity overrides. An id specific
+        override has precedence over a generic severity override.
+        Args:
+            severity:
+            id:
+        Returns:
+            int: Overridden severity, or `severity` if there is no override.
+        """
         if id in self.sev_id_overrides:
             if self.sev_id_overrides[id].exists(severity):
-                severity = self.sev_id_overrides[id].get(severity)
-                report_message.set_severity(severity)
+                return self.sev_id_overrides[id].get(severity)
         else:
             if self.sev_overrides.exists(severity):
-                severity = self.sev_overrides.get(severity)
-                report_message.set_severity(severity)
-        report_message.set_file(self.get_file_handle(severity, id))
-        report_message.set_report_handler(self)
-        report_message.set_action(self.get_action(severity, id))
-        srvr.process_report_message(report_message)
+                return self.sev_overrides.get(severity)
+        return severity
+
+    def m_get_decision(self, severity, id):
+        """
+        Resolves and memoizes the handling of messages with given `severity`
+        and `id`.
+
+        Args:
+            severity:
+            id:
+        Returns:
+            tuple: (verbosity, overridden severity, action, file handle). The
+            action and file handle are resolved for the overridden severity.
+        """
+        new_sev = self.m_get_severity_override(severity, id)
+        decision = (self.get_verbosity_level(severity, id), new_sev,
+            self.get_action(new_sev, id), self.get_file_handle(new_sev, id))
+        if len(self.m_decisions) >= UVMReportHandler.max_decisions:
+            self.m_decisions.clear()
+        self.m_decisions[(severity, id)] = decision
+        return decision
+
+    def m_invalidate_decisions(self):
+        """
+        Clears memoized verbosity/action/file decisions. Called by every
+        method modifying the configuration of this handler.
+        """
+        self.m_decisions.clear()
 
     #  //----------------------------------------------------------------------------
     #  // Group: Convenience Methods
@@ -363,6 +415,7 @@ class UVMReportHandler(UVMObject):
         """
         self.set_default_file(0)
         self.m_max_verbosity_level = UVM_MEDIUM
+        self.m_invalidate_decisions()
         self.set_severity_action(UVM_INFO, UVM_DISPLAY)
         self.set_severity_action(UVM_WARNING, UVM_DISPLAY)
         self.set_severity_action(UVM_ERROR, UVM_DISPLAY | UVM_COUNT)
@@ -403,6 +456,7 @@ class UVMReportHandler(UVMObject):
             verbosity_level:
         """
         self.m_max_verbosity_level = verbosity_level
+        self.m_invalidate_decisions()
 
     def get_verbosity_level(self, severity=UVM_INFO, id="") -> int:
         """
@@ -490,6 +544,7 @@ class UVMReportHandler(UVMObject):
             action:
         """
         self.severity_actions.add(severity, action)
+        self.m_invalidate_decisions()
 
     def set_id_action(self, id, action):
         """
@@ -499,6 +554,7 @@ class UVMReportHandler(UVMObject):
             action:
         """
         self.id_actions.add(id, action)
+        self.m_invalidate_decisions()
 
     def set_severity_id_action(self, severity, id, action):
         """
@@ -511,6 +567,7 @@ class UVMReportHandler(UVMObject):
         if severity not in self.severity_id_actions:
             self.severity_id_actions[severity] = UVMPool()
         self.severity_id_actions[severity].add(id, action)
+        self.m_invalidate_decisions()
 
     def set_id_verbosity(self, id, verbosity):
         """
@@ -520,6 +577,7 @@ class UVMReportHandler(UVMObject):
             verbosity:
         """
         self.id_verbosities.add(id, verbosity)
+        self.m_invalidate_decisions()
 
     def set_severity_id_verbosity(self, severity, id, verbosity):
         """
@@ -532,6 +590,7 @@ class UVMReportHandler(UVMObject):
         if severity not in self.severity_id_verbosities:
             self.severity_id_verbosities[severity] = UVMPool()
         self.severity_id_verbosities[severity].add(id,verbosity)
+        self.m_invalidate_decisions()
 
     def set_default_file(self, file):
         """
@@ -540,6 +599,7 @@ class UVMReportHandler(UVMObject):
             file:
         """
         self.default_file_handle = file
+        self.m_invalidate_decisions()
 
     def set_severity_file(self, severity, file):
         """
@@ -549,6 +609,7 @@ class UVMReportHandler(UVMObject):
             file:
         """
         self.severity_file_handles[severity] = file
+        self.m_invalidate_decisions()
 
     def set_id_file(self, id, file):
         """
@@ -558,6 +619,7 @@ class UVMReportHandler(UVMObject):
             file:
         """
         self.id_file_handles.add(id, file)
+        self.m_invalidate_decisions()
 
     def set_severity_id_file(self, severity, id, file):
         """
@@ -570,9 +632,11 @@ class UVMReportHandler(UVMObject):
         if severity not in self.severity_id_file_handles:
             self.severity_id_file_handles[severity] = UVMPool()
         self.severity_id_file_handles[severity].add(id, file)
+        self.m_invalidate_decisions()
 
     def set_severity_override(self, cur_severity, new_severity):
         self.sev_overrides.add(cur_severity, new_severity)
+        self.m_invalidate_decisions()
 
     def set_severity_id_override(self, cur_severity, id, new_severity):
         # has precedence over set_severity_override
@@ -580,6 +644,7 @@ class UVMReportHandler(UVMObject):
         if id not in self.sev_id_overrides:
             self.sev_id_overrides[id] = UVMPool()
         self.sev_id_overrides[id].add(cur_severity, new_severity)
+        self.m_invalidate_decisions()
 
     def report(self, severity, name, id, message,
       verbosity_level=UVM_MEDIUM, filename="", line=0,
@@ -22,7 +22,7 @@
 
 from .uvm_object import UVMObject
 from .uvm_object_globals import (UVM_DISPLAY, UVM_HEX, UVM_INFO, UVM_LOG,
-    UVM_RM_RECORD, UVM_UNSIGNED)
+    UVM_NORADIX, UVM_RM_RECORD, UVM_SEVERITY_NAMES, UVM_UNSIGNED)
 
 #------------------------------------------------------------------------------
 #
@@ -77,7 +77,13 @@ class UVMReportMessageElementBase(UVMObject):
         pass
 
     def do_record(self, recorder):
-        pass
+        if isinstance(self._val, int):
+            recorder.record_field(self._name, self._val, self._val.bit_length() + 1,
+                UVM_NORADIX)
+        elif isinstance(self._val, UVMObject):
+            recorder.record_object(self._name, self._val)
+        else:
+            recorder.record_string(self._name, str(self._val))
 
     def do_copy(self, rhs):
         pass
@@ -246,6 +252,25 @@ class UVMReportMessage(UVMObject):
         if self._report_message_element_container.size() != 0:
             self._report_message_element_container.print(printer)
 
+    def do_record(self, recorder):
+        """
+        Records the message fields and elements into the given recorder.
+
+        Args:
+            recorder (UVMRecorder): Recorder from the message stream.
+        """
+        UVMObject.do_record(self, recorder)
+        recorder.record_string("severity", UVM_SEVERITY_NAMES[self._severity])
+        recorder.record_string("id", self._id)
+        recorder.record_string("message", self._message)
+        recorder.record_field_int("verbosity", self._verbosity, 32, UVM_HEX)
+        recorder.record_string("filename", self._filename)
+        recorder.record_field_int("line", self._line if self._line != "" else 0,
+            32, UVM_UNSIGNED)
+        recorder.record_string("context_name", self._context_name)
+        if self._report_message_element_container.size() != 0:
+            self._report_message_element_container.record(recorder)
+
     def do_copy(self, rhs):
         report_message = rhs
         UVMObject.do_copy(self, rhs)
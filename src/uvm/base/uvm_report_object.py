@@ -123,9 +123,11 @@ class UVMReportObject(UVMObject):
         Returns:
             bool: True if given report enabled, False otherwise.
         """
-        if self.get_report_verbosity_level(severity, id) >= verbosity:
-            return True
-        return False
+        # Fast path: memoized decision of the report handler
+        decision = self.m_rh.m_decisions.get((severity, id))
+        if decision is None:
+            decision = self.m_rh.m_get_decision(severity, id)
+        return decision[0] >= verbosity
 
     def uvm_report(self, severity, id, message,
             verbosity=-1,
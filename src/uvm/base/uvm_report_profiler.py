@@ -0,0 +1,192 @@
+#//
+#//------------------------------------------------------------------------------
+#//   Copyright 2020 Tuomas Poikela (tpoikela)
+#//   All Rights Reserved Worldwide
+#//
+#//   Licensed under the Apache License, Version 2.0 (the
+#//   "License"); you may not use this file except in
+#//   compliance with the License.  You may obtain a copy of
+#//   the License at
+#//
+#//       http://www.apache.org/licenses/LICENSE-2.0
+#//
+#//   Unless required by applicable law or agreed to in
+#//   writing, software distributed under the License is
+#//   distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+#//   CONDITIONS OF ANY KIND, either express or implied.  See
+#//   the License for the specific language governing
+#//   permissions and limitations under the License.
+#//------------------------------------------------------------------------------
+"""
+Wall time profiling of the reporting mechanism.
+
+Not part of SV UVM. When enabled, `UVMReportProfiler` measures the wall time
+spent in `UVMReportObject.uvm_report`, `UVMReportHandler.process_report_message`
+and `UVMReportServer.execute_report_message`, and accumulates it per message
+ID and per report object. Messages which were not displayed or logged (for
+example filtered by verbosity, caught or throttled) are counted separately.
+The results are shown in `UVMReportServer.report_summarize`::
+
+    UVMReportProfiler.get().enable()
+
+The profiler wraps the methods above when enabled and restores them when
+disabled, so it costs nothing when not in use.
+"""
+
+from time import perf_counter
+from typing import Dict, List
+
+from .uvm_object_globals import UVM_DISPLAY, UVM_LOG
+
+# Indices into the per-ID and per-object statistics
+FILTERED_COUNT = 0
+FILTERED_TIME = 1
+DISPLAYED_COUNT = 2
+DISPLAYED_TIME = 3
+
+
+class UVMReportProfiler:
+    """
+    Collects reporting counts and wall time per message ID and report object.
+    """
+
+    m_inst = None
+
+    # Max number of rows per table in the summary
+    max_summary_rows = 10
+
+    def __init__(self):
+        self.m_enabled = False
+        self.m_orig_methods = []
+        self.m_displayed = False  # Set by execute_report_message
+        self.reset()
+
+    @classmethod
+    def get(cls) -> 'UVMReportProfiler':
+        """
+        Returns:
+            UVMReportProfiler: The singleton profiler.
+        """
+        if cls.m_inst is None:
+            cls.m_inst = UVMReportProfiler()
+        return cls.m_inst
+
+    def reset(self) -> None:
+        """ Clears all collected statistics """
+        self.by_id: Dict[str, List] = {}
+        self.by_object: Dict[str, List] = {}
+        self.handler_time = 0.0
+        self.server_time = 0.0
+
+    def is_enabled(self) -> bool:
+        return self.m_enabled
+
+    def enable(self) -> None:
+        """ Starts profiling of all report objects, handlers and servers """
+        if self.m_enabled:
+            return
+        from .uvm_report_object import UVMReportObject
+        from .uvm_report_handler import UVMReportHandler
+        from .uvm_report_server import UVMReportServer
+        self.m_orig_methods = [
+            (UVMReportObject, "uvm_report", UVMReportObject.uvm_report),
+            (UVMReportHandler, "process_report_message",
+                UVMReportHandler.process_report_message),
+            (UVMReportServer, "execute_report_message",
+                UVMReportServer.execute_report_message),
+        ]
+        UVMReportObject.uvm_report = self.m_wrap_uvm_report(UVMReportObject.uvm_report)
+        UVMReportHandler.process_report_message = self.m_wrap_handler(
+            UVMReportHandler.process_report_message)
+        UVMReportServer.execute_report_message = self.m_wrap_server(
+            UVMReportServer.execute_report_message)
+        self.m_enabled = True
+
+    def disable(self) -> None:
+        """ Stops profiling. Collected statistics are kept. """
+        for (cls, name, method) in self.m_orig_methods:
+            setattr(cls, name, method)
+        self.m_orig_methods = []
+        self.m_enabled = False
+
+    def m_wrap_uvm_report(self, uvm_report):
+        prof = self
+
+        def profiled_uvm_report(ro, severity, id, message, verbosity=-1,
+                filename="", line=0, context_name="", report_enabled_checked=False):
+            prev_displayed = prof.m_displayed
+            prof.m_displayed = False
+            start = perf_counter()
+            try:
+                uvm_report(ro, severity, id, message, verbosity, filename, line,
+                    context_name, report_enabled_checked)
+            finally:
+                elapsed = perf_counter() - start
+                if prof.m_displayed:
+                    prof.m_add(id, ro.get_full_name(), DISPLAYED_COUNT, elapsed)
+                else:
+                    prof.m_add(id, ro.get_full_name(), FILTERED_COUNT, elapsed)
+                prof.m_displayed = prev_displayed
+        return profiled_uvm_report
+
+    def m_wrap_handler(self, process_report_message):
+        prof = self
+
+        def profiled_process_report_message(rh, report_message):
+            start = perf_counter()
+            try:
+                process_report_message(rh, report_message)
+            finally:
+                prof.handler_time += perf_counter() - start
+        return profiled_process_report_message
+
+    def m_wrap_server(self, execute_report_message):
+        prof = self
+
+        def profiled_execute_report_message(srv, report_message, composed_message):
+            if report_message.get_action() & (UVM_DISPLAY | UVM_LOG):
+                prof.m_displayed = True
+            start = perf_counter()
+            try:
+                execute_report_message(srv, report_message, composed_message)
+            finally:
+                prof.server_time += perf_counter() - start
+        return profiled_execute_report_message
+
+    def m_add(self, id, obj_name, count_idx, elapsed) -> None:
+        for (stats, key) in ((self.by_id, id), (self.by_object, obj_name)):
+            entry = stats.get(key)
+            if entry is None:
+                entry = [0, 0.0, 0, 0.0]
+                stats[key] = entry
+            entry[count_idx] += 1
+            entry[count_idx + 1] += elapsed
+
+    def get_total_time(self) -> float:
+        """
+        Returns:
+            float: Total wall time (s) spent in `UVMReportObject.uvm_report`.
+        """
+        return sum(e[FILTERED_TIME] + e[DISPLAYED_TIME] for e in self.by_id.values())
+
+    def get_summary_string(self) -> str:
+        """
+        Returns the top message IDs and report objects by reporting wall time
+        as a table. Returns an empty string if nothing has been profiled.
+
+        Returns:
+            str: Profiling summary.
+        """
+        if len(self.by_id) == 0:
+            return ""
+        q = ["** Report profile: {:.6f} s total, {:.6f} s in handlers, {:.6f} s in server\n".format(
+            self.get_total_time(), self.handler_time, self.server_time)]
+        for (title, stats) in (("id", self.by_id), ("report object", self.by_object)):
+            q.append("Top {} by time (s)  : displayed (count) filtered (count)\n".format(title))
+            top = sorted(stats.items(), key=lambda kv: kv[1][FILTERED_TIME] + kv[1][DISPLAYED_TIME],
+                reverse=True)
+            for (key, e) in top[:self.max_summary_rows]:
+                q.append("[{}] {:.6f} : {:.6f} ({}) {:.6f} ({})\n".format(key,
+                    e[FILTERED_TIME] + e[DISPLAYED_TIME], e[DISPLAYED_TIME],
+                    e[DISPLAYED_COUNT], e[FILTERED_TIME], e[FILTERED_COUNT]))
+        return "".join(q)
@@ -3,7 +3,7 @@
 
 from .uvm_object import UVMObject
 from .uvm_object_globals import (UVM_BIN, UVM_COUNT, UVM_DEC, UVM_DISPLAY, UVM_ERROR, UVM_EXIT,
-                                 UVM_FATAL, UVM_INFO, UVM_LOG, UVM_LOW, UVM_MEDIUM, UVM_NONE,
+                                 UVM_FATAL, UVM_INFO, UVM_LOG, UVM_LOW, UVM_NONE,
                                  UVM_NO_ACTION, UVM_RM_RECORD, UVM_SEVERITY_LEVELS, UVM_STOP,
                                  UVM_WARNING)
 from .uvm_globals import uvm_report_info, uvm_sim_time
@@ -12,7 +12,10 @@ from .uvm_global_vars import uvm_default_printer
 from .sv import sv
 from ..macros.uvm_message_defines import uvm_info
 from .uvm_tr_database import UVMTrDatabase, UVMTextTrDatabase
-from typing import List, Any, Callable
+from .uvm_report_profiler import UVMReportProfiler
+from .uvm_report_sink import UVMReportSink
+from string import Formatter
+from typing import List, Any, Callable, Optional
 
 
 
@@ -41,6 +44,127 @@ def ename(sever) -> str:
 
 
 
+# Default template for composed messages, see
+# UVMReportServer.set_message_format()
+DEFAULT_MESSAGE_FORMAT = ("{severity}{verbosity} {filename_line}@ {time}: "
+    + "{name}{context} [{id}] {message}{terminator}")
+MESSAGE_FORMAT_FIELDS = ("severity", "verbosity", "filename_line", "filename",
+    "line", "time", "name", "context", "id", "message", "terminator")
+
+# Code computing each field in the compose function generated by
+# _compile_message_format(), as (fields it depends on, lines)
+_FIELD_CODE = {
+    "severity": ((), [
+        "severity = self.m_sev_names.get(report_message.get_severity())",
+        "if severity is None:",
+        "    severity = ename(report_message.get_severity())"]),
+    "verbosity": ((), [
+        "verbosity = ''",
+        "if self.show_verbosity is True:",
+        "    verbosity = '(' + str(report_message.get_verbosity()) + ')'"]),
+    "filename": ((), ["filename = report_message.get_filename()"]),
+    "line": ((), ["line = report_message.get_line()"]),
+    "filename_line": (("filename", "line"), [
+        "filename_line = ''",
+        "if filename != '':",
+        "    filename_line = self.m_file_line_cache.get((filename, line))",
+        "    if filename_line is None:",
+        "        if len(self.m_file_line_cache) >= self.max_file_line_cache:",
+        "            self.m_file_line_cache = {}",
+        "        filename_line = filename + '(' + str(line) + ') '",
+        "        self.m_file_line_cache[(filename, line)] = filename_line"]),
+    "time": ((), [
+        "sim_time = uvm_sim_time('NS')",
+        "if sim_time != self.m_time_cache[0]:",
+        "    self.m_time_cache = (sim_time, str(sim_time) + 'NS')",
+        "time = self.m_time_cache[1]"]),
+    "name": ((), [
+        "name = report_object_name",
+        "if name == '':",
+        "    l_report_handler = report_message.get_report_handler()",
+        "    if l_report_handler is not None:",
+        "        name = l_report_handler.get_full_name()",
+        "    else:",
+        "        name = 'NO_REPORT_OBJECT'"]),
+    "context": ((), [
+        "context = report_message.get_context()",
+        "if context != '':",
+        "    context = '@@' + context"]),
+    "id": ((), ["id = report_message.get_id()"]),
+    "message": ((), [
+        "el_container = report_message.get_element_container()",
+        "message = report_message.get_message()",
+        "if el_container.size() != 0:",
+        "    prefix = uvm_default_printer.knobs.prefix",
+        "    uvm_default_printer.knobs.prefix = ' +'",
+        "    message = message + '\\n' + el_container.sprint()",
+        "    uvm_default_printer.knobs.prefix = prefix"]),
+    "terminator": (("severity",), [
+        "terminator = ''",
+        "if self.show_terminator is True:",
+        "    terminator = ' -' + severity"]),
+}
+_FIELD_ORDER = ("severity", "verbosity", "filename", "line", "filename_line",
+    "time", "name", "context", "id", "message", "terminator")
+_CONVERSIONS = {"r": "repr", "s": "str", "a": "ascii"}
+
+
+def _compile_message_format(template: str) -> Callable:
+    """
+    Compiles a message template into a function
+    compose(server, report_message, report_object_name), which computes only
+    the fields used by the template and concatenates them.
+
+    Args:
+        template (str): Message template, see `UVMReportServer.set_message_format`
+    Returns:
+        Callable: Compose function
+    Raises:
+        Exception: If the template is not a valid message template.
+    """
+    used = set()
+    exprs = []
+    for (literal, field, spec, conv) in Formatter().parse(template):
+        if literal != "":
+            exprs.append(repr(literal))
+        if field is None:
+            continue
+        if field not in MESSAGE_FORMAT_FIELDS:
+            raise Exception("Unknown field {{{}}} in message format: {}".format(
+                field, template))
+        if spec and "{" in spec:
+            raise Exception("Nested field in message format: {}".format(template))
+        if conv is not None and conv not in _CONVERSIONS:
+            raise Exception("Unknown conversion !{} in message format: {}".format(
+                conv, template))
+        used.add(field)
+        expr = field
+        if conv is not None:
+            expr = _CONVERSIONS[conv] + "(" + expr + ")"
+        if spec:
+            expr = "format(" + expr + ", " + repr(spec) + ")"
+        elif field == "line" and conv is None:
+            expr = "str(line)"
+        exprs.append(expr)
+    for field in list(used):
+        used.update(_FIELD_CODE[field][0])
+
+    code = ["def m_compose(self, report_message, report_object_name):"]
+    for field in _FIELD_ORDER:
+        if field in used:
+            code.extend("    " + line for line in _FIELD_CODE[field][1])
+    if len(exprs) == 0:
+        exprs.append("''")
+    code.append("    return " + " + ".join(exprs))
+    src = "\n".join(code) + "\n"
+    namespace = {"ename": ename, "uvm_sim_time": uvm_sim_time,
+        "uvm_default_printer": uvm_default_printer}
+    exec(compile(src, "<message format {!r}>".format(template), "exec"), namespace)
+    func = namespace["m_compose"]
+    func.m_uvm_source = src
+    return func
+
+
 class UVMReportServer(UVMObject):
     """
     UVMReportServer is a global server that processes all of the reports
@@ -51,6 +175,9 @@ class UVMReportServer(UVMObject):
     as its default report server implementation.
     """
 
+    # Max number of cached "filename(line) " strings
+    max_file_line_cache = 4096
+
     def __init__(self, name="base"):
         UVMObject.__init__(self, name)
         self.m_quit_count = 0
@@ -71,6 +198,22 @@ class UVMReportServer(UVMObject):
         self.set_max_quit_count(0)
         self.print_on_closed_file = True
         self.logger = print  # By default, use print to emit the messages
+        self.m_sink: Optional[UVMReportSink] = None
+
+        # Throttling, see set_report_throttle()
+        self.m_throttle_rules = {}  # (id, severity) -> (max_count, window, window_count)
+        self.m_throttle_state = {}  # (id, severity) -> [rule, count, win_start, win_count]
+        self.m_suppressed_count = {}  # (id, severity) -> int
+        self.collapse_duplicates = False
+        self.m_last_msg = None
+        self.m_dup_count = 0
+
+        # Precompiled message layout and caches, see compose_report_message()
+        self.m_sev_names = {sev: ename(sev) for sev in [UVM_INFO, UVM_WARNING,
+            UVM_ERROR, UVM_FATAL]}
+        self.m_file_line_cache = {}  # (filename, line) -> "filename(line) "
+        self.m_time_cache = (None, "")  # (sim time, time string)
+        self.set_message_format(DEFAULT_MESSAGE_FORMAT)
 
     def get_type_name(self) -> str:
         return "uvm_report_server"
@@ -91,10 +234,166 @@ class UVMReportServer(UVMObject):
         Sets the logger function used to print the messages. Default is python
         built-in print.
 
+        If a report sink is set, messages to stdout are written through the
+        sink only with the default logger. Other loggers are called directly.
+
         logger (func): Logging function to use.
         """
+        if self.m_sink is not None:
+            self.flush()  # Keep messages queued before the switch in order
         self.logger = logger
 
+    def set_report_sink(self, sink: Optional[UVMReportSink]):
+        """
+        Sets a buffered sink for composed messages. When a sink is set, both
+        displayed and logged messages are written asynchronously through it,
+        instead of direct file writes. Messages to stdout go through the sink
+        only if the default logger is used, see `set_logger`. Setting None
+        flushes the previous sink and returns to synchronous writes.
+
+        Args:
+            sink (UVMReportSink): Sink to use, or None.
+        """
+        if self.m_sink is not None and self.m_sink is not sink:
+            self.flush()
+        self.m_sink = sink
+
+    def get_report_sink(self) -> Optional[UVMReportSink]:
+        """
+        Returns:
+            UVMReportSink: Buffered sink used by this server, or None.
+        """
+        return self.m_sink
+
+    def flush(self) -> None:
+        """
+        Blocks until all messages queued into the report sink are written.
+        Messages dropped by the sink because their file was closed are
+        reported like in `f_display`. Does nothing if no sink is set.
+        """
+        if self.m_sink is not None:
+            self.m_sink.flush()
+            for msg in self.m_sink.take_dropped():
+                if self.print_on_closed_file:
+                    self.logger('UVM_WARNING. File already closed for msg ' + msg)
+
+    def m_display(self, msg: str) -> None:
+        """ Writes a message to stdout, through the sink if it is used """
+        if self.m_sink is not None and self.logger is print:
+            self.m_sink.write(0, msg)
+        else:
+            self.logger(msg)
+
+    #----------------------------------------------------------------------------
+    # Group: Throttling
+    #
+    # Not part of SV UVM. Messages exceeding the configured limits are
+    # suppressed before report catchers, composing and I/O. Suppressed messages
+    # are still counted in severity/id counts, and the UVM_COUNT, UVM_EXIT and
+    # UVM_STOP actions are still processed. The numbers of suppressed messages
+    # are shown in the report summary.
+    #----------------------------------------------------------------------------
+
+    def set_report_throttle(self, id, max_count=-1, window=0, window_count=-1,
+            severity=-1) -> None:
+        """
+        Limits the number of processed messages with the given ID. Limits are
+        counted separately for each ID/severity pair. Setting a new limit
+        resets the counts of all limits.
+
+        Args:
+            id (str): Message ID, or "_ALL_" for all IDs without own limit.
+            max_count (int): Max number of messages, -1 for no limit.
+            window (int): Length of the rate limit time window in NS. 0
+                disables the rate limit.
+            window_count (int): Max number of messages in each time window.
+            severity (int): Severity to limit, -1 for all severities.
+        """
+        key = (id, severity)
+        if max_count < 0 and (window <= 0 or window_count < 0):
+            if key in self.m_throttle_rules:
+                del self.m_throttle_rules[key]
+        else:
+            self.m_throttle_rules[key] = (max_count, window, window_count)
+        self.m_throttle_state = {}
+
+    def clear_report_throttles(self) -> None:
+        """ Removes all limits set with `set_report_throttle` """
+        self.m_throttle_rules = {}
+        self.m_throttle_state = {}
+
+    def get_suppressed_count(self, id=None, severity=-1) -> int:
+        """
+        Returns the number of suppressed messages, either throttled or
+        collapsed as duplicates.
+
+        Args:
+            id (str): Message ID, or None for all IDs.
+            severity (int): Severity, or -1 for all severities.
+        Returns:
+            int: Number of suppressed messages.
+        """
+        count = 0
+        for (sid, ssev) in self.m_suppressed_count:
+            if (id is None or sid == id) and (severity == -1 or ssev == severity):
+                count += self.m_suppressed_count[(sid, ssev)]
+        return count
+
+    def m_get_throttle_rule(self, id, severity):
+        rules = self.m_throttle_rules
+        for key in ((id, severity), (id, -1), ("_ALL_", severity), ("_ALL_", -1)):
+            if key in rules:
+                return rules[key]
+        return None
+
+    def m_is_throttled(self, report_message) -> bool:
+        """ Returns True if the message exceeds its throttle limits """
+        key = (report_message.get_id(), report_message.get_severity())
+        state = self.m_throttle_state.get(key)
+        if state is None:
+            state = [self.m_get_throttle_rule(key[0], key[1]), 0, 0, 0]
+            self.m_throttle_state[key] = state
+        rule = state[0]
+        if rule is None:
+            return False
+        (max_count, window, window_count) = rule
+        if max_count >= 0 and state[1] >= max_count:
+            return True
+        if window > 0 and window_count >= 0:
+            now = uvm_sim_time('NS')
+            if now - state[2] >= window:
+                state[2] = now
+                state[3] = 0
+            if state[3] >= window_count:
+                return True
+            state[3] += 1
+        state[1] += 1
+        return False
+
+    def m_is_duplicate(self, report_message) -> bool:
+        """ Returns True if the message repeats the previous message """
+        msg = (report_message.get_severity(), report_message.get_id(),
+            report_message.get_message(), report_message.get_report_handler())
+        if msg == self.m_last_msg:
+            self.m_dup_count += 1
+            return True
+        self.m_flush_duplicates()
+        self.m_last_msg = msg
+        return False
+
+    def m_flush_duplicates(self) -> None:
+        if self.m_dup_count > 0:
+            self.f_display(0, "Last message repeated {} times".format(self.m_dup_count))
+            self.m_dup_count = 0
+
+    def m_suppress(self, report_message) -> None:
+        """ Counts the suppressed message and processes its non-output actions """
+        key = (report_message.get_id(), report_message.get_severity())
+        self.m_suppressed_count[key] = self.m_suppressed_count.get(key, 0) + 1
+        report_message.set_action(report_message.get_action()
+            & ~(UVM_DISPLAY | UVM_LOG | UVM_RM_RECORD))
+        get_cs().get_report_server().execute_report_message(report_message, "")
+
     # Function: print
     #
     # The uvm_report_server implements the `UVMObject.do_print()` such that
@@ -332,6 +631,8 @@ class UVMReportServer(UVMObject):
             database (UVMTrDatabase):
         """
         self.m_message_db = database
+        # Streams were opened from the previous database
+        self.m_streams = {}
 
     def get_message_database(self) -> UVMTrDatabase:
         """
@@ -361,11 +662,13 @@ class UVMReportServer(UVMObject):
             _str:
         """
         if file == 0:
-            self.logger(_str)
-            # print(_str)
+            self.m_display(_str)
         else:
             if not file.closed:
-                file.write(_str + "\n")
+                if self.m_sink is not None:
+                    self.m_sink.write(file, _str)
+                else:
+                    file.write(_str + "\n")
             else:
                 if self.print_on_closed_file:
                     self.logger('UVM_WARNING. File already closed for msg ' + _str)
@@ -378,6 +681,13 @@ class UVMReportServer(UVMObject):
         # Set the report server for this message
         report_message.set_report_server(self)
 
+        if self.m_throttle_rules and self.m_is_throttled(report_message):
+            self.m_suppress(report_message)
+            return
+        if self.collapse_duplicates and self.m_is_duplicate(report_message):
+            self.m_suppress(report_message)
+            return
+
         if report_ok is True:
             from .uvm_report_catcher import UVMReportCatcher
             report_ok = UVMReportCatcher.process_all_report_catchers(report_message)
@@ -426,9 +736,9 @@ class UVMReportServer(UVMObject):
             ro = report_message.get_report_object()
             rh = report_message.get_report_handler()
 
-            # Check for pre-existing stream TODO
-            #if (m_streams.exists(ro.get_name()) && (m_streams[ro.get_name()].exists(rh.get_name())))
-            #stream = m_streams[ro.get_name()][rh.get_name()]
+            # Check for pre-existing stream
+            if ro.get_name() in self.m_streams:
+                stream = self.m_streams[ro.get_name()].get(rh.get_name())
 
             # If no pre-existing stream (or for some reason pre-existing stream was ~null~)
             if stream is None:
@@ -444,6 +754,8 @@ class UVMReportServer(UVMObject):
                     # Open the stream.    Name=report object name, scope=report handler name, type=MESSAGES
                     stream = db.open_stream(ro.get_name(), rh.get_name(), "MESSAGES")
                     # Save off the openned stream
+                    if ro.get_name() not in self.m_streams:
+                        self.m_streams[ro.get_name()] = {}
                     self.m_streams[ro.get_name()][rh.get_name()] = stream
             if stream is not None:
                 recorder = stream.open_recorder(report_message.get_name(), None,report_message.get_type_name())
@@ -453,7 +765,7 @@ class UVMReportServer(UVMObject):
 
         # DISPLAY action
         if report_message.get_action() & UVM_DISPLAY:
-            self.logger(composed_message)
+            self.m_display(composed_message)
 
         # LOG action
         # if log is set we need to send to the file but not resend to the
@@ -476,12 +788,14 @@ class UVMReportServer(UVMObject):
 
         # Process the UVM_EXIT action
         if report_message.get_action() & UVM_EXIT:
+            self.flush()
             cs = get_cs()
             l_root = cs.get_root()
             l_root.die()
 
         # Process the UVM_STOP action
         if report_message.get_action() & UVM_STOP:
+            self.flush()
             raise Exception("$stop from uvm_report_server, msg: " +
                     report_message.sprint())
 
@@ -489,6 +803,7 @@ class UVMReportServer(UVMObject):
         """
         Constructs the actual string sent to the file or command line
         from the severity, component name, report id, and the message itself.
+        The layout is given by the template set with `set_message_format`.
 
         Expert users can overload this method to customize report formatting.
 
@@ -498,62 +813,42 @@ class UVMReportServer(UVMObject):
         Returns:
             str: Composed message as string.
         """
-        sev_string = ""
-        l_severity = UVM_INFO
-        l_verbosity = UVM_MEDIUM
-        filename_line_string = ""
-        time_str = ""
-        line_str = ""
-        context_str = ""
-        verbosity_str = ""
-        terminator_str = ""
-        msg_body_str = ""
-        el_container = None
-        prefix = ""
-        l_report_handler = None
-
-        l_severity = report_message.get_severity()
-        sev_string = ename(l_severity)
-
-        if report_message.get_filename() != "":
-            line_str = str(report_message.get_line())
-            filename_line_string = report_message.get_filename() + "(" + line_str + ") "
-
-        # Make definable in terms of units.
-        #$swrite(time_str, "%0t", $time)
-        #time_str = get_sim_time('ns') TODO
-        time_str = str(uvm_sim_time('NS')) + 'NS'
-
-        if report_message.get_context() != "":
-            context_str = "@@" + report_message.get_context()
-
-        if self.show_verbosity is True:
-            verb = report_message.get_verbosity()
-            verbosity_str = "(" + verb + ")"
-
-        if self.show_terminator is True:
-            terminator_str = " -" + sev_string
-
-        el_container = report_message.get_element_container()
-        if el_container.size() == 0:
-            msg_body_str = report_message.get_message()
-        else:
-            prefix = uvm_default_printer.knobs.prefix
-            uvm_default_printer.knobs.prefix = " +"
-            msg_body_str = report_message.get_message() + "\n" + el_container.sprint()
-            uvm_default_printer.knobs.prefix = prefix
-
-        if report_object_name == "":
-            l_report_handler = report_message.get_report_handler()
-            if l_report_handler is not None:
-                report_object_name = l_report_handler.get_full_name()
-            else:
-                report_object_name = "NO_REPORT_OBJECT"
+        return self.m_compose(self, report_message, report_object_name)
+
+    def set_message_format(self, template: str = DEFAULT_MESSAGE_FORMAT) -> None:
+        """
+        Sets the layout of composed messages as a `str.format` template. The
+        template is compiled once into a function, which computes only the
+        fields used by the template. Available fields are:
+
+        - severity: Severity name, e.g. UVM_INFO
+        - verbosity: "(verbosity)" if `show_verbosity` is set, otherwise ""
+        - filename_line: "filename(line) " or "" if there is no filename
+        - filename, line: File name and line of the message
+        - time: Simulation time, e.g. 100NS
+        - name: Full name of the report object
+        - context: "@@context" or "" if there is no context
+        - id: Message ID
+        - message: Message body, including the message elements
+        - terminator: " -severity" if `show_terminator` is set, otherwise ""
+
+        The default template produces the standard UVM message layout.
+
+        Args:
+            template (str): Message template.
+        Raises:
+            Exception: If the template contains unknown fields or
+                conversions, or nested fields in a format spec.
+        """
+        self.m_compose = _compile_message_format(template)
+        self.m_message_format = template
 
-        result = (sev_string + verbosity_str + " " + filename_line_string
-            + "@ " + time_str + ": " + report_object_name + context_str
-            + " [" + report_message.get_id() + "] " + msg_body_str + terminator_str)
-        return result
+    def get_message_format(self) -> str:
+        """
+        Returns:
+            str: Template set with `set_message_format`.
+        """
+        return self.m_message_format
 
 
     def report_summarize(self, file=0) -> None:
@@ -564,8 +859,10 @@ class UVMReportServer(UVMObject):
 
         The `UVMRoot.run_test` method in `UVMRoot` calls this method.
         """
+        self.m_flush_duplicates()
         rpt = self.get_summary_string()
         uvm_info("UVM/REPORT/SERVER", rpt, UVM_LOW)
+        self.flush()
 
     def get_summary_string(self) -> str:
         """
@@ -596,6 +893,15 @@ class UVMReportServer(UVMObject):
             q.append("** Report counts by id\n")
             for id in self.m_id_count.keys():
                 q.append("[{}] {}\n".format(id, self.m_id_count.get(id)))
+
+        if len(self.m_suppressed_count) > 0:
+            q.append("** Suppressed report counts by id\n")
+            for (id, sev) in self.m_suppressed_count:
+                q.append("[{}] {} : {}\n".format(id, ename(sev),
+                    self.m_suppressed_count[(id, sev)]))
+
+        if UVMReportProfiler.m_inst is not None:
+            q.append(UVMReportProfiler.m_inst.get_summary_string())
         return "".join(q)
 
 
@@ -0,0 +1,232 @@
+#//
+#//------------------------------------------------------------------------------
+#//   Copyright 2020 Tuomas Poikela (tpoikela)
+#//   All Rights Reserved Worldwide
+#//
+#//   Licensed under the Apache License, Version 2.0 (the
+#//   "License"); you may not use this file except in
+#//   compliance with the License.  You may obtain a copy of
+#//   the License at
+#//
+#//       http://www.apache.org/licenses/LICENSE-2.0
+#//
+#//   Unless required by applicable law or agreed to in
+#//   writing, software distributed under the License is
+#//   distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+#//   CONDITIONS OF ANY KIND, either express or implied.  See
+#//   the License for the specific language governing
+#//   permissions and limitations under the License.
+#//------------------------------------------------------------------------------
+"""
+Buffered, asynchronous output for composed report messages.
+
+Not part of SV UVM. By default, `UVMReportServer` writes each message
+synchronously, which makes the simulation wall time depend on the latency of
+the terminal or disk. When a `UVMReportSink` is set with
+`UVMReportServer.set_report_sink`, messages are queued into a bounded
+in-memory ring, and a background thread writes them in large coalesced
+chunks::
+
+    srv = UVMReportServer.get_server()
+    srv.set_report_sink(UVMReportSink(capacity=8192))
+
+    # Per-ID log file, compressed with gzip
+    fh = UVMReportSink.open_file("bus_errors.log.gz")
+    uvm_top.set_report_id_file("BUS_ERR", fh)
+
+The sink is flushed on `UVM_EXIT`, in `UVMReportServer.report_summarize`
+and at process exit.
+"""
+
+import atexit
+import bz2
+import gzip
+import lzma
+import sys
+import threading
+from collections import deque
+from typing import Any, Deque, Optional, Tuple
+
+
+class UVMReportSink:
+    """
+    Bounded ring of composed messages, drained by a background writer thread.
+
+    Messages are written in the order they were queued. Consecutive messages
+    to the same target are joined into a single write. When the ring is full,
+    `write` blocks until the writer has drained it. Messages to a stream
+    which is closed before they are written are counted in `dropped` and
+    kept until `take_dropped` is called.
+
+    Args:
+        capacity (int): Max number of queued messages.
+        stdout: Stream used for messages targeted to file handle 0. Defaults
+            to `sys.stdout` at the time of writing.
+    """
+
+    # Compressed stream openers by name, selectable in `open_file`
+    COMPRESSORS = {
+        "gzip": gzip.open,
+        "bz2": bz2.open,
+        "lzma": lzma.open,
+    }
+    EXTENSIONS = {".gz": "gzip", ".bz2": "bz2", ".xz": "lzma", ".lzma": "lzma"}
+
+    def __init__(self, capacity=4096, stdout=None):
+        if capacity <= 0:
+            raise ValueError("UVMReportSink capacity must be > 0. Got: " + str(capacity))
+        self.capacity = capacity
+        self.stdout = stdout
+        self.m_ring: Deque[Tuple[Any, str]] = deque()
+        self.m_cond = threading.Condition()
+        self.m_busy = False
+        self.m_closed = False
+        self.m_files = set()  # Streams written by this sink, flushed on flush()
+        self.dropped = 0  # Number of messages to closed streams
+        self.m_dropped: Deque[str] = deque()  # Not yet taken with take_dropped()
+        self.m_thread = threading.Thread(target=self._writer_loop,
+            name="uvm_report_sink", daemon=True)
+        self.m_thread.start()
+        atexit.register(self.close)
+
+    @classmethod
+    def open_file(cls, filename, compress: Optional[str] = None, mode="wt"):
+        """
+        Opens a text stream usable with `set_report_*_file` methods. The stream
+        is compressed if `compress` is one of `COMPRESSORS`, or if it is
+        None and the filename has a known extension (.gz, .bz2, .xz).
+
+        Args:
+            filename (str): Name of the log file.
+            compress (str): "gzip", "bz2", "lzma", "none" or None.
+            mode (str): Open mode, "wt" or "at".
+        Returns:
+            TextIO: Writable text stream.
+        Raises:
+            ValueError: If compression method is unknown.
+        """
+        if compress is None:
+            for ext in cls.EXTENSIONS:
+                if filename.endswith(ext):
+                    compress = cls.EXTENSIONS[ext]
+                    break
+        if compress is None or compress == "none":
+            return open(filename, mode)
+        if compress not in cls.COMPRESSORS:
+            raise ValueError("Unknown compression for report file: " + str(compress))
+        return cls.COMPRESSORS[compress](filename, mode)
+
+    def write(self, target, msg: str) -> None:
+        """
+        Queues a composed message for writing.
+
+        Args:
+            target: 0 for stdout, otherwise a writable text stream.
+            msg (str): Message, without the trailing newline.
+        """
+        with self.m_cond:
+            if self.m_closed:
+                self.m_files.update(self._write_batch([(target, msg)]))
+                return
+            while len(self.m_ring) >= self.capacity:
+                self.m_cond.notify_all()
+                self.m_cond.wait()
+            self.m_ring.append((target, msg))
+            if len(self.m_ring) == 1:
+                self.m_cond.notify_all()
+
+    def flush(self) -> None:
+        """
+        Blocks until all queued messages have been written, and flushes the
+        written streams.
+        """
+        with self.m_cond:
+            if self.m_closed:
+                return
+            self.m_cond.notify_all()
+            while len(self.m_ring) > 0 or self.m_busy:
+                self.m_cond.wait()
+            files = list(self.m_files)
+        for f in files:
+            if not f.closed:
+                f.flush()
+
+    def take_dropped(self) -> list:
+        """
+        Returns the messages dropped because their stream was closed before
+        they were written, and forgets them.
+
+        Returns:
+            list: Dropped messages, in the order they were queued.
+        """
+        msgs = []
+        while len(self.m_dropped) > 0:
+            msgs.append(self.m_dropped.popleft())
+        return msgs
+
+    def close(self) -> None:
+        """
+        Flushes all queued messages and stops the writer thread. Messages
+        written after closing are written synchronously.
+        """
+        if self.m_closed:
+            return
+        self.flush()
+        with self.m_cond:
+            self.m_closed = True
+            self.m_cond.notify_all()
+        self.m_thread.join()
+        atexit.unregister(self.close)
+
+    def _writer_loop(self) -> None:
+        while True:
+            with self.m_cond:
+                while len(self.m_ring) == 0 and not self.m_closed:
+                    self.m_cond.wait()
+                if len(self.m_ring) == 0 and self.m_closed:
+                    return
+                batch = self.m_ring
+                self.m_ring = deque()
+                self.m_busy = True
+                # Producers waiting for space can continue
+                self.m_cond.notify_all()
+            written = set()
+            try:
+                written = self._write_batch(batch)
+            except Exception as ex:  # Keep draining, or producers would block
+                sys.stderr.write("UVMReportSink: write failed: " + str(ex) + "\n")
+            finally:
+                with self.m_cond:
+                    self.m_files.update(written)
+                    self.m_busy = False
+                    self.m_cond.notify_all()
+
+    def _write_batch(self, batch) -> set:
+        """ Writes consecutive messages to the same target with one write.
+        Returns the set of streams written. """
+        written = set()
+        chunk = []
+        target = None
+        for (t, msg) in batch:
+            if t != target and len(chunk) > 0:
+                written.add(self._write_chunk(target, chunk))
+                chunk = []
+            target = t
+            chunk.append(msg)
+        if len(chunk) > 0:
+            written.add(self._write_chunk(target, chunk))
+        written.discard(None)
+        return written
+
+    def _write_chunk(self, target, chunk):
+        chunk.append("")
+        if target == 0:
+            out = self.stdout if self.stdout is not None else sys.stdout
+        else:
+            out = target
+        if out.closed:
+            self.dropped += len(chunk) - 1
+            self.m_dropped.extend(chunk[:-1])
+            return None
+        out.write("\n".join(chunk))
+        return out
@@ -94,15 +94,20 @@ safe.
 class object.
 """
 
+import re
+from array import array
+from collections import deque
+from functools import lru_cache
+
 from cocotb.triggers import Event
 
 from .uvm_object import UVMObject
-from .sv import sv, uvm_re_match, uvm_glob_to_re, wait
+from .sv import sv, uvm_glob_to_re, wait
 from ..uvm_macros import uvm_typename
 from ..macros import uvm_info
 from .uvm_globals import (uvm_report_error, uvm_report_warning)
 from .uvm_object_globals import UVM_NONE
-from .uvm_spell_chkr import UVMSpellChkr
+from .uvm_spell_chkr import UVMSpellChkr, UVMSpellIndex
 from .uvm_pool import UVMPool
 from .uvm_printer import UVMLinePrinter
 from .uvm_queue import UVMQueue
@@ -152,6 +157,11 @@ UVM_USE_RESOURCE_CONVERTER = False
 PRI_HIGH = 0
 PRI_LOW = 1
 
+# Not part of SV UVM. Policies for modifying a frozen UVMResourcePool,
+# see UVMResourcePool.freeze
+FREEZE_THAW = 0
+FREEZE_ERROR = 1
+
 
 class Access_t:
     def __init__(self):
@@ -180,10 +190,25 @@ class UVMResourceOptions:
        spent collecting and storing auditing information.  Of course,
        during the period when auditing is off no audit trail information
        is available
+
+    Options not part of SV UVM:
+
+     * get history: on/off. When off, the get records of
+       `UVMResourcePool` are not stored, but gets are still counted per
+       (scope, name) while auditing is on. Default is on.
+
+     * max get records: Number of get records kept (0 = unbounded).
+       Older records are dropped when the limit is reached. Default is 0.
+
+     * accessor records: on/off. When off, resources count reads and
+       writes but do not keep a record per accessor. Default is on.
     """
 
 
     auditing = True
+    get_history = True
+    max_get_records = 0
+    accessor_records = True
 
     @classmethod
     def turn_on_auditing(cls):
@@ -197,6 +222,44 @@ class UVMResourceOptions:
     def is_auditing(cls):
         return UVMResourceOptions.auditing
 
+    @classmethod
+    def turn_on_get_history(cls):
+        UVMResourceOptions.get_history = True
+
+    @classmethod
+    def turn_off_get_history(cls):
+        UVMResourceOptions.get_history = False
+
+    @classmethod
+    def is_recording_get_history(cls):
+        return UVMResourceOptions.get_history
+
+    @classmethod
+    def set_max_get_records(cls, max_records):
+        """
+        Sets the number of get records kept by the resource pool.
+
+        Args:
+            max_records (int): Max number of records (0 = unbounded).
+        """
+        UVMResourceOptions.max_get_records = max_records
+
+    @classmethod
+    def get_max_get_records(cls):
+        return UVMResourceOptions.max_get_records
+
+    @classmethod
+    def turn_on_accessor_records(cls):
+        UVMResourceOptions.accessor_records = True
+
+    @classmethod
+    def turn_off_accessor_records(cls):
+        UVMResourceOptions.accessor_records = False
+
+    @classmethod
+    def is_recording_accessors(cls):
+        return UVMResourceOptions.accessor_records
+
 
 class get_t:
     def __init(self):
@@ -214,6 +277,35 @@ class get_t:
 #----------------------------------------------------------------------
 
 
+# Characters which make a scope a regular expression, see set_scope()
+_SCOPE_RE_CHARS = frozenset("\\^$*+?{}[]()|/")
+
+
+@lru_cache(maxsize=4096)
+def m_compile_scope(s):
+    """
+    Converts a glob or regex scope `s` for matching with `re.search`
+    semantics. Scopes without wildcards or regex characters are returned as
+    literals to be matched as substrings. Leading and trailing '*' do not
+    change the result of the search, so globs like "top.env.*" are literals
+    too. Results are cached, as the same scope is often used by many
+    resources.
+
+    Args:
+        s (str): Glob or regex (/re/) scope.
+    Returns:
+        tuple: (scope as regex, literal or None, compiled regex or None)
+    """
+    scope = uvm_glob_to_re(s)
+    if scope == ".*" or scope == "":
+        return (scope, "", None)  # Matches all scopes
+    if scope[0] != "/":
+        lit = s.strip("*")
+        if not any(c in _SCOPE_RE_CHARS for c in lit):
+            return (scope, lit, None)
+    return (scope, None, re.compile(scope))
+
+
 class UVMResourceBase(UVMObject):
 
     #// variable: default_precedence
@@ -224,6 +316,14 @@ class UVMResourceBase(UVMObject):
     #//
     default_precedence = 1000
 
+    # Max number of memoized match_scope() results per resource
+    max_scope_matches = 64
+
+    # Incremented when the scope of an existing resource changes
+    m_scope_gen = 0
+    # Incremented when the scope or precedence of a resource changes
+    m_lookup_gen = 0
+
     def __init__(self, name="", s="*"):
         """
         Function: new
@@ -245,16 +345,29 @@ class UVMResourceBase(UVMObject):
         self.modified = False
         self.read_only = False
         self.access = {}  # uvm_resource_types::access_t access[string]
+        self.m_read_count = 0  # Reads and writes of all accessors
+        self.m_write_count = 0
         # variable: precedence
         #
         # This variable is used to associate a precedence that a resource
         # has with respect to other resources which match the same scope
         # and name. Resources are set to the <default_precedence> initially,
         # and may be set to a higher or lower precedence as desired.
-        self.precedence = UVMResourceBase.default_precedence
+        self.m_precedence = UVMResourceBase.default_precedence
         self.event_modified = Event(name + '_' + 'event_modified')
         self.modified = False
 
+    @property
+    def precedence(self):
+        return self.m_precedence
+
+    @precedence.setter
+    def precedence(self, precedence):
+        # Not part of SV UVM. Invalidates stored lookup results
+        self.m_precedence = precedence
+        UVMResourceBase.m_lookup_gen += 1
+        UVMResourcePool.m_generation += 1
+
     def get_type_handle(self):
         """
         Function: get_type_handle
@@ -406,11 +519,18 @@ class UVMResourceBase(UVMObject):
         argument is a glob it will be converted to a regular expression
         before it is stored.
 
+        The scope is also compiled here for `match_scope`, see
+        `m_compile_scope`.
+
         Args:
             s:
         """
-        scope = uvm_glob_to_re(s)
-        self.scope = scope
+        if hasattr(self, "m_scope_matches"):
+            UVMResourceBase.m_scope_gen += 1
+            UVMResourceBase.m_lookup_gen += 1
+            UVMResourcePool.m_generation += 1
+        (self.scope, self.m_scope_literal, self.m_scope_rex) = m_compile_scope(s)
+        self.m_scope_matches = {}
 
     def get_scope(self):
         """
@@ -434,8 +554,15 @@ class UVMResourceBase(UVMObject):
             s:
         Returns:
         """
-        err = uvm_re_match(self.scope, s)
-        return (err == 0)
+        if self.m_scope_literal is not None:
+            return self.m_scope_literal in s
+        matched = self.m_scope_matches.get(s)
+        if matched is None:
+            if len(self.m_scope_matches) >= UVMResourceBase.max_scope_matches:
+                self.m_scope_matches = {}
+            matched = self.m_scope_rex.search(s) is not None
+            self.m_scope_matches[s] = matched
+        return matched
 
     #//----------------
     #// Group: Priority
@@ -527,6 +654,10 @@ class UVMResourceBase(UVMObject):
         if not UVMResourceOptions.is_auditing():
             return
 
+        self.m_read_count += 1
+        if not UVMResourceOptions.accessor_records:
+            return
+
         # If an accessor is supplied, then use its name
         # as the database entry for the accessor record.
         #  Otherwise, use "<empty>" as the database entry.
@@ -560,6 +691,9 @@ class UVMResourceBase(UVMObject):
         # first that auditing is turned on
         if UVMResourceOptions.is_auditing():
             if accessor is not None:
+                self.m_write_count += 1
+                if not UVMResourceOptions.accessor_records:
+                    return
                 access_record = None  # uvm_resource_types::access_t
                 _str = accessor.get_full_name()
                 if _str in self.access:
@@ -572,32 +706,28 @@ class UVMResourceBase(UVMObject):
                 self.access[_str] = access_record
 
 
-    #// Function: print_accessors
-    #//
-    #// Dump the access records for this resource
-    #//
-    #virtual function void print_accessors()
-
-    #  string str
-    #  uvm_component comp
-    #  uvm_resource_types::access_t access_record
-    #  string qs[$]
-    #
-    #  if(access.num() == 0)
-    #    return
-
-    #  foreach (access[i]):
-    #    str = i
-    #    access_record = access[str]
-    #    qs.push_back($sformatf("%s reads: %0d @ %0t  writes: %0d @ %0t\n",str,
-    #             access_record.read_count,
-    #             access_record.read_time,
-    #             access_record.write_count,
-    #             access_record.write_time))
-    #  end
-    #  `uvm_info("UVM/RESOURCE/ACCESSOR",`UVM_STRING_QUEUE_STREAMING_PACK(qs),UVM_NONE)
+    def print_accessors(self):
+        """
+        Function: print_accessors
 
-    #endfunction
+        Dump the access records for this resource. If accessor records are
+        turned off, only the total reads and writes are printed.
+        """
+        qs = []
+        if len(self.access) == 0:
+            if self.m_read_count == 0 and self.m_write_count == 0:
+                return
+            qs.append(sv.sformatf("<all> reads: %0d  writes: %0d\n",
+                self.m_read_count, self.m_write_count))
+
+        for _str in self.access:
+            access_record = self.access[_str]
+            qs.append(sv.sformatf("%s reads: %0d @ %0t  writes: %0d @ %0t\n", _str,
+                access_record.read_count,
+                access_record.read_time,
+                access_record.write_count,
+                access_record.write_time))
+        uvm_info("UVM/RESOURCE/ACCESSOR", "".join(qs), UVM_NONE)
 
     def init_access_record(self, access_record):
         """
@@ -822,6 +952,7 @@ class UVMResource(UVMResourceBase):
         # set the value and set the dirty bit
         self.val = t
         self.modified = True
+        UVMResourcePool.m_generation += 1
         self.event_modified.set()
 
     #//----------------
@@ -964,14 +1095,109 @@ class UVMResource(UVMResourceBase):
 #//----------------------------------------------------------------------
 
 
+class UVMScopeIndex:
+    """
+    Not part of SV UVM. Index of the scopes of a queue of resources in
+    `UVMResourcePool`, either one name queue or all resources.
+
+    Literal scopes (see `UVMResourceBase.set_scope`) containing a '.' are
+    stored in a trie keyed on their path components. Because scopes are
+    matched as substrings, the first component of a literal may match the end
+    of a path component and the last one the start of a path component. All
+    other scopes (regexes and literals without a '.') are kept in a side list
+    and matched with `UVMResourceBase.match_scope`.
+    """
+
+    def __init__(self, rq):
+        """
+        Args:
+            rq (list): Resource queue to index.
+        """
+        self.rq = rq
+        self.m_len = len(rq)
+        self.m_gen = UVMResourceBase.m_scope_gen
+        self.m_root = {}  # First component -> node
+        self.m_side = []  # Positions of resources not in the trie
+        for i in range(len(rq)):
+            lit = rq[i].m_scope_literal
+            if lit is None or "." not in lit:
+                self.m_side.append(i)
+                continue
+            comps = lit.split(".")
+            node = self.m_root.get(comps[0])
+            if node is None:
+                node = self.m_root[comps[0]] = ({}, [])
+            for comp in comps[1:-1]:
+                children = node[0]
+                node = children.get(comp)
+                if node is None:
+                    node = children[comp] = ({}, [])
+            node[1].append((comps[-1], i))
+
+    def lookup(self, scope):
+        """
+        Finds resources visible in the given scope.
+
+        Args:
+            scope (str): Scope to match.
+        Returns:
+            list: Positions of matching resources in the queue, in order.
+        """
+        rq = self.rq
+        res = set(i for i in self.m_side if rq[i].match_scope(scope))
+        comps = scope.split(".")
+        ncomps = len(comps)
+        for j in range(ncomps - 1):
+            comp = comps[j]
+            for (key, node) in self.m_root.items():
+                if not comp.endswith(key):
+                    continue
+                k = j + 1
+                while True:
+                    (children, leaves) = node
+                    comp_k = comps[k]
+                    for (last, i) in leaves:
+                        if comp_k.startswith(last):
+                            res.add(i)
+                    k += 1
+                    if k == ncomps:
+                        break
+                    node = children.get(comp_k)
+                    if node is None:
+                        break
+        return sorted(res)
+
+
 class UVMResourcePool:
 
     rp = None
 
+    # Name queues shorter than this are scanned without a scope index
+    min_indexed_queue = 8
+
+    # Incremented whenever the result of a lookup may change. Used to
+    # validate lookup caches, see UVMConfigDb.get.
+    m_generation = 0
+
     def __init__(self):
         self.rtab = UVMPool()
         self.ttab = {}
         self.get_record = []  # History of gets
+        # Aggregated gets per (scope, name), see push_get_record
+        self.m_get_stats_index = {}  # (scope, name) -> index into arrays
+        self.m_get_success = array('L')
+        self.m_get_fail = array('L')
+        self.m_get_last_time = array('d')
+        self.m_scope_index = {}  # name -> UVMScopeIndex
+        self.m_spell_index = UVMSpellIndex()  # Names of rtab for spell_check
+        self.m_rtab_gen = 0  # Incremented when any name queue changes
+        self.m_flat_index = None  # (m_rtab_gen, UVMScopeIndex) for lookup_scope
+        self.m_frozen = False
+        self.m_freeze_policy = FREEZE_THAW
+        self.m_snapshot_gen = 0  # UVMResourceBase.m_lookup_gen of the snapshot
+        self.m_name_snapshot = {}  # (scope, name, type_handle) -> get_by_name()
+        self.m_name_q_snapshot = {}  # (scope, name, type_handle) -> lookup_name()
+        self.m_scope_snapshot = {}  # scope -> lookup_scope()
 
     @classmethod
     def get(cls):
@@ -991,12 +1217,12 @@ class UVMResourcePool:
 
         Invokes the spell checker for a string s.  The universe of
         correctly spelled strings -- i.e. the dictionary -- is the name
-        map.
+        map, indexed in a `UVMSpellIndex`.
         Args:
             s:
         Returns:
         """
-        return UVMSpellChkr.check(self.rtab, s)
+        return UVMSpellChkr.check(self.m_spell_index, s)
 
     #-----------
     # Group: Set
@@ -1032,6 +1258,8 @@ class UVMResourcePool:
         # If resource handle is ~None~ then there is nothing to do.
         if rsrc is None:
             return
+        if self.m_frozen:
+            self.m_modify_frozen("set resource " + rsrc.get_name())
         # insert into the name map.  Resources with empty names are
         # anonymous resources and are not entered into the name map
         name = rsrc.get_name()
@@ -1050,6 +1278,10 @@ class UVMResourcePool:
             rq.append(rsrc)
 
         self.rtab[name] = rq
+        self.m_spell_index.add(name)
+        self.m_scope_index.pop(name, None)
+        self.m_rtab_gen += 1
+        UVMResourcePool.m_generation += 1
 
         # insert into the type map
         type_handle = rsrc.get_type_handle()
@@ -1068,6 +1300,97 @@ class UVMResourcePool:
         self.ttab[type_handle] = rq
 
 
+    def m_set_bulk(self, created, moved):
+        """
+        Updates the pool as if each resource in `created` was set with
+        `NAME_OVERRIDE`, interleaved with priority changes of resources in
+        `moved` to `PRI_HIGH` with `set_priority_name`. Used by
+        `UVMConfigDb.set_bulk`.
+
+        Args:
+            created (list): New resources in the order they were created.
+            moved (dict): Resource name -> resources in the order of their
+                last priority change. A resource in `created` and `moved`
+                was moved after its creation.
+        """
+        if self.m_frozen:
+            self.m_modify_frozen("set resources")
+        by_name = {}
+        for rsrc in created:
+            name = rsrc.get_name()
+            if name not in by_name:
+                by_name[name] = []
+            by_name[name].append(rsrc)
+            type_handle = rsrc.get_type_handle()
+            if type_handle not in self.ttab:
+                self.ttab[type_handle] = []
+            self.ttab[type_handle].append(rsrc)
+
+        # Names are added to the name map in the order of first creation
+        for name in list(by_name) + [n for n in moved if n not in by_name]:
+            new_q = by_name.get(name, [])
+            moved_q = moved.get(name, [])
+            if name not in self.rtab:
+                self.rtab[name] = []
+                self.m_spell_index.add(name)
+            rq = self.rtab[name]
+            moved_set = set(moved_q)
+            queued = set(rq).union(new_q)
+            for rsrc in moved_q:
+                if rsrc not in queued:
+                    self.set_priority_name(rsrc, PRI_HIGH)  # Reports the error
+            rq[:] = ([r for r in reversed(new_q) if r not in moved_set]
+                + [r for r in rq if r not in moved_set]
+                + [r for r in moved_q if r in queued])
+            self.m_scope_index.pop(name, None)
+        self.m_rtab_gen += 1
+        UVMResourcePool.m_generation += 1
+
+    #--------------
+    # Group: Freeze
+    #--------------
+
+    def freeze(self, policy=FREEZE_THAW):
+        """
+        Not part of SV UVM. Freezes the pool, typically after
+        end_of_elaboration when the configuration does not change anymore.
+        The results of `lookup_name`, `lookup_regex_names`, `get_by_name`
+        and `lookup_scope` are then stored on first query, and later queries
+        with the same arguments return the stored results.
+
+        If the pool is modified while frozen, it is thawed with policy
+        `FREEZE_THAW` and an exception is raised with `FREEZE_ERROR`.
+        Changing the scope or the precedence of a resource clears the stored
+        results, so lookups always match the unfrozen pool.
+
+        Args:
+            policy (int): FREEZE_THAW or FREEZE_ERROR
+        """
+        self.m_frozen = True
+        self.m_freeze_policy = policy
+        self.m_clear_snapshot()
+
+    def thaw(self):
+        """
+        Not part of SV UVM. Unfreezes the pool, see `freeze`.
+        """
+        self.m_frozen = False
+        self.m_clear_snapshot()
+
+    def is_frozen(self):
+        return self.m_frozen
+
+    def m_clear_snapshot(self):
+        self.m_snapshot_gen = UVMResourceBase.m_lookup_gen
+        self.m_name_snapshot = {}
+        self.m_name_q_snapshot = {}
+        self.m_scope_snapshot = {}
+
+    def m_modify_frozen(self, what):
+        if self.m_freeze_policy == FREEZE_ERROR:
+            raise Exception("Cannot " + what + ", the resource pool is frozen")
+        self.thaw()
+
     #// Function: set_override
     #//
     #// The resource provided as an argument will be entered into the pool
@@ -1118,36 +1441,76 @@ class UVMResourcePool:
         if not UVMResourceOptions.is_auditing():
             return
 
+        t = sv.realtime()
+        key = (scope, name)
+        idx = self.m_get_stats_index.get(key)
+        if idx is None:
+            idx = len(self.m_get_success)
+            self.m_get_stats_index[key] = idx
+            self.m_get_success.append(0)
+            self.m_get_fail.append(0)
+            self.m_get_last_time.append(0)
+        if rsrc is not None:
+            self.m_get_success[idx] += 1
+        else:
+            self.m_get_fail[idx] += 1
+        self.m_get_last_time[idx] = t
+
+        if not UVMResourceOptions.get_history:
+            return
+
+        max_records = UVMResourceOptions.max_get_records
+        if max_records > 0:
+            if not isinstance(self.get_record, deque) or self.get_record.maxlen != max_records:
+                self.get_record = deque(self.get_record, max_records)
+        elif isinstance(self.get_record, deque):
+            self.get_record = list(self.get_record)
+
         impt = get_t()
 
         impt.name  = name
         impt.scope = scope
         impt.rsrc  = rsrc
-        impt.t     = sv.realtime()
+        impt.t     = t
 
         self.get_record.append(impt)
         #endfunction
 
-    #// function - dump_get_records
-    #//
-    #// Format and print the get history list.
-    #function void dump_get_records()
-
-        #  get_t record
-        #  bit success
-        #  string qs[$]
-
-        #  qs.push_back("--- resource get records ---\n")
-        #  foreach (get_record[i]):
-        #    record = get_record[i]
-        #    success = (record.rsrc != None)
-        #    qs.push_back($sformatf("get: name=%s  scope=%s  %s @ %0t\n",
-        #             record.name, record.scope,
-        #             ((success)?"success":"fail"),
-        #             record.t))
-        #  end
-        #  `uvm_info("UVM/RESOURCE/GETRECORD",`UVM_STRING_QUEUE_STREAMING_PACK(qs),UVM_NONE)
-        #endfunction
+    def get_get_stats(self, scope, name):
+        """
+        Not part of SV UVM. Returns the number of gets for `name` in `scope`
+        while auditing was on, including gets whose records were dropped.
+
+        Args:
+            scope (str): Scope of the get.
+            name (str): Name of the get.
+        Returns:
+            tuple: (successful gets, failed gets)
+        """
+        idx = self.m_get_stats_index.get((scope, name))
+        if idx is None:
+            return (0, 0)
+        return (self.m_get_success[idx], self.m_get_fail[idx])
+
+    def dump_get_records(self):
+        """
+        function - dump_get_records
+
+        Format and print the get history list, followed by the gets
+        aggregated per (scope, name).
+        """
+        qs = ["--- resource get records ---\n"]
+        for record in self.get_record:
+            success = record.rsrc is not None
+            qs.append(sv.sformatf("get: name=%s  scope=%s  %s @ %0t\n",
+                record.name, record.scope,
+                "success" if success else "fail", record.t))
+        qs.append("--- resource gets per scope and name ---\n")
+        for ((scope, name), idx) in self.m_get_stats_index.items():
+            qs.append(sv.sformatf("get: name=%s  scope=%s  success: %0d  fail: %0d  last @ %0t\n",
+                name, scope, self.m_get_success[idx], self.m_get_fail[idx],
+                self.m_get_last_time[idx]))
+        uvm_info("UVM/RESOURCE/GETRECORD", "".join(qs), UVM_NONE)
 
 
     #--------------
@@ -1187,10 +1550,7 @@ class UVMResourcePool:
             rpterr:
         Returns:
         """
-        rq = list()
         q = list()
-        # rsrc = None
-        r = None
 
         # ensure rand stability during lookup
         # process p = process::self()
@@ -1210,7 +1570,27 @@ class UVMResourcePool:
                 self.spell_check(name)
             return q
 
+        if self.m_frozen:
+            if self.m_snapshot_gen != UVMResourceBase.m_lookup_gen:
+                self.m_clear_snapshot()
+            key = (scope, name, type_handle)
+            rq = self.m_name_q_snapshot.get(key)
+            if rq is None:
+                rq = tuple(self.m_lookup_name(scope, name, type_handle))
+                self.m_name_q_snapshot[key] = rq
+            return list(rq)
+        return self.m_lookup_name(scope, name, type_handle)
+
+    def m_lookup_name(self, scope, name, type_handle):
+        q = []
         rq = self.rtab[name]
+        if len(rq) >= UVMResourcePool.min_indexed_queue:
+            for i in self.m_get_scope_index(name, rq).lookup(scope):
+                r = rq[i]
+                if type_handle is None or (r.get_type_handle() == type_handle):
+                    q.append(r)
+            return q
+
         for i in range(0, len(rq)):
             r = rq[i]
             # does the type and scope match?
@@ -1220,6 +1600,24 @@ class UVMResourcePool:
 
         return q
 
+    def m_get_scope_index(self, name, rq):
+        """
+        Returns the scope index of a name queue, creating it if the queue or
+        the scope of any resource has changed.
+
+        Args:
+            name (str): Resource name.
+            rq (list): Name queue of `name`.
+        Returns:
+            UVMScopeIndex: Index of `rq`.
+        """
+        index = self.m_scope_index.get(name)
+        if (index is None or index.rq is not rq or index.m_len != len(rq)
+                or index.m_gen != UVMResourceBase.m_scope_gen):
+            index = UVMScopeIndex(rq)
+            self.m_scope_index[name] = index
+        return index
+
     def get_highest_precedence(self, q):
         """
         Function: get_highest_precedence
@@ -1315,13 +1713,21 @@ class UVMResourcePool:
         """
         q = []  # uvm_resource_types::rsrc_q_t q
         rsrc = None  # uvm_resource_base rsrc
-        q = self.lookup_name(scope, name, type_handle, rpterr)
-        #
-        if len(q) == 0:
-            self.push_get_record(name, scope, None)
-            return None
+        if self.m_frozen:
+            if self.m_snapshot_gen != UVMResourceBase.m_lookup_gen:
+                self.m_clear_snapshot()
+            key = (scope, name, type_handle)
+            if key in self.m_name_snapshot:
+                rsrc = self.m_name_snapshot[key]
+                self.push_get_record(name, scope, rsrc)
+                return rsrc
 
-        rsrc = self.get_highest_precedence(q)
+        q = self.lookup_name(scope, name, type_handle, rpterr)
+        if len(q) > 0:
+            rsrc = self.get_highest_precedence(q)
+        # Unknown names are not stored, so that rpterr still reports them
+        if self.m_frozen and name in self.rtab:
+            self.m_name_snapshot[key] = rsrc
         self.push_get_record(name, scope, rsrc)
         return rsrc
         #endfunction
@@ -1437,33 +1843,50 @@ class UVMResourcePool:
         `scope`, what resources are visible to it?  Locate all the resources
         that are visible to a particular scope.  This operation could be
         quite expensive, as it has to traverse all of the resources in the
-        database.
+        database. The resources are indexed by scope in a `UVMScopeIndex`,
+        which is rebuilt when resources are added or reordered.
         #function uvm_resource_types::rsrc_q_t lookup_scope(string scope)
         Args:
             scope:
         Returns:
         """
-        rq = None  # uvm_resource_types::rsrc_q_t rq
-        r = None  # uvm_resource_base r
-        i = 0
         q = UVMQueue()  # uvm_resource_types::rsrc_q_t q = new()
+        if self.m_frozen:
+            if self.m_snapshot_gen != UVMResourceBase.m_lookup_gen:
+                self.m_clear_snapshot()
+            if scope in self.m_scope_snapshot:
+                for r in self.m_scope_snapshot[scope]:
+                    q.push_back(r)
+                return q
+        index = self.m_get_flat_scope_index()
+        for i in index.lookup(scope):
+            q.push_back(index.rq[i])
+        if self.m_frozen:
+            self.m_scope_snapshot[scope] = tuple(q.queue)
+        return q
+
+    def m_get_flat_scope_index(self):
+        """
+        Returns a scope index of all resources in the order used by
+        `lookup_scope`, creating it if resources have been added, reordered
+        or their scopes changed.
+
+        Returns:
+            UVMScopeIndex: Index of all resources.
+        """
+        if self.m_flat_index is not None:
+            (rtab_gen, index) = self.m_flat_index
+            if rtab_gen == self.m_rtab_gen and index.m_gen == UVMResourceBase.m_scope_gen:
+                return index
+        rq = []
         # iterate in reverse order for the special case of autoconfig
         # of arrays. The array name with no [] needs to be higher priority.
         # This has no effect an manual accesses.
-        name = ""
-        if self.rtab.has_last():
-            name = self.rtab.last()
-            while True:
-                rq = self.rtab[name]
-                for i in range(len(rq)):
-                    r = rq[i]
-                    if r.match_scope(scope):
-                        q.push_back(r)
-                if self.rtab.has_prev():
-                    name = self.rtab.prev()
-                else:
-                    break
-        return q
+        for name in reversed(self.rtab.pool):
+            rq.extend(self.rtab[name])
+        index = UVMScopeIndex(rq)
+        self.m_flat_index = (self.m_rtab_gen, index)
+        return index
 
     #//--------------------
     #// Group: Set Priority
@@ -1511,7 +1934,12 @@ class UVMResourcePool:
             uvm_report_error("NORSRC", msg)
             return
 
+        if self.m_frozen:
+            self.m_modify_frozen("change priority of resource " + rsrc.get_name())
         q.pop(i)
+        self.m_scope_index.pop(rsrc.get_name(), None)
+        self.m_rtab_gen += 1
+        UVMResourcePool.m_generation += 1
 
         if pri == PRI_HIGH:
             q.append(rsrc)
@@ -1602,37 +2030,24 @@ class UVMResourcePool:
     #// Group: Debug
     #//--------------------------------------------------------------------
 
-    #// Function: find_unused_resources
-    #//
-    #// Locate all the resources that have at least one write and no reads
+    def find_unused_resources(self):
+        """
+        Function: find_unused_resources
 
-    #function uvm_resource_types::rsrc_q_t find_unused_resources()
+        Locate all the resources that have at least one write and no reads.
+        Uses the read and write counts of the resources, so it works also
+        when accessor records are turned off.
 
-    #  uvm_resource_types::rsrc_q_t rq
-    #  uvm_resource_types::rsrc_q_t q = new
-    #  int unsigned i
-    #  uvm_resource_base r
-    #  uvm_resource_types::access_t a
-    #  int reads
-    #  int writes
-
-    #  foreach (rtab[name]):
-    #    rq = rtab[name]
-    #    for(int i=0; i<rq.size(); ++i):
-    #      r = rq.get(i)
-    #      reads = 0
-    #      writes = 0
-    #      foreach(r.access[str]):
-    #        a = r.access[str]
-    #        reads += a.read_count
-    #        writes += a.write_count
-    #      end
-    #      if(writes > 0 && reads == 0)
-    #        q.push_back(r)
-    #    end
-    #  end
-    #  return q
-    #endfunction
+        Returns:
+            UVMQueue: Unused resources.
+        """
+        q = UVMQueue()
+        for name in self.rtab.keys():
+            rq = self.rtab[name]
+            for r in rq:
+                if r.m_write_count > 0 and r.m_read_count == 0:
+                    q.push_back(r)
+        return q
 
 
     #// Function: print_resources
@@ -1680,7 +2095,7 @@ class UVMResourcePool:
 
     def dump(self, audit=False):
         uvm_info("UVM/RESOURCE/DUMP","\n=== resource pool ===",UVM_NONE)
-        for name in self.rtab:
+        for name in self.rtab.keys():
             rq = self.rtab[name]
             self.print_resources(rq, audit)
         uvm_info("UVM/RESOURCE/DUMP","=== end of resource pool ===",UVM_NONE)
@@ -231,7 +231,7 @@ class UVMRoot(UVMComponent):
             test_name (str): Name of the test to run.
             dut: Handle to the DUT.
         """
-        uvm_debug(self, 'run_test', 'Called with testname |' + test_name + '|')
+        uvm_debug(self, 'run_test', lambda: 'Called with testname |' + test_name + '|')
         from .uvm_coreservice import UVMCoreService
         cs = UVMCoreService.get()
         factory = cs.get_factory()
@@ -258,12 +258,12 @@ class UVMRoot(UVMComponent):
         # overrides the argument.
         test_name_count = self.clp.get_arg_values("+UVM_TESTNAME=", test_names)
 
-        uvm_debug(self, 'run_test', 'Found testnames from cmdline: ' +
+        uvm_debug(self, 'run_test', lambda: 'Found testnames from cmdline: ' +
                 str(test_names))
         # If at least one, use first in queue.
         if test_name_count > 0:
             test_name = test_names[0]
-            uvm_debug(self, 'run_test', 'Found test name %s' % (test_name))
+            uvm_debug(self, 'run_test', 'Found test name %s', test_name)
             testname_plusarg = True
 
         # If multiple, provided the warning giving the number, which one will be
@@ -279,14 +279,14 @@ class UVMRoot(UVMComponent):
                 test_name_count, test_name, test_list), UVM_NONE)
 
         # if test now defined, create it using common factory
-        uvm_debug(self, 'run_test', 'Running now test ' + test_name)
+        uvm_debug(self, 'run_test', lambda: 'Running now test ' + test_name)
         if test_name != "":
             if "uvm_test_top" in self.m_children:
                 uvm_fatal("TTINST",
                     "An uvm_test_top already exists via a previous call to run_test")
             #0; // forces shutdown because $finish is forked
             await uvm_zero_delay()
-            uvm_debug(self, 'run_test', "factory.create in UVMRoot testname " + test_name)
+            uvm_debug(self, 'run_test', lambda: "factory.create in UVMRoot testname " + test_name)
 
             uvm_test_top = factory.create_component_by_name(test_name,
                 "", "uvm_test_top", None)
@@ -653,9 +653,14 @@ class UVMRoot(UVMComponent):
         Processes config value options set from cmdline:
           +uvm_set_config_int=
           +uvm_set_config_string=
+          +uvm_set_config_file= (not part of SV UVM, see UVMConfigDb.load_file)
         """
         args = []
 
+        self.clp.get_arg_matches("/^\\+(UVM_SET_CONFIG_FILE|uvm_set_config_file)=/", args)
+        for i in range(len(args)):
+            self.m_process_config_file(args[i][21:len(args[i])])
+
         self.clp.get_arg_matches("/^\\+(UVM_SET_CONFIG_INT|uvm_set_config_int)=/", args)
         for i in range(len(args)):
             self.m_process_config(args[i][20:len(args[i])], 1)
@@ -783,6 +788,22 @@ class UVMRoot(UVMComponent):
             UVMConfigDb.set(m_uvm_top, split_val[0], split_val[1], split_val[2])
 
 
+    def m_process_config_file(self, filename):
+        """
+        Applies config settings from a file given with +uvm_set_config_file=
+
+        Args:
+            filename (str): JSON file, see `UVMConfigDb.load_file`.
+        """
+        self.uvm_report_info("UVM_CMDLINE_PROC",
+            "Applying config settings from the command line: +uvm_set_config_file=" + filename,
+            UVM_NONE)
+        try:
+            UVMConfigDb.load_file(filename)
+        except Exception as e:
+            uvm_report_error("UVM_CMDLINE_PROC", "Invalid +uvm_set_config_file="
+                + filename + ": " + str(e), UVM_NONE)
+
     #  extern local function void m_process_default_sequence(string cfg)
 
     def m_check_verbosity(self):
@@ -910,7 +931,7 @@ class UVMRoot(UVMComponent):
             phase (UVMPhase): Current phase for this callback.
         """
         eof_elab_phase = UVMEndOfElaborationPhase.get()
-        uvm_debug(self, 'phase_started', phase.get_name())
+        uvm_debug(self, 'phase_started', lambda: phase.get_name())
         #if phase == end_of_elaboration_ph:
         if phase.get_name() == eof_elab_phase.get_name():
             uvm_debug(self, 'phase_started', "uvm_root resolving bindings now..")
@@ -415,7 +415,7 @@ class UVMMainPhase(UVMTaskPhase):
 
     
     async def exec_task(self,comp, phase):
-        uvm_debug(self, 'exec_task', 'yield main_phase for ' + comp.get_name())
+        uvm_debug(self, 'exec_task', lambda: 'yield main_phase for ' + comp.get_name())
         await comp.main_phase(phase)
 
     m_inst = None  # local static UVMMainPhase
@@ -21,14 +21,91 @@
 #   permissions and limitations under the License.
 #------------------------------------------------------------------------------
 
-from typing import List
+import sys
+from typing import Dict, List, Tuple
 from ..macros.uvm_message_defines import uvm_info
 from .uvm_object_globals import UVM_NONE
 
 
+class UVMSpellIndex:
+    """
+    Not part of SV UVM. A BK-tree of strings for finding the strings closest
+    to a misspelled string without computing the Levenshtein distance to
+    every string. Strings are added incrementally with `add`. Results of
+    `closest` are cached until the next string is added.
+    """
+
+    def __init__(self):
+        self.m_root = None  # [key, order, {distance: child node}]
+        self.m_keys: Dict[str, int] = {}  # key -> order of addition
+        self.m_cache: Dict[str, Tuple[int, List[str]]] = {}
+
+    def __contains__(self, key) -> bool:
+        return key in self.m_keys
+
+    def __len__(self) -> int:
+        return len(self.m_keys)
+
+    def add(self, key: str) -> None:
+        """
+        Adds a string to the index. Empty and already added strings are
+        ignored.
+
+        Args:
+            key (str): String to add.
+        """
+        if key == "" or key in self.m_keys:
+            return
+        self.m_keys[key] = len(self.m_keys)
+        self.m_cache = {}
+        node = [key, self.m_keys[key], {}]
+        if self.m_root is None:
+            self.m_root = node
+            return
+        curr = self.m_root
+        while True:
+            distance = UVMSpellChkr.levenshtein_distance(curr[0], key)
+            child = curr[2].get(distance)
+            if child is None:
+                curr[2][distance] = node
+                return
+            curr = child
+
+    def closest(self, s: str) -> Tuple[int, List[str]]:
+        """
+        Finds the strings with the minimum Levenshtein distance to `s`.
+
+        Args:
+            s (str): String to check.
+        Returns:
+            tuple: (distance, strings in the order of addition). The list
+            is empty if the index or `s` is empty.
+        """
+        if s in self.m_cache:
+            return self.m_cache[s]
+        min_val = UVMSpellChkr.max_val
+        min_nodes = []
+        if s != "" and self.m_root is not None:
+            stack = [self.m_root]
+            while len(stack) > 0:
+                node = stack.pop()
+                distance = UVMSpellChkr.levenshtein_distance(node[0], s)
+                if distance < min_val:
+                    min_val = distance
+                    min_nodes = [node]
+                elif distance == min_val:
+                    min_nodes.append(node)
+                for (edge, child) in node[2].items():
+                    if distance - min_val <= edge <= distance + min_val:
+                        stack.append(child)
+        res = (min_val, [n[0] for n in sorted(min_nodes, key=lambda n: n[1])])
+        self.m_cache[s] = res
+        return res
+
+
 class UVMSpellChkr:
 
-    max_val = 1
+    max_val = sys.maxsize
 
     #typedef T tab_t[string];
     #static const int unsigned max = '1;
@@ -63,10 +140,8 @@ class UVMSpellChkr:
         Note: This is not a particularly efficient algorithm.  It requires
         computing the levenshtein distance for every string in the string
         table.  If that list were very large the run time could be long.
-        For the resources application in UVM probably the size of the
-        string table is not excessive and run times will be fast enough.
-        If, on average, that proves to be an invalid assumption then we'll
-        have to find ways to optimize this algorithm.
+        Large tables can be given as a `UVMSpellIndex`, which finds the
+        alternatives without checking every string.
 
         note: strtab should not be modified inside check()
 
@@ -85,6 +160,9 @@ class UVMSpellChkr:
             return True
 
         min_val = UVMSpellChkr.max_val
+        if isinstance(strtab, UVMSpellIndex):
+            (min_val, min_key) = strtab.closest(s)
+            strtab = ()
         for key in strtab:
             distance = UVMSpellChkr.levenshtein_distance(key, s)
 
@@ -111,15 +189,9 @@ class UVMSpellChkr:
                 "{} not located, no alternatives to suggest".format(s), UVM_NONE)
         else:
             # dump all the alternatives with the minimum distance
-            q = []
-            for i in range(0, len(min_key)):
-                q.append(min_key[i])
-                q.append("|")
-                if len(q) > 0:
-                    q.pop()
-                    uvm_info("UVM/CONFIGDB/SPELLCHK",
-                            "{} not located, did you mean {}".format(s,
-                                "".join(q)),UVM_NONE)
+            uvm_info("UVM/CONFIGDB/SPELLCHK",
+                    "{} not located, did you mean {}".format(s,
+                        "|".join(min_key)),UVM_NONE)
         return False
 
     @classmethod
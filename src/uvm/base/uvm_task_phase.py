@@ -91,12 +91,12 @@ class UVMTaskPhase(UVMPhase):
         """
         phase.m_num_procs_not_yet_returned = 0
         await self.m_traverse(comp, phase, state)
-        uvm_debug(self, 'traverse', 'Finished self.m_traverse for comp ' +
+        uvm_debug(self, 'traverse', lambda: 'Finished self.m_traverse for comp ' +
                 comp.get_name())
 
     
     async def m_traverse(self, comp, phase, state):
-        uvm_debug(self, "m_traverse", "START OF m_traverse, comp: " +
+        uvm_debug(self, "m_traverse", lambda: "START OF m_traverse, comp: " +
                 comp.get_name())
         name = ""
         phase_domain = phase.get_domain()
@@ -105,14 +105,14 @@ class UVMTaskPhase(UVMPhase):
         children = []
         comp.get_children(children)
         children = map(lambda c: c.get_name(), children)
-        uvm_debug(self, "m_traverse", "Looping through children, comp: " +
+        uvm_debug(self, "m_traverse", lambda: "Looping through children, comp: " +
                 comp.get_name() + ' children: ' + ", ".join(children))
 
         # tpoikela: Added this loop, cause while-loop not safe
         children = []
         comp.get_children(children)
         for child in children:
-            uvm_debug(self, "m_traverse", "Yielding now child traverse with "
+            uvm_debug(self, "m_traverse", lambda: "Yielding now child traverse with "
                 + child.get_name())
             await self.m_traverse(child, phase, state)
 
@@ -125,7 +125,7 @@ class UVMTaskPhase(UVMPhase):
         #        yield self.m_traverse(child, phase, state)
         #        child = comp.get_next_child()
 
-        uvm_debug(self, "m_traverse", comp.get_name() + "| Comp children done.  Moving to its own phase..")
+        uvm_debug(self, "m_traverse", lambda: comp.get_name() + "| Comp children done.  Moving to its own phase..")
 
         if UVMPhase.m_phase_trace:
             dom_name = "unknown"
@@ -137,10 +137,10 @@ class UVMTaskPhase(UVMPhase):
                   )), UVM_DEBUG)
 
         from .uvm_domain import UVMDomain
-        uvm_debug(self, 'm_traverse', "ph_dom: {}, comm_dom: {}".format(
+        uvm_debug(self, 'm_traverse', lambda: "ph_dom: {}, comm_dom: {}".format(
             phase_domain.get_name(), UVMDomain.get_common_domain().get_name()))
         if (phase_domain == UVMDomain.get_common_domain() or phase_domain == comp_domain):
-            uvm_debug(self, 'm_traverse', "Comp: " + comp.get_name() + " - " + self.get_name() +
+            uvm_debug(self, 'm_traverse', lambda: "Comp: " + comp.get_name() + " - " + self.get_name() +
                 "| phase match found. Proceeding now...state is " + ph2str(state))
             if state == UVM_PHASE_STARTED:
                 comp.m_current_phase = phase
@@ -148,16 +148,16 @@ class UVMTaskPhase(UVMPhase):
                 comp.phase_started(phase)
                 if hasattr(comp, 'm_sequencer_id'):
                     seqr = comp  # was if ($cast(seqr, comp))
-                    uvm_debug(self, "m_traverse", comp.get_name() + " is SQR")
+                    uvm_debug(self, "m_traverse", lambda: comp.get_name() + " is SQR")
                     await seqr.start_phase_sequence(phase)
                 else:
-                    uvm_debug(self, "m_traverse", comp.get_name() + " is not SQR")
+                    uvm_debug(self, "m_traverse", lambda: comp.get_name() + " is not SQR")
             elif state == UVM_PHASE_EXECUTING:
                 ph = self  # uvm_phase
                 if self in comp.m_phase_imps:
                     ph = comp.m_phase_imps[self]
 
-                uvm_debug(self, "m_traverse", comp.get_name() + " yield ph.execute")
+                uvm_debug(self, "m_traverse", lambda: comp.get_name() + " yield ph.execute")
                 await ph.execute(comp, phase)
             elif state == UVM_PHASE_READY_TO_END:
                 comp.phase_ready_to_end(phase)
@@ -170,7 +170,7 @@ class UVMTaskPhase(UVMPhase):
                 comp.m_current_phase = None
             else:
                 uvm_report_fatal("PH_BADEXEC","task phase traverse internal error")
-        uvm_debug(self, "m_traverse", "END OF m_traverse, comp: " +
+        uvm_debug(self, "m_traverse", lambda: "END OF m_traverse, comp: " +
                 comp.get_name())
 
     async def execute(self, comp, phase):
@@ -183,7 +183,7 @@ class UVMTaskPhase(UVMPhase):
             comp: 
             phase: 
         """
-        uvm_debug(self, 'execute', 'exec task_phase |' + self.get_name() + '| with comp: ' +
+        uvm_debug(self, 'execute', lambda: 'exec task_phase |' + self.get_name() + '| with comp: ' +
                 comp.get_name())
         #fork
         #process proc
@@ -204,9 +204,9 @@ class UVMTaskPhase(UVMPhase):
             phase: 
         """
         phase.m_num_procs_not_yet_returned += 1
-        uvm_debug(self, '_execute_fork_join_none', 'exec task_phase |' + self.get_name()
+        uvm_debug(self, '_execute_fork_join_none', lambda: 'exec task_phase |' + self.get_name()
                 + '| yielding comp: ' + comp.get_name())
         await self.exec_task(comp, phase)
-        uvm_debug(self, '_execute_fork_join_none', 'exec task_phase |' + self.get_name()
+        uvm_debug(self, '_execute_fork_join_none', lambda: 'exec task_phase |' + self.get_name()
                 + '| AFTER yield comp: ' + comp.get_name())
         phase.m_num_procs_not_yet_returned -= 1
@@ -65,7 +65,7 @@ class UVMTopdownPhase(UVMPhase):
             phase:
             state:
         """
-        uvm_debug(self, 'traverse', self.get_name() +
+        uvm_debug(self, 'traverse', lambda: self.get_name() +
             ' traversing topdown phase now with comp' + comp.get_name())
         name = ""
         phase_domain = phase.get_domain()
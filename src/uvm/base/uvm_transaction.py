@@ -175,9 +175,12 @@ class UVMTransaction(UVMObject):
         UVMObject.__init__(self, name)
         self.initiator = initiator
         self.m_transaction_id = -1
-        self.events = UVMEventPool()
-        self.begin_event = self.events.get("begin")
-        self.end_event = self.events.get("end")
+        # Not part of SV UVM. The event pool is created on first access of
+        # events, begin_event or end_event. Until then, triggers are stored
+        # in m_pending_triggers (name -> trigger time) and replayed into the
+        # pool when it is created.
+        self.m_event_pool = None
+        self.m_pending_triggers = None
         self.stream_handle = None  # For recording
         self.tr_recorder = None
 
@@ -186,6 +189,72 @@ class UVMTransaction(UVMObject):
         self.accept_time = -1
         #endfunction // uvm_transaction
 
+    @property
+    def events(self) -> UVMEventPool:
+        if self.m_event_pool is None:
+            self.m_event_pool = UVMEventPool()
+            self.m_event_pool.get("begin")
+            self.m_event_pool.get("end")
+            if self.m_pending_triggers is not None:
+                for (name, trigger_time) in self.m_pending_triggers.items():
+                    event = self.m_event_pool.get(name)
+                    event.trigger()
+                    event.trigger_time = trigger_time
+                self.m_pending_triggers = None
+        return self.m_event_pool
+
+    @events.setter
+    def events(self, events):
+        self.m_event_pool = events
+        self.m_pending_triggers = None
+
+    @property
+    def begin_event(self):
+        return self.events.get("begin")
+
+    @begin_event.setter
+    def begin_event(self, event):
+        self.events.add("begin", event)
+
+    @property
+    def end_event(self):
+        return self.events.get("end")
+
+    @end_event.setter
+    def end_event(self, event):
+        self.events.add("end", event)
+
+    def m_trigger_event(self, name):
+        """ Triggers event `name`, or records the trigger if no pool exists """
+        if self.m_event_pool is not None:
+            self.m_event_pool.get(name).trigger()
+        else:
+            if self.m_pending_triggers is None:
+                self.m_pending_triggers = {}
+            self.m_pending_triggers[name] = sv.realtime()
+
+    def do_recycle(self, name):
+        """
+        Not part of SV UVM. Resets the transaction state for reuse, see
+        `UVMObject.do_recycle`. Events are kept but switched off.
+
+        Args:
+            name (str): Name of the recycled transaction.
+        """
+        UVMObject.do_recycle(self, name)
+        self.initiator = None
+        self.m_transaction_id = -1
+        if self.m_event_pool is not None:
+            for event in self.m_event_pool.pool.values():
+                if event.is_on():
+                    event.reset()
+        self.m_pending_triggers = None
+        self.stream_handle = None
+        self.tr_recorder = None
+        self.begin_time = -1
+        self.end_time = -1
+        self.accept_time = -1
+
     #
     #
     #  // Function: accept_tr
@@ -215,16 +284,13 @@ class UVMTransaction(UVMObject):
     #
     #  extern function void accept_tr (time accept_time = 0)
     def accept_tr(self, accept_time=0):
-        e = None
         if accept_time != 0:
             self.accept_time = accept_time
         else:
             self.accept_time = sv.realtime()
 
         self.do_accept_tr()
-        e = self.events.get("accept")
-        if e is not None:
-            e.trigger()
+        self.m_trigger_event("accept")
 
 
     #  // Function: do_accept_tr
@@ -376,7 +442,7 @@ class UVMTransaction(UVMObject):
                 self.tr_recorder.free()
         self.tr_recorder = None
 
-        self.end_event.trigger()
+        self.m_trigger_event("end")
 
 
     #  // Function: do_end_tr
@@ -572,7 +638,7 @@ class UVMTransaction(UVMObject):
             m_begin_tr = 0
 
         self.do_begin_tr()  # execute callback before event trigger
-        self.begin_event.trigger()
+        self.m_trigger_event("begin")
         return m_begin_tr
 
         #endfunction
@@ -144,7 +144,7 @@ def uvm_register_cb(T, CB):
 #-----------------------------------------------------------------------------
 
 def uvm_do_callbacks(self, CB, METHOD, *args):
-    uvm_debug(self, 'uvm_do_callbacks', 'Exec CBs with ' + METHOD)
+    uvm_debug(self, 'uvm_do_callbacks', lambda: 'Exec CBs with ' + METHOD)
     uvm_do_obj_callbacks(self, CB, METHOD, *args)
 
 #-----------------------------------------------------------------------------
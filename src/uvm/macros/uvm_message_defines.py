@@ -22,10 +22,11 @@
 
 from ..base.uvm_globals import (UVM_ERROR, UVM_FATAL, UVM_INFO, UVM_NONE, UVM_WARNING,
                                 uvm_report_enabled, uvm_report_error, uvm_report_fatal,
-                                uvm_report_info, uvm_report_warning)
+                                uvm_report_info, uvm_report_warning, uvm_caller_location,
+                                uvm_frame_location, uvm_set_report_file_line)
+from ..base.sv import sv
 
-import inspect
-from inspect import getframeinfo, stack
+import sys
 
 
 
@@ -37,7 +38,7 @@ UVM_NUM_LINES = 120
 
 
 def uvm_file():
-    return "<TODO uvm_file>"
+    return uvm_caller_location()[0]
 
 
 if UVM_REPORT_DISABLE_FILE:
@@ -46,13 +47,38 @@ if UVM_REPORT_DISABLE_FILE:
 
 
 def uvm_line():
-    return "<TODO uvm_line>"
+    return uvm_caller_location()[1]
 
 
 if UVM_REPORT_DISABLE_LINE:
     def uvm_line():
         return 0
 
+
+if UVM_REPORT_DISABLE_FILE and UVM_REPORT_DISABLE_LINE:
+    uvm_set_report_file_line(False)
+
+
+def _uvm_report_caller(frame, method):
+    """ Returns the report method of 'self' in the caller frame, or None if
+    there is no such method. The caller then falls back to the global
+    function with the same name. """
+    parent_self = frame.f_locals.get('self')
+    if parent_self is not None and hasattr(parent_self, method):
+        return getattr(parent_self, method)
+    return None
+
+
+def _uvm_render_msg(MSG, args):
+    """ Renders a lazily constructed message. MSG is either a format string
+    for sv.sformatf() with args, a zero-arg callable returning the
+    message, or a ready-made string. """
+    if args:
+        return sv.sformatf(MSG, *args)
+    if callable(MSG):
+        return MSG()
+    return MSG
+
 #//------------------------------------------------------------------------------
 #//
 #// Title: Report Macros
@@ -109,21 +135,22 @@ if UVM_REPORT_DISABLE_LINE:
 #// the message text. The file and line are also sent to the uvm_report_info call.
 #//
 #// |`uvm_info(ID, MSG, VERBOSITY)
+#//
+#// uvm-python: The message can be constructed lazily, so that no formatting
+#// is done for messages filtered out by verbosity or action. ~MSG~ can be
+#// either a format string for sv.sformatf() followed by its arguments,
+#// or a zero-arg callable returning the message:
+#//
+#// | uvm_info("ID", "val: %0d", UVM_LOW, val)
+#// | uvm_info("ID", lambda: "tr: " + tr.convert2string(), UVM_HIGH)
 
-def uvm_info(ID, MSG, VERBOSITY):
+def uvm_info(ID, MSG, VERBOSITY, *args):
     if uvm_report_enabled(VERBOSITY, UVM_INFO, ID):
-        caller = getframeinfo(stack()[1][0])
-        fname = caller.filename
-        lineno = caller.lineno
-        f_locals = inspect.currentframe().f_back.f_locals  # type: ignore
-        if 'self' in f_locals:
-            parent_self = f_locals['self']
-            if hasattr(parent_self, 'uvm_report_info'):
-                parent_self.uvm_report_info(ID, MSG, VERBOSITY, fname, lineno, "", 1)
-            else:
-                uvm_report_info(ID, MSG, VERBOSITY, fname, lineno, "", 1)
-        else:
-            uvm_report_info(ID, MSG, VERBOSITY, fname, lineno, "", 1)
+        MSG = _uvm_render_msg(MSG, args)
+        frame = sys._getframe(1)
+        fname, lineno = uvm_frame_location(frame)
+        report = _uvm_report_caller(frame, 'uvm_report_info') or uvm_report_info
+        report(ID, MSG, VERBOSITY, fname, lineno, "", 1)
 
 
 #// MACRO: `uvm_warning
@@ -136,20 +163,13 @@ def uvm_info(ID, MSG, VERBOSITY):
 #//
 #// |`uvm_warning(ID, MSG)
 
-def uvm_warning(ID, MSG):
-    if uvm_report_enabled(UVM_NONE, UVM_WARNING,ID):
-        caller = getframeinfo(stack()[1][0])
-        fname = caller.filename
-        lineno = caller.lineno
-        f_locals = inspect.currentframe().f_back.f_locals  # type: ignore
-        if 'self' in f_locals:
-            parent_self = f_locals['self']
-            if hasattr(parent_self, 'uvm_report_warning'):
-                parent_self.uvm_report_warning(ID, MSG, UVM_NONE, fname, lineno, "", 1)
-            else:
-                uvm_report_warning(ID, MSG, UVM_NONE, fname, lineno, "", 1)
-        else:
-            uvm_report_warning(ID, MSG, UVM_NONE, fname, lineno, "", 1)
+def uvm_warning(ID, MSG, *args):
+    if uvm_report_enabled(UVM_NONE, UVM_WARNING, ID):
+        MSG = _uvm_render_msg(MSG, args)
+        frame = sys._getframe(1)
+        fname, lineno = uvm_frame_location(frame)
+        report = _uvm_report_caller(frame, 'uvm_report_warning') or uvm_report_warning
+        report(ID, MSG, UVM_NONE, fname, lineno, "", 1)
 
 #// MACRO: `uvm_error
 #//
@@ -161,20 +181,13 @@ def uvm_warning(ID, MSG):
 #//
 #// |`uvm_error(ID, MSG)
 
-def uvm_error(ID, MSG):
-    if uvm_report_enabled(UVM_NONE, UVM_ERROR,ID):
-        caller = getframeinfo(stack()[1][0])
-        fname = caller.filename
-        lineno = caller.lineno
-        f_locals = inspect.currentframe().f_back.f_locals  # type: ignore
-        if 'self' in f_locals:
-            parent_self = f_locals['self']
-            if hasattr(parent_self, 'uvm_report_error'):
-                parent_self.uvm_report_error(ID, MSG, UVM_NONE, fname, lineno, "", 1)
-            else:
-                uvm_report_error(ID, MSG, UVM_NONE, fname, lineno, "", 1)
-        else:
-            uvm_report_error(ID, MSG, UVM_NONE, fname, lineno, "", 1)
+def uvm_error(ID, MSG, *args):
+    if uvm_report_enabled(UVM_NONE, UVM_ERROR, ID):
+        MSG = _uvm_render_msg(MSG, args)
+        frame = sys._getframe(1)
+        fname, lineno = uvm_frame_location(frame)
+        report = _uvm_report_caller(frame, 'uvm_report_error') or uvm_report_error
+        report(ID, MSG, UVM_NONE, fname, lineno, "", 1)
 
 #// MACRO: `uvm_fatal
 #//
@@ -187,20 +200,13 @@ def uvm_error(ID, MSG):
 #// |`uvm_fatal(ID, MSG)
 
 
-def uvm_fatal(ID, MSG):
-    if uvm_report_enabled(UVM_NONE, UVM_FATAL,ID):
-        caller = getframeinfo(stack()[1][0])
-        fname = caller.filename
-        lineno = caller.lineno
-        f_locals = inspect.currentframe().f_back.f_locals  # type: ignore
-        if 'self' in f_locals:
-            parent_self = f_locals['self']
-            if hasattr(parent_self, 'uvm_report_fatal'):
-                parent_self.uvm_report_fatal(ID, MSG, UVM_NONE, fname, lineno, "", 1)
-            else:
-                uvm_report_fatal(ID, MSG, UVM_NONE, fname, lineno, "", 1)
-        else:
-            uvm_report_fatal(ID, MSG, UVM_NONE, fname, lineno, "", 1)
+def uvm_fatal(ID, MSG, *args):
+    if uvm_report_enabled(UVM_NONE, UVM_FATAL, ID):
+        MSG = _uvm_render_msg(MSG, args)
+        frame = sys._getframe(1)
+        fname, lineno = uvm_frame_location(frame)
+        report = _uvm_report_caller(frame, 'uvm_report_fatal') or uvm_report_fatal
+        report(ID, MSG, UVM_NONE, fname, lineno, "", 1)
 
 #// MACRO: `uvm_info_context
 #//
@@ -208,13 +214,13 @@ def uvm_fatal(ID, MSG):
 #//
 #// Operates identically to `uvm_info but requires that the
 #// context, or <uvm_report_object>, in which the message is printed be
-#// explicitly supplied as a macro argument.
+#// explicitly supplied as a macro argument. The message can be constructed
+#// lazily as in <`uvm_info>, with format arguments given after ~RO~.
 
-def uvm_info_context(ID, MSG, VERBOSITY, RO):
+def uvm_info_context(ID, MSG, VERBOSITY, RO, *args):
     if RO.uvm_report_enabled(VERBOSITY, UVM_INFO, ID):
-        caller = getframeinfo(stack()[1][0])
-        fname = caller.filename
-        lineno = caller.lineno
+        MSG = _uvm_render_msg(MSG, args)
+        fname, lineno = uvm_caller_location()
         RO.uvm_report_info(ID, MSG, VERBOSITY, fname, lineno, "", 1)
 
 
@@ -246,11 +252,10 @@ def uvm_info_context(ID, MSG, VERBOSITY, RO):
 #     if (RO.uvm_report_enabled(UVM_NONE,UVM_ERROR,ID)) \
 #       RO.uvm_report_error (ID, MSG, UVM_NONE, uvm_file(), uvm_line(), "", 1); \
 #   end
-def uvm_error_context(ID, MSG, RO):
+def uvm_error_context(ID, MSG, RO, *args):
     if RO.uvm_report_enabled(UVM_NONE, UVM_ERROR, ID):
-        caller = getframeinfo(stack()[1][0])
-        fname = caller.filename
-        lineno = caller.lineno
+        MSG = _uvm_render_msg(MSG, args)
+        fname, lineno = uvm_caller_location()
         RO.uvm_report_error(ID, MSG, UVM_NONE, fname, lineno, "", 1)
 
 
@@ -1,4 +1,6 @@
 
+import keyword
+
 from ..base.uvm_registry import UVMComponentRegistry, UVMObjectRegistry, uvm_report_warning
 from ..base.sv import sv
 
@@ -120,13 +122,18 @@ def uvm_object_utils_end(T):
 
 
 def uvm_field_utils_start(T):
-    # Create static member containers for var names and masks
-    if not hasattr(T, "_m_uvm_field_names"):
+    # Create static member containers for var names and masks. These are
+    # looked up from T itself, so that a derived class does not add its fields
+    # into the containers of its base class.
+    if "_m_uvm_field_names" not in T.__dict__:
         setattr(T, "_m_uvm_field_names", [])
-    if not hasattr(T, "_m_uvm_field_masks"):
+    if "_m_uvm_field_masks" not in T.__dict__:
         setattr(T, "_m_uvm_field_masks", {})
+    # Generated functions per operation, see m_uvm_field_gen
+    gen_funcs = {}
+    setattr(T, "_m_uvm_field_gen_funcs", gen_funcs)
 
-    def _m_uvm_field_automation(self, rhs, what__, str__):
+    def _m_uvm_field_interp(self, rhs, what__, str__):
         from ..base.uvm_object import UVMObject
         bases = T.__bases__
         for Base in bases:
@@ -167,7 +174,7 @@ def uvm_field_utils_start(T):
                                 v_attr_self, v_attr_rhs, 0)
                         elif isinstance(v_attr_self, str):
                             T_cont.comparer.compare_string(v,
-                                v_attr_self, v_attr_rhs, 0)
+                                v_attr_self, v_attr_rhs)
                         elif hasattr(v_attr_self, "compare"):
                             T_cont.comparer.compare_object(v,
                                 v_attr_self, v_attr_rhs)
@@ -313,6 +320,18 @@ def uvm_field_utils_start(T):
             _current_scopes.pop()
             T_cont.uvm_cycle_scopes = _current_scopes
 
+    def _m_uvm_field_automation(self, rhs, what__, str__):
+        if m_uvm_field_gen_enabled:
+            func = gen_funcs.get(what__)
+            if func is None and what__ in M_UVM_FIELD_GEN_OPS:
+                func = m_uvm_field_gen(T, what__)
+                gen_funcs[what__] = func
+            if func is not None:
+                func(self, rhs, str__)
+                return
+        _m_uvm_field_interp(self, rhs, what__, str__)
+
+    _m_uvm_field_automation.m_uvm_field_owner = T
     setattr(T, "_m_uvm_field_automation", _m_uvm_field_automation)
 
 
@@ -320,12 +339,166 @@ def uvm_field_utils_end(T):
     pass
 
 
+# Not part of SV UVM. Copy, compare, print, pack and unpack through field
+# automation use a function generated for each class on first use, instead of
+# interpreting the field list and masks on every call. The generated function
+# is flat: the fields of base classes using field automation are inlined in
+# the same order as the interpreter would process them. Other operations, and
+# all operations when this is False, use the interpreter.
+m_uvm_field_gen_enabled = True
+
+M_UVM_FIELD_GEN_OPS = (UVM_COPY, UVM_COMPARE, UVM_PRINT, UVM_PACK, UVM_UNPACK)
+
+
+def m_uvm_field_segments(T, segs):
+    """
+    Collects the (class, field names) segments processed by field automation
+    of `T`, base classes first. A field name list of None means that the
+    `_m_uvm_field_automation` of that class must be called.
+    """
+    from ..base.uvm_object import UVMObject
+    for Base in T.__bases__:
+        func = getattr(Base, "_m_uvm_field_automation", None)
+        if func is None:
+            continue
+        owner = getattr(func, "m_uvm_field_owner", None)
+        if owner is not None:
+            m_uvm_field_segments(owner, segs)
+        elif func is not UVMObject._m_uvm_field_automation:
+            segs.append((Base, None))
+    segs.append((T, T._m_uvm_field_names))
+
+
+def m_uvm_field_attr(obj, v):
+    if v.isidentifier() and not keyword.iskeyword(v):
+        return obj + "." + v
+    return "getattr(" + obj + ", " + repr(v) + ")"
+
+
+def m_uvm_field_set_attr(obj, v, val):
+    if v.isidentifier() and not keyword.iskeyword(v):
+        return obj + "." + v + " = " + val
+    return "setattr(" + obj + ", " + repr(v) + ", " + val + ")"
+
+
+def m_uvm_field_gen_lines(what__, v, mask_v):
+    """ Returns the lines of code for field `v` with masks resolved """
+    rv = repr(v)
+    if what__ == UVM_COPY:
+        if not(mask_v & UVM_NOCOPY) and (mask_v & UVM_COPY != 0):
+            return ["v_attr = " + m_uvm_field_attr("rhs", v),
+                "if hasattr(v_attr, 'clone'):",
+                "    " + m_uvm_field_set_attr("self", v, "v_attr.clone()"),
+                "else:",
+                "    " + m_uvm_field_set_attr("self", v, "v_attr")]
+    elif what__ == UVM_COMPARE:
+        if not(mask_v & UVM_NOCOMPARE) and (mask_v & UVM_COMPARE != 0):
+            return ["v_attr_rhs = " + m_uvm_field_attr("rhs", v),
+                "v_attr_self = " + m_uvm_field_attr("self", v),
+                "if v_attr_rhs != v_attr_self:",
+                "    if isinstance(v_attr_self, int):",
+                "        T_cont.comparer.compare_field(" + rv + ", v_attr_self, v_attr_rhs, 0)",
+                "    elif isinstance(v_attr_self, str):",
+                "        T_cont.comparer.compare_string(" + rv + ", v_attr_self, v_attr_rhs)",
+                "    elif hasattr(v_attr_self, 'compare'):",
+                "        T_cont.comparer.compare_object(" + rv + ", v_attr_self, v_attr_rhs)",
+                "    if (T_cont.comparer.result and",
+                "            T_cont.comparer.show_max <= T_cont.comparer.result):",
+                "        break"]
+    elif what__ == UVM_PRINT:
+        if not(mask_v & UVM_NOPRINT) and (mask_v & UVM_PRINT != 0):
+            print_obj = "print_object"
+            if mask_v & UVM_REFERENCE:
+                print_obj = "print_object_header"
+            return ["v_attr_self = " + m_uvm_field_attr("self", v),
+                "if v_attr_self is not None:",
+                "    if isinstance(v_attr_self, int):",
+                "        T_cont.printer.print_field(" + rv + ", v_attr_self, sv.bits(v_attr_self), "
+                    + str(what__ & UVM_RADIX) + ")",
+                "    elif isinstance(v_attr_self, UVMObject):",
+                "        T_cont.printer." + print_obj + "(" + rv + ", v_attr_self)",
+                "    elif isinstance(v_attr_self, str):",
+                "        T_cont.printer.print_string(" + rv + ", v_attr_self)",
+                "    else:",
+                "        raise Exception(",
+                "            'Print not implemented yet with field macros. val: ' + str(v_attr_self))"]
+    elif what__ == UVM_PACK:
+        if not(mask_v & UVM_NOPACK):
+            return ["val = " + m_uvm_field_attr("self", v),
+                "if isinstance(val, int):",
+                "    T_cont.packer.pack_field_int(val, sv.bits(val))",
+                "elif isinstance(val, UVMObject):",
+                "    T_cont.packer.pack_object(val)",
+                "elif isinstance(val, str):",
+                "    T_cont.packer.pack_string(val)",
+                "else:",
+                "    raise TypeError('Unsupported type ' + str(type(val)) + ' for field automation')"]
+    elif what__ == UVM_UNPACK:
+        if not(mask_v & UVM_NOPACK):
+            return ["val = " + m_uvm_field_attr("self", v),
+                "if isinstance(val, int):",
+                "    val = T_cont.packer.unpack_field_int(sv.bits(val))",
+                "elif isinstance(val, UVMObject):",
+                "    T_cont.packer.unpack_object(val)",
+                "elif isinstance(val, str):",
+                "    val = T_cont.packer.unpack_string()",
+                "else:",
+                "    raise TypeError('Unsupported type ' + str(type(val)) + ' for field automation')",
+                m_uvm_field_set_attr("self", v, "val")]
+    return []
+
+
+def m_uvm_field_gen(T, what__):
+    """
+    Generates the field automation function of `T` for operation `what__`.
+
+    Args:
+        T (type): Class using field automation.
+        what__ (int): One of `M_UVM_FIELD_GEN_OPS`.
+    Returns:
+        func: Function taking (self, rhs, str__).
+    """
+    from ..base.uvm_object import UVMObject
+    segs = []
+    m_uvm_field_segments(T, segs)
+    namespace = {"sv": sv, "UVMObject": UVMObject}
+    func_name = "_m_uvm_field_automation_{}_{}".format(T.__name__, what__)
+    code = ["def " + func_name + "(self, rhs, str__):"]
+    for i, (C, fields) in enumerate(segs):
+        cname = "C" + str(i)
+        namespace[cname] = C
+        if fields is None:
+            code.append("    {}._m_uvm_field_automation(self, rhs, {}, str__)".format(cname, what__))
+            continue
+        body = []
+        for v in fields:
+            body.extend(m_uvm_field_gen_lines(what__, v, C._m_uvm_field_masks[v]))
+        if len(body) == 0:
+            continue
+        code.append("    T_cont = " + cname + "._m_uvm_status_container")
+        # Compare stops the fields of one class only after show_max mismatches
+        if what__ == UVM_COMPARE:
+            code.append("    while True:")
+            code.extend("        " + line for line in body)
+            code.append("        break")
+        else:
+            code.extend("    " + line for line in body)
+    if len(code) == 1:
+        code.append("    pass")
+    src = "\n".join(code) + "\n"
+    exec(compile(src, "<field automation of {}>".format(T.__name__), "exec"), namespace)
+    func = namespace[func_name]
+    func.m_uvm_source = src
+    return func
+
+
 def uvm_field_val(name, mask):
     if not hasattr(__CURR_OBJ, name):
         vals = getattr(__CURR_OBJ, "_m_uvm_field_names")
         masks = getattr(__CURR_OBJ, "_m_uvm_field_masks")
         vals.append(name)
         masks[name] = mask
+        __CURR_OBJ._m_uvm_field_gen_funcs.clear()
     else:
         raise Exception('uvm_field_val(): ' + str(__CURR_OBJ) +
             ' does not have property named ' + name)
@@ -104,9 +104,8 @@ class UVMMemSingleAccessSeq(UVMRegSequence):  # (uvm_sequence #(uvm_reg_item))
             exp = 0
             v = 0
 
-            uvm_info("UVMMemAccessSeq", "Verifying access of memory '"
-                + mem.get_full_name() + "' in map '" + maps[j].get_full_name()
-                + "' ...", UVM_LOW)
+            uvm_info("UVMMemAccessSeq", "Verifying access of memory '%s' in map '%s' ...",
+                UVM_LOW, mem.get_full_name(), maps[j].get_full_name())
             mode = mem.get_access(maps[j])
 
             # The access process is, for address k:
@@ -124,8 +124,8 @@ class UVMMemSingleWalkSeq(UVMRegSequence):  # (uvm_sequence #(uvm_reg_item))
             if mem.get_access(maps[j]) != "RW":
                 continue
 
-            uvm_info("UVMMemWalkSeq", sv.sformatf("Walking memory %s (n_bits: %d) in map \"%s\"...",
-                mem.get_full_name(), n_bits, maps[j].get_full_name()), UVM_LOW)
+            uvm_info("UVMMemWalkSeq", "Walking memory %s (n_bits: %d) in map \"%s\"...",
+                UVM_LOW, mem.get_full_name(), n_bits, maps[j].get_full_name())
 
             # The walking process is, for address k:
             # - Write ~k
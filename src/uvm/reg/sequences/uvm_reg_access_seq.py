@@ -140,9 +140,8 @@ class UVMRegSingleAccessSeq(UVMRegSequence):
             v = 0
             exp = 0
 
-            uvm_info("UVMRegAccessSeq", ("Verifying access of register '"
-                + rg.get_full_name() + "' in map '" +  maps[j].get_full_name()
-                + "' ..."), UVM_LOW)
+            uvm_info("UVMRegAccessSeq", "Verifying access of register '%s' in map '%s' ...",
+                UVM_LOW, rg.get_full_name(), maps[j].get_full_name())
 
             v = rg.get()
             status = []
@@ -138,8 +138,8 @@ class UVMRegSingleBitBashSeq(UVMRegSequence):  # (uvm_sequence #(uvm_reg_item))
                 mode[next_lsb] = "RO"
                 next_lsb += 1
 
-            uvm_info("UVMRegBitBashSeq", sv.sformatf("Verifying bits in register %s in map \"%s\"...",
-                rg.get_full_name(), maps[j].get_full_name()),UVM_LOW)
+            uvm_info("UVMRegBitBashSeq", "Verifying bits in register %s in map \"%s\"...",
+                UVM_LOW, rg.get_full_name(), maps[j].get_full_name())
 
             bits_bashed = 0
             # Bash the kth bit
@@ -165,7 +165,7 @@ class UVMRegSingleBitBashSeq(UVMRegSequence):  # (uvm_sequence #(uvm_reg_item))
         exp = 0x0
         v = 0x0
         bit_val = False
-        uvm_info("UVMRegBitBashSeq", sv.sformatf("...Bashing %s bit #%0d", mode, k), UVM_HIGH)
+        uvm_info("UVMRegBitBashSeq", "...Bashing %s bit #%0d", UVM_HIGH, mode, k)
 
         for _ in range(2):
             val = rg.get()
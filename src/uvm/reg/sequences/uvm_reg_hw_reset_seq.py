@@ -131,8 +131,8 @@ class UVMRegHWResetSeq(UVMRegSequence):
                     continue
 
                 uvm_info(self.get_type_name(),
-                        sv.sformatf("Verifying reset value of register %s in map \"%s\"...",
-                            regs[i].get_full_name(), maps[d].get_full_name()), UVM_LOW)
+                        "Verifying reset value of register %s in map \"%s\"...", UVM_LOW,
+                        regs[i].get_full_name(), maps[d].get_full_name())
 
                 status = []
                 await regs[i].mirror(status, UVM_CHECK, UVM_FRONTDOOR, maps[d], self)
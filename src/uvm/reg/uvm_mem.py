@@ -834,8 +834,8 @@ class UVMMem(UVMObject):
 
         status.append(rw.status)
 
-        uvm_info("RegModel", sv.sformatf("Poked memory '%s[%0d]' with value 'h%h",
-            self.get_full_name(), offset, value), UVM_HIGH)
+        uvm_info("RegModel", "Poked memory '%s[%0d]' with value 'h%h", UVM_HIGH,
+            self.get_full_name(), offset, value)
 
 
     #   // Task: peek
@@ -893,8 +893,8 @@ class UVMMem(UVMObject):
         status.append(rw.status)
         value.append(rw.value[0])
 
-        uvm_info("RegModel", sv.sformatf("Peeked memory '%s[%0d]' has value '%s'",
-            self.get_full_name(), offset, str(value)), UVM_HIGH)
+        uvm_info("RegModel", "Peeked memory '%s[%0d]' has value '%s'", UVM_HIGH,
+            self.get_full_name(), offset, str(value))
 
 
     #   extern protected function bit Xcheck_accessX (input uvm_reg_item rw,
@@ -1436,7 +1436,7 @@ class UVMMem(UVMObject):
             for i in range(len(paths)):
                 hdl_concat = paths[i]  # uvm_hdl_path_concat
                 for j in range(len(hdl_concat.slices)):
-                    uvm_info("RegModel", sv.sformatf("backdoor_write to %s ", hdl_concat.slices[j].path),UVM_DEBUG)
+                    uvm_info("RegModel", "backdoor_write to %s ", UVM_DEBUG, hdl_concat.slices[j].path)
 
                     if (hdl_concat.slices[j].offset < 0):
                         ok &= uvm_hdl.uvm_hdl_deposit(hdl_concat.slices[j].path
@@ -1478,7 +1478,7 @@ class UVMMem(UVMObject):
                 val = 0
                 for j in range(len(hdl_concat.slices)):
                     hdl_path = hdl_concat.slices[j].path + "[" + idx + "]"
-                    uvm_info("RegModel", "backdoor_read from " + hdl_path, UVM_DEBUG)
+                    uvm_info("RegModel", "backdoor_read from %s", UVM_DEBUG, hdl_path)
 
                     if hdl_concat.slices[j].offset < 0:
                         arr = []
@@ -212,8 +212,8 @@ class UVMMemMam:
                 end_offset, self.cfg.end_offset))
             return None
 
-        uvm_info("RegModel",sv.sformatf("Attempting to reserve ['h%h:'h%h]...",
-            start_offset, end_offset),UVM_MEDIUM)
+        uvm_info("RegModel", "Attempting to reserve ['h%h:'h%h]...", UVM_MEDIUM,
+            start_offset, end_offset)
 
         for i in range(len(self.in_use)):
             if (start_offset <= self.in_use[i].get_end_offset()  and
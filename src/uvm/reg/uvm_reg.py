@@ -1365,12 +1365,13 @@ class UVMReg(UVMObject):
 
                 if (val != exp):
                     uvm_info("RegModel",
-                            sv.sformatf("Field %s (%s[%0d:%0d]) mismatch read=%0d'h%0h mirrored=%0d'h%0h ",
-                                self.m_fields[i].get_name(), self.get_full_name(),
-                                self.m_fields[i].get_lsb_pos() + self.m_fields[i].get_n_bits() - 1,
-                                self.m_fields[i].get_lsb_pos(),
-                                self.m_fields[i].get_n_bits(), val,
-                                self.m_fields[i].get_n_bits(), exp), UVM_NONE)
+                            "Field %s (%s[%0d:%0d]) mismatch read=%0d'h%0h mirrored=%0d'h%0h ",
+                            UVM_NONE,
+                            self.m_fields[i].get_name(), self.get_full_name(),
+                            self.m_fields[i].get_lsb_pos() + self.m_fields[i].get_n_bits() - 1,
+                            self.m_fields[i].get_lsb_pos(),
+                            self.m_fields[i].get_n_bits(), val,
+                            self.m_fields[i].get_n_bits(), exp)
         return False
 
 
@@ -2086,8 +2087,8 @@ class UVMReg(UVMObject):
         for i in range(len(paths)):
             hdl_concat = paths[i]  # uvm_hdl_path_concat
             for j in range(len(hdl_concat.slices)):
-                uvm_info("RegMem", "backdoor_write to "
-                        + hdl_concat.slices[j].path, UVM_DEBUG)
+                uvm_info("RegMem", "backdoor_write to %s", UVM_DEBUG,
+                        hdl_concat.slices[j].path)
 
                 if hdl_concat.slices[j].offset < 0:
                     ok &= uvm_hdl.uvm_hdl_deposit(hdl_concat.slices[j].path,rw.value[0])
@@ -2125,8 +2126,8 @@ class UVMReg(UVMObject):
             hdl_concat = paths[i]  # uvm_hdl_path_concat
             val = 0
             for j in range(len(hdl_concat.slices)):
-                uvm_info("RegMem", "backdoor_read from %s "
-                    + hdl_concat.slices[j].path, UVM_DEBUG)
+                uvm_info("RegMem", "backdoor_read from %s ", UVM_DEBUG,
+                    hdl_concat.slices[j].path)
 
                 if hdl_concat.slices[j].offset < 0:
                     arr = []
@@ -2156,8 +2157,8 @@ class UVMReg(UVMObject):
                       val, uvm_hdl_concat2string(paths[i])))
                 return UVM_NOT_OK
 
-            uvm_info("RegMem",
-                sv.sformatf("returned backdoor value 0x%0x",rw.value[0]),UVM_DEBUG)
+            uvm_info("RegMem", "returned backdoor value 0x%0x", UVM_DEBUG,
+                rw.value[0])
 
         rw.status = UVM_NOT_OK
         if ok:
@@ -993,13 +993,13 @@ class UVMRegBlock(UVMObject):
         stat_all = UVM_IS_OK
 
         if self.needs_update() is False:
-            uvm_info("RegModel", sv.sformatf("%s:%0d - RegModel block %s does not need updating",
-                         fname, lineno, self.get_name()), UVM_HIGH)
+            uvm_info("RegModel", "%s:%0d - RegModel block %s does not need updating",
+                     UVM_HIGH, fname, lineno, self.get_name())
             return
 
 
-        uvm_info("RegModel", sv.sformatf("%s:%0d - Updating model block %s with %s path",
-            fname, lineno, self.get_name(), path), UVM_HIGH)
+        uvm_info("RegModel", "%s:%0d - Updating model block %s with %s path",
+            UVM_HIGH, fname, lineno, self.get_name(), path)
 
         for rg_ in self.regs.key_list():
             rg = rg_
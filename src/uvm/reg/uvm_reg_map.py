@@ -529,7 +529,7 @@ class UVMRegMap(UVMObject):
             return
 
         if adapter is None:
-            uvm_info("REG_NO_ADAPT", ("Adapter not specified for map '" +
+            uvm_info("REG_NO_ADAPT", lambda: ("Adapter not specified for map '" +
                 self.get_full_name() +
                 "'. Accesses via this map will send abstract 'uvm_reg_item' items to sequencer '"
                 + sequencer.get_full_name() + "'"), UVM_MEDIUM)
@@ -1391,8 +1391,8 @@ class UVMRegMap(UVMObject):
                 data = (value >> (curr_byte*8)) & ((1 << (bus_width * 8))-1)
 
                 uvm_info(self.get_type_name(),
-                   sv.sformatf("Writing 0x%0h at 0x%0h via map %s...",
-                        data, addrs[i], rw.map.get_full_name()), UVM_VERB_MEM_MAP)
+                   "Writing 0x%0h at 0x%0h via map %s...", UVM_VERB_MEM_MAP,
+                   data, addrs[i], rw.map.get_full_name())
 
                 if rw.element_kind == UVM_FIELD:
                     for z in range(bus_width):
@@ -1460,8 +1460,8 @@ class UVMRegMap(UVMObject):
                 rw.status = rw_access.status
 
                 uvm_info(self.get_type_name(),
-                   sv.sformatf("Wrote 0x%0h at 0x%0h via map %s: %s...",
-                      rw_access.data, addrs[i], rw.map.get_full_name(), rw.status), UVM_VERB_MEM_MAP)
+                   "Wrote 0x%0h at 0x%0h via map %s: %s...", UVM_VERB_MEM_MAP,
+                   rw_access.data, addrs[i], rw.map.get_full_name(), rw.status)
 
                 if rw.status == UVM_NOT_OK:
                     break
@@ -1545,8 +1545,8 @@ class UVMRegMap(UVMObject):
                 rw_access = UVMRegBusOp()
 
                 uvm_info(self.get_type_name(),
-                   sv.sformatf("Reading address 'h%0h via map \"%s\"...",
-                             addrs[i], self.get_full_name()), UVM_VERB_MEM_MAP)
+                   "Reading address 'h%0h via map \"%s\"...", UVM_VERB_MEM_MAP,
+                   addrs[i], self.get_full_name())
 
                 if (rw.element_kind == UVM_FIELD):
                     #for (int z=0;z<bus_width;z++)
@@ -1612,8 +1612,8 @@ class UVMRegMap(UVMObject):
                 #if (rw.status == UVM_IS_OK && (^data) === 1'bx):
 
                 uvm_info(self.get_type_name(),
-                   sv.sformatf("Read 0x%h at 0x%h via map %s: %s...", data,
-                       addrs[i], self.get_full_name(), str(rw.status)), UVM_VERB_MEM_MAP)
+                   "Read 0x%h at 0x%h via map %s: %s...", UVM_VERB_MEM_MAP,
+                   data, addrs[i], self.get_full_name(), str(rw.status))
 
                 if (rw.status == UVM_NOT_OK):
                     break
@@ -146,7 +146,7 @@ class UVMRegPredictor(UVMComponent):
         if self.adapter is None:
             uvm_fatal("REG/WRITE/None","write: adapter handle is None")
 
-        uvm_info("REG_PREDICTOR", "write(): Received " + tr.convert2string(),
+        uvm_info("REG_PREDICTOR", lambda: "write(): Received " + tr.convert2string(),
             UVM_MEDIUM)
         # In case they forget to set byte_en
         rw.byte_en = -1
@@ -224,13 +224,12 @@ class UVMRegPredictor(UVMComponent):
                         rg.do_predict(reg_item, predict_kind, rw.byte_en)
                         if reg_item.kind == UVM_WRITE:
                             uvm_info("REG_PREDICT", "Observed WRITE transaction to register "
-                                     + ir.get_full_name() + ": value='h"
-                                     + sv.sformatf("%0h",reg_item.value[0]) + " : updated value = 'h"
-                                     + sv.sformatf("%0h",ir.get()), UVM_HIGH)
+                                     + "%s: value='h%0h : updated value = 'h%0h", UVM_HIGH,
+                                     ir.get_full_name(), reg_item.value[0], ir.get())
                         else:
                             uvm_info("REG_PREDICT", "Observed READ transaction to register "
-                                     + ir.get_full_name() + ": value='h" +
-                                     sv.sformatf("%0h", reg_item.value[0]),UVM_HIGH)
+                                     + "%s: value='h%0h", UVM_HIGH,
+                                     ir.get_full_name(), reg_item.value[0])
                         self.reg_ap.write(reg_item)
                         self.m_pending.delete(rg)
 
@@ -241,8 +240,7 @@ class UVMRegPredictor(UVMComponent):
                        + rg.get_full_name() + "'")
         else:
             uvm_info("REG_PREDICT_NOT_FOR_ME",
-               "Observed transaction does not target a register: " +
-                 sv.sformatf("%p",tr), UVM_FULL)
+               "Observed transaction does not target a register: %p", UVM_FULL, tr)
 
 
     #  // Function: check_phase
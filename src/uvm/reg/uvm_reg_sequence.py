@@ -160,7 +160,7 @@ class UVMRegSequence(UVMSequence):
             #wait(0);
             await uvm_zero_delay()
         uvm_info("REG_XLATE_SEQ_START",
-           "Starting RegModel translation sequence on sequencer " +
+           lambda: "Starting RegModel translation sequence on sequencer " +
            self.m_sequencer.get_full_name() + "'", UVM_LOW)
         while True:
             reg_item = []  # uvm_reg_item reg_item;
@@ -190,7 +190,7 @@ class UVMRegSequence(UVMSequence):
         if self.adapter is None:
             uvm_fatal("REG/DO_ITEM/NULL","do_reg_item: adapter handle is null")
 
-        uvm_info("DO_RW_ACCESS","Doing transaction: " + rws, UVM_HIGH)
+        uvm_info("DO_RW_ACCESS", "Doing transaction: %s", UVM_HIGH, rws)
         #
         if (self.parent_select == LOCAL):
             self.upstream_parent = rw.parent
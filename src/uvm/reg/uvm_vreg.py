@@ -251,12 +251,13 @@ class UVMVReg(UVMObject):
             return 0
 
         if self.mem is not None:
-            uvm_info("RegModel", sv.sformatf(
+            uvm_info("RegModel",
                 "Virtual register \"%s\" is being moved re-implemented from %s@'h%0h to %s@'h%0h",
+                UVM_MEDIUM,
                 self.get_full_name(),
                 self.mem.get_full_name(),
                 self.offset,
-                mem.get_full_name(), offset), UVM_MEDIUM)
+                mem.get_full_name(), offset)
             self.release_region()
 
         self.region = region
@@ -34,6 +34,7 @@ from ..macros import uvm_fatal, uvm_warning, uvm_error
 from ..base.uvm_pool import UVMPool
 from ..dap.uvm_get_to_lock_dap import uvm_get_to_lock_dap
 from ..base.uvm_recorder import UVMRecorder
+from ..base.uvm_registry import UVMObjectRegistry
 from uvm.base.sv import wait
 
 SEQ_ERR1_MSG = "neither the item's sequencer nor dedicated sequencer has been supplied to start item in "
@@ -1069,6 +1070,8 @@ class UVMSequenceBase(UVMSequenceItem):
         # if sequencer.is_auto_item_recording_enabled():
         sequencer.end_tr(item)
         self.post_do(item)
+        if UVMObjectRegistry.m_num_auto_release > 0:
+            UVMObjectRegistry.m_auto_release(item)
 
     #  // Task: wait_for_grant
     #  //
@@ -68,6 +68,23 @@ class UVMSequenceItem(UVMTransaction):
         self.print_sequence_info = False
     #  endfunction
 
+    def do_recycle(self, name) -> None:
+        """
+        Not part of SV UVM. Resets the sequence item for reuse, see
+        `UVMObject.do_recycle`.
+
+        Args:
+            name (str): Name of the recycled item.
+        """
+        UVMTransaction.do_recycle(self, name)
+        self.m_sequence_id = -1
+        self.m_use_sequence_info = False
+        self.m_depth = -1
+        self.m_sequencer = None
+        self.p_sequencer = None
+        self.m_parent_sequence = None
+        self.print_sequence_info = False
+
     def get_type_name(self) -> str:
         return "UVMSequenceItem"
 
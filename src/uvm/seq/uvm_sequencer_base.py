@@ -326,13 +326,13 @@ class UVMSequencerBase(UVMComponent):
                     seq = seq_arr[0]
 
         if seq is None:
-            uvm_info("PHASESEQ", "No default phase sequence for phase '"
-                    + phase.get_name() + "'", UVM_FULL)
+            uvm_info("PHASESEQ", "No default phase sequence for phase '%s'",
+                    UVM_FULL, phase.get_name())
             await uvm_zero_delay()
             return
 
-        uvm_info("PHASESEQ", "Starting default sequence '" + seq.get_type_name()
-                + "' for phase '" + phase.get_name() + "'", UVM_FULL)
+        uvm_info("PHASESEQ", "Starting default sequence '%s' for phase '%s'",
+                UVM_FULL, seq.get_type_name(), phase.get_name())
 
         seq.print_sequence_info = 1
         seq.set_sequencer(self)
@@ -372,14 +372,13 @@ class UVMSequencerBase(UVMComponent):
             phase (UVMPhase): Phase which has the default sequence running.
         """
         if self.m_default_sequences.exists(phase):
-            uvm_info("PHASESEQ",
-                      ("Killing default sequence '" +
-                      self.m_default_sequences[phase].seq.get_type_name() +
-                       "' for phase '" + phase.get_name() + "'"), UVM_FULL)
+            uvm_info("PHASESEQ", "Killing default sequence '%s' for phase '%s'",
+                    UVM_FULL, self.m_default_sequences[phase].seq.get_type_name(),
+                    phase.get_name())
             self.m_default_sequences[phase].seq.kill()
         else:
-            uvm_info("PHASESEQ", ("No default sequence to kill for phase '"
-                + phase.get_name() + "'"), UVM_FULL)
+            uvm_info("PHASESEQ", "No default sequence to kill for phase '%s'",
+                UVM_FULL, phase.get_name())
 
 
 
@@ -60,6 +60,25 @@ class TestSV(unittest.TestCase):
         #self.assertEqual(p2.free_var, p2.addr + p2.b_addr)
 
 
+    def test_lazy_rand_tables(self):
+        plain = sv_obj()
+        self.assertNotIn("_randVariables", plain.__dict__)
+        self.assertNotIn("_sv_rand_state", plain.__dict__)
+        self.assertTrue(plain.randomize())
+
+        # Randomizing again from the seed gives the same values
+        pp = Packet("pkt")
+        pp.randomize()
+        values = (pp.addr, pp.b_addr, pp.data)
+        pp._sv_rand_state = None
+        pp.randomize()
+        self.assertEqual((pp.addr, pp.b_addr, pp.data), values)
+
+        # Tables are per instance once created
+        self.assertIn("_randVariables", pp.__dict__)
+        self.assertEqual(len(sv_obj._randVariables), 0)
+        self.assertEqual(len(sv_obj().__dict__), 1)
+
     def test_uvm_glob_to_re(self):
         str1 = "uvm_*"
         res1 = uvm_glob_to_re(str1)
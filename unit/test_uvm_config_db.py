@@ -51,6 +51,93 @@ class TestUVMConfigDb(unittest.TestCase):
         self.assertEqual(arr[0], 666)
 
 
+    def test_get_cache(self):
+        from uvm.base.uvm_resource_db import UVMResourceDb
+        from uvm.base.uvm_resource import UVMResourceOptions
+        UVMConfigDb.set(None, "cache_comp", "knob", 1)
+        arr = []
+        self.assertTrue(UVMConfigDb.get(None, "cache_comp", "knob", arr))
+        self.assertIn(("cache_comp", "knob", None), UVMConfigDb.m_get_cache)
+        self.assertTrue(UVMConfigDb.get(None, "cache_comp", "knob", arr))
+        self.assertEqual(arr, [1, 1])
+
+        UVMConfigDb.set(None, "cache_comp", "knob", 2)
+        UVMResourceDb.set("cache_comp", "other", 5)
+        arr = []
+        UVMConfigDb.get(None, "cache_comp", "knob", arr)
+        self.assertEqual(arr, [2])
+
+        # Resource set with a higher priority must be seen
+        UVMConfigDb.set(None, "cache_*", "knob", 3)
+        arr = []
+        UVMConfigDb.get(None, "cache_comp", "knob", arr)
+        self.assertEqual(arr, [3])
+
+        # Auditing still records reads of cached resources
+        auditing = UVMResourceOptions.is_auditing()
+        UVMResourceOptions.turn_on_auditing()
+        r = UVMConfigDb.m_get_cache[("cache_comp", "knob", None)]
+        reads = sum(a.read_count for a in r.access.values())
+        UVMConfigDb.get(None, "cache_comp", "knob", arr)
+        self.assertEqual(sum(a.read_count for a in r.access.values()), reads + 1)
+        UVMResourceOptions.auditing = auditing
+
+    def test_waiters(self):
+        from uvm.base.sv import uvm_re_match, uvm_glob_to_re
+        insts = ["top.env.agent", "top.env.agent2", "top.envx.agent", "top.env"]
+        globs = ["top.env.agent", "top.env.*", "*.agent", "top.env?", "/agent$/", "", "top.e*t"]
+        for glob in globs:
+            waiters = [UVMConfigDb.m_add_waiter(inst, "wait_field") for inst in insts]
+            waiters.append(UVMConfigDb.m_add_waiter(insts[0], "wait_field"))
+            UVMConfigDb.set(None, glob, "wait_field", len(glob))
+            for w in waiters:
+                exp = uvm_re_match(uvm_glob_to_re(glob), w.inst_name) == 0
+                self.assertEqual(w.trigger.fired, exp, glob + " " + w.inst_name)
+                UVMConfigDb.m_remove_waiter(w)
+        self.assertNotIn("wait_field", UVMConfigDb.m_waiters)
+
+    def test_set_bulk(self):
+        import json
+        import os
+        import tempfile
+        from uvm.base.uvm_resource import UVMResourcePool
+        pre = [(None, "top.a", "f1", 1), (None, "top.b", "f2", 2)]
+        settings = [(None, "top.*", "f1", 3), (None, "top.a", "f1", 4),
+            ("", "top.b", "f2", 5), (None, "top.c", "f3", 6), (None, "top.*", "f1", 7),
+            (None, "top.b", "f2", 8), (None, "top.d", "f1", 9)]
+
+        def run(bulk):
+            saved = (UVMResourcePool.rp, UVMConfigDb.m_rsc)
+            UVMResourcePool.rp = UVMResourcePool()
+            UVMConfigDb.m_rsc = {}
+            try:
+                for (cntxt, inst, field, val) in pre:
+                    UVMConfigDb.set(cntxt, inst, field, val)
+                if bulk:
+                    self.assertEqual(UVMConfigDb.set_bulk(settings), len(settings))
+                else:
+                    for (cntxt, inst, field, val) in settings:
+                        UVMConfigDb.set(cntxt or None, inst, field, val)
+                rp = UVMResourcePool.get()
+                return ([(name, [(r.get_scope(), r.precedence, r.read())
+                    for r in rp.rtab[name]]) for name in rp.rtab.keys()],
+                    [[r.read() for r in q] for q in rp.ttab.values()])
+            finally:
+                (UVMResourcePool.rp, UVMConfigDb.m_rsc) = saved
+
+        self.assertEqual(run(True), run(False))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, "cfg.json")
+            with open(fname, "w") as fh:
+                json.dump([["", "bulk_comp", "bulk_f", 11],
+                    {"inst_name": "bulk_comp", "field_name": "bulk_g", "value": "x"}], fh)
+            self.assertEqual(UVMConfigDb.load_file(fname), 2)
+        arr = []
+        self.assertTrue(UVMConfigDb.get(None, "bulk_comp", "bulk_f", arr))
+        self.assertTrue(UVMConfigDb.get(None, "bulk_comp", "bulk_g", arr))
+        self.assertEqual(arr, [11, "x"])
+
     def test_set_override(self):
         pass
         # self.assertEqual(0, 1)
@@ -0,0 +1,45 @@
+import io
+import os
+import subprocess
+import sys
+import unittest
+from contextlib import redirect_stdout
+from uvm.base.uvm_debug import UVMDebug, uvm_debug
+
+
+class TestUVMDebug(unittest.TestCase):
+
+    def tearDown(self):
+        UVMDebug.no_debug()
+
+    def test_lazy_message(self):
+        calls = []
+
+        def make_msg():
+            calls.append(1)
+            return "lazy msg"
+        uvm_debug(self, 'test', make_msg)
+        uvm_debug(self, 'test', "cnt %d", 3)
+        self.assertEqual(calls, [])
+
+        UVMDebug.DEBUG = True
+        out = io.StringIO()
+        with redirect_stdout(out):
+            uvm_debug(self, 'test', make_msg)
+            uvm_debug(self, 'test', "cnt %d", 3)
+        self.assertEqual(calls, [1])
+        self.assertRegex(out.getvalue(), r"test\(\) - lazy msg\n")
+        self.assertRegex(out.getvalue(), r"test\(\) - cnt 3\n")
+
+    def test_strip_mode(self):
+        code = ("from uvm.base.uvm_debug import UVMDebug, uvm_debug\n"
+            + "UVMDebug.DEBUG = True\n"
+            + "uvm_debug(None, 'test', 'not stripped')\n")
+        env = dict(os.environ, UVM_STRIP_DEBUG="1")
+        res = subprocess.run([sys.executable, "-c", code], env=env,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        self.assertEqual(res.returncode, 0)
+        self.assertNotIn(b"not stripped", res.stdout)
+
+if __name__ == '__main__':
+    unittest.main()
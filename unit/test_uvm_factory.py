@@ -91,6 +91,73 @@ class TestUVMDefaultFactory(unittest.TestCase):
         self.assertEqual(obj2.get_name(), 'is_xxx')
         self.assertEqual(obj2.get_type_name(), 'XXX')
 
+    def test_override_cache(self):
+        cs = UVMCoreService.get()
+        fact = UVMDefaultFactory()
+        cs.set_factory(fact)
+        XXX = createXXX()
+        YYY = createYYY()
+        LastOverride = createLastOverride()
+
+        fact.set_type_override_by_type(XXX.get_type(), YYY.get_type())
+        for _ in range(3):
+            obj = fact.create_object_by_type(XXX.get_type(), 'top', 'obj')
+            self.assertEqual(obj.get_type_name(), 'YYY')
+        self.assertEqual(len(fact.m_override_cache), 1)
+        self.assertEqual(fact.m_type_overrides[0].used, 3)
+        self.assertEqual(len(fact.m_override_info), 1)
+
+        obj = fact.create_object_by_name('XXX', 'top', 'obj')
+        obj = fact.create_object_by_name('XXX', 'top', 'obj')
+        self.assertEqual(obj.get_type_name(), 'YYY')
+        self.assertEqual(fact.m_type_overrides[0].used, 5)
+
+        # New overrides invalidate the cached results
+        fact.set_inst_override_by_type(XXX.get_type(), LastOverride.get_type(),
+            'top.*')
+        obj = fact.create_object_by_type(XXX.get_type(), 'top', 'obj')
+        self.assertEqual(obj.get_type_name(), 'LastOverride')
+        obj = fact.create_object_by_type(XXX.get_type(), 'top', 'obj')
+        self.assertEqual(obj.get_type_name(), 'LastOverride')
+        self.assertEqual(fact.m_inst_override_queues[XXX.get_type()][0].used, 2)
+        self.assertEqual(fact.m_type_overrides[0].used, 5)
+        fact.set_type_override_by_type(XXX.get_type(), XXX.get_type())
+        obj = fact.create_object_by_type(XXX.get_type(), 'other', 'obj')
+        self.assertEqual(obj.get_type_name(), 'XXX')
+
+    def test_inst_override_matcher(self):
+        cs = UVMCoreService.get()
+        fact = UVMDefaultFactory()
+        cs.set_factory(fact)
+        XXX = createXXX()
+        YYY = createYYY()
+        LastOverride = createLastOverride()
+
+        fact.set_inst_override_by_type(XXX.get_type(), YYY.get_type(), 'env.agent?.drv')
+        fact.set_inst_override_by_type(XXX.get_type(), LastOverride.get_type(), 'env.*')
+        fact.set_inst_override_by_name('XXX', 'LastOverride', 'top.d*')
+        for (parent, exp) in [('env.agent0', 'YYY'), ('env', 'LastOverride'),
+                ('my_env.agent1', 'YYY'), ('top', 'LastOverride'), ('other', 'XXX')]:
+            obj = fact.create_object_by_type(XXX.get_type(), parent, 'drv')
+            self.assertEqual(obj.get_type_name(), exp, parent)
+            obj = fact.create_object_by_name('XXX', parent, 'drv')
+            self.assertEqual(obj.get_type_name(), exp, parent)
+        self.assertEqual(fact.m_inst_override_queues[XXX.get_type()].size(), 3)
+        self.assertEqual(fact.m_inst_override_queues[XXX.get_type()][0].used, 4)
+
+        # Raw regexes are matched one by one
+        fact.set_inst_override_by_type(YYY.get_type(), XXX.get_type(), '/(a)\\1/')
+        obj = fact.create_object_by_type(YYY.get_type(), 'top', 'aa')
+        self.assertEqual(obj.get_type_name(), 'YYY')
+        obj = fact.create_object_by_type(YYY.get_type(), 'top', '/aa/')
+        self.assertEqual(obj.get_type_name(), 'XXX')
+
+        # Wildcard type names apply to registered types
+        fact.set_inst_override_by_name('Y*', 'LastOverride', 'wc.*')
+        obj = fact.create_object_by_name('YYY', 'wc', 'obj')
+        self.assertEqual(obj.get_type_name(), 'LastOverride')
+        self.assertEqual(fact.m_wildcard_inst_overrides.size(), 1)
+
     def test_create_component_by_name(self):
         cs = UVMCoreService.get()
         factory = UVMFactory.get()
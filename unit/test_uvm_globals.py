@@ -1,9 +1,12 @@
+import sys
 
 import unittest
 
 from uvm.base.uvm_globals import (
     uvm_report_enabled,
-    uvm_is_match
+    uvm_is_match,
+    uvm_caller_location,
+    uvm_set_report_file_line
 )
 
 from uvm.base.uvm_object_globals import (
@@ -28,6 +31,22 @@ class TestUVMGlobals(unittest.TestCase):
         self.assertFalse(uvm_is_match("my_name??????", "my_name.abc"))
         self.assertTrue(uvm_is_match("zzz*www??yy", "zzz_abcdefg_wwwKKyy"))
 
+    def test_uvm_caller_location(self):
+        def report_func():
+            return uvm_caller_location()
+        fname, line = report_func()
+        self.assertEqual(fname, __file__)
+        self.assertEqual(line, sys._getframe().f_lineno - 2)
+        # Cached location must be returned on repeated calls from same site
+        locs = [report_func() for _ in range(2)]
+        self.assertEqual(locs[0], locs[1])
+
+        uvm_set_report_file_line(False)
+        try:
+            self.assertEqual(report_func(), ("", 0))
+        finally:
+            uvm_set_report_file_line(True)
+
 
 if __name__ == '__main__':
     unittest.main()
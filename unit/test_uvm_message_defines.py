@@ -0,0 +1,63 @@
+import unittest
+from uvm.base.uvm_report_object import UVMReportObject
+from uvm.base.uvm_object_globals import UVM_LOW, UVM_HIGH
+from uvm.macros.uvm_message_defines import uvm_info, uvm_info_context, uvm_error
+
+
+class RecordingReporter(UVMReportObject):
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.msgs = []
+
+    def uvm_report_info(self, id, message, verbosity, filename="", line=0,
+            context_name="", report_enabled_checked=False):
+        self.msgs.append((id, message, filename, line))
+
+    def uvm_report_error(self, id, message, verbosity, filename="", line=0,
+            context_name="", report_enabled_checked=False):
+        self.msgs.append((id, message, filename, line))
+
+    def info(self, msg, verb, *args):
+        uvm_info("LAZY", msg, verb, *args)
+
+    def error(self, msg, *args):
+        uvm_error("LAZY", msg, *args)
+
+
+class TestUVMMessageDefines(unittest.TestCase):
+
+    def test_uvm_info_lazy(self):
+        rpt = RecordingReporter("rpt")
+        calls = []
+
+        def make_msg():
+            calls.append(1)
+            return "lazy msg"
+        rpt.info(make_msg, UVM_HIGH)
+        self.assertEqual(calls, [])
+        self.assertEqual(rpt.msgs, [])
+
+        rpt.info(make_msg, UVM_LOW)
+        self.assertEqual(calls, [1])
+        self.assertEqual(rpt.msgs[0][1], "lazy msg")
+        self.assertEqual(rpt.msgs[0][2], __file__)
+
+        rpt.info("val: %0d, addr: 'h%0h", UVM_LOW, 12, 255)
+        self.assertEqual(rpt.msgs[1][1], "val: 12, addr: 'hFF")
+
+    def test_uvm_info_context_lazy(self):
+        rpt = RecordingReporter("rpt")
+        uvm_info_context("CTXT", "%s done", UVM_LOW, rpt, "seq")
+        uvm_info_context("CTXT", lambda: 1 / 0, UVM_HIGH, rpt)
+        self.assertEqual(len(rpt.msgs), 1)
+        self.assertEqual(rpt.msgs[0][1], "seq done")
+
+    def test_uvm_error_format(self):
+        rpt = RecordingReporter("rpt")
+        rpt.error("got %0d, exp %0d", 1, 2)
+        self.assertEqual(rpt.msgs[0][1], "got 1, exp 2")
+
+
+if __name__ == '__main__':
+    unittest.main()
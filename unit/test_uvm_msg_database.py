@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+from uvm.base.uvm_msg_database import UVMMsgDatabase, UVMMsgLog
+from uvm.base.uvm_report_message import UVMReportMessage
+from uvm.base.uvm_report_object import UVMReportObject
+from uvm.base.uvm_report_server import UVMReportServer
+from uvm.base.uvm_object_globals import (UVM_INFO, UVM_ERROR, UVM_LOW,
+    UVM_RM_RECORD)
+
+
+class TestUVMMsgDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "msgs.umdb")
+        self.db = UVMMsgDatabase("msg_db")
+        self.db.set_file_name(self.filename)
+        self.srv = UVMReportServer()
+        self.srv.set_message_database(self.db)
+        self.ro = UVMReportObject("ro")
+
+    def tearDown(self):
+        self.db.close_db()
+        self.tmpdir.cleanup()
+
+    def record(self, sev, id, msg, line=0, elems=(("addr", 0x40),)):
+        rm = UVMReportMessage.new_report_message()
+        rm.set_report_message(sev, id, msg, UVM_LOW, "file.py", line, "ctxt")
+        rm.set_report_object(self.ro)
+        rm.set_report_handler(self.ro.get_report_handler())
+        rm.set_action(UVM_RM_RECORD)
+        for (name, value) in elems:
+            rm.add(name, value)
+        self.srv.execute_report_message(rm, "")
+
+    def test_record_and_query(self):
+        self.record(UVM_INFO, "A", "first", 10)
+        self.record(UVM_ERROR, "B", "second")
+        self.record(UVM_INFO, "A", "third")
+        self.assertEqual(len(self.srv.m_streams["ro"]), 1)
+        self.db.flush()
+
+        with UVMMsgLog(self.filename) as log:
+            self.assertEqual(len(log), 3)
+            self.assertEqual(log.query(id="A"), [0, 2])
+            self.assertEqual(log.query(severity="UVM_ERROR"), [1])
+            self.assertEqual(log.query(severity=UVM_INFO, id="B"), [])
+            self.assertEqual(log.query(id="A", limit=1), [0])
+            self.assertEqual(log.query(id="nope"), [])
+            rec = log.get_record(0)
+            self.assertEqual(rec["message"], "first")
+            self.assertEqual(rec["line"], 10)
+            self.assertEqual(rec["object"], "ro")
+            self.assertEqual(rec["context"], "ctxt")
+            self.assertEqual(rec["elements"], [("addr", 0x40)])
+            self.assertEqual(UVMMsgLog.format_record(rec),
+                "UVM_INFO file.py(10) @ 0NS: ro@@ctxt [A] first\n +addr: 64")
+
+    def test_int_elements(self):
+        values = [("data", (1 << 64) - 1), ("neg", -(1 << 63) - 1),
+            ("min", -(1 << 63)), ("max", (1 << 63) - 1), ("wide", -(1 << 200) + 5),
+            ("minus_one", -1)]
+        self.record(UVM_INFO, "BUS", "data", elems=values)
+        self.db.flush()
+        with UVMMsgLog(self.filename) as log:
+            self.assertEqual(log.get_record(0)["elements"], values)
+
+    def test_tail_scan(self):
+        self.record(UVM_INFO, "A", "indexed")
+        self.db.flush()
+        self.record(UVM_ERROR, "C", "not indexed")
+        self.db.m_file.flush()
+        with UVMMsgLog(self.filename) as log:
+            self.assertEqual(log.query(id="C"), [1])
+            log.reindex()
+        with UVMMsgLog(self.filename) as log:
+            self.assertFalse(log.m_index_stale)
+            self.assertEqual(log.get_record(1)["message"], "not indexed")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 
+import re
 import unittest
 
 from uvm.base.uvm_object import UVMObject
@@ -34,6 +35,21 @@ uvm_field_object("my_obj")
 uvm_object_utils_end(SuperObj)
 
 
+class DerivedObj(TestObj):
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.kind = "rd"
+        self.nopack = 7
+        self.sub = TestObj("sub")
+
+uvm_object_utils_begin(DerivedObj)
+uvm_field_string("kind")
+uvm_field_int("nopack", UVM_DEFAULT | UVM_NOPACK)
+uvm_field_object("sub")
+uvm_object_utils_end(DerivedObj)
+
+
 class TestUVMObject(unittest.TestCase):
 
     def test_name(self):
@@ -84,6 +100,40 @@ class TestUVMObject(unittest.TestCase):
         sup_obj22.unpack(packed_obj)
         self.assertEqual(sup_obj22.my_obj.addr, 888)
 
+    def test_generated_field_automation(self):
+        import uvm.macros.uvm_object_defines as defines
+        self.assertEqual(DerivedObj._m_uvm_field_names, ["kind", "nopack", "sub"])
+        self.assertEqual(TestObj._m_uvm_field_names, ["addr", "data"])
+
+        def run_ops():
+            o1 = DerivedObj("o1")
+            o1.addr = 0x55
+            o1.kind = "wr"
+            o1.sub.addr = 99
+            o2 = o1.clone()
+            same = o1.compare(o2)
+            o2.data = 1
+            o2.kind = "xx"
+            diff = o1.compare(o2)
+            o3 = DerivedObj("o3")
+            o3.nopack = 0
+            o3.unpack(o1.pack()[1])
+            return (same, diff, re.sub("@[0-9]+", "", o1.sprint()), o1.pack(),
+                o2.kind, o2.sub.addr, o3.addr, o3.kind, o3.nopack, o3.sub.addr)
+
+        interpreted = None
+        try:
+            defines.m_uvm_field_gen_enabled = False
+            interpreted = run_ops()
+        finally:
+            defines.m_uvm_field_gen_enabled = True
+        generated = run_ops()
+        self.assertEqual(generated, interpreted)
+        self.assertEqual(generated[:2], (True, False))
+        self.assertEqual(generated[4:7], ("xx", 99, 0x55))
+        self.assertEqual(generated[8], 0)
+        self.assertIn(UVM_COPY, DerivedObj._m_uvm_field_gen_funcs)
+
 
 class TestRecordIntegration(unittest.TestCase):
 
@@ -3,6 +3,7 @@ import unittest
 
 from uvm.base.uvm_registry import UVMComponentRegistry, UVMObjectRegistry
 from uvm.macros.uvm_object_defines import uvm_component_utils, uvm_object_utils
+from uvm.seq.uvm_sequence_item import UVMSequenceItem
 
 
 class TestUVMRegistry(unittest.TestCase):
@@ -20,6 +21,72 @@ class TestUVMRegistry(unittest.TestCase):
         self.assertEqual(isinstance(abc_obj, ABC), True)
 
 
+    def test_recycling(self):
+        class RecycledItem(UVMSequenceItem):
+            def __init__(self, name="RecycledItem"):
+                super().__init__(name)
+                self.data = 0
+
+            def do_recycle(self, name):
+                super().do_recycle(name)
+                self.data = 0
+        uvm_object_utils(RecycledItem)
+        type_id = RecycledItem.type_id
+        pool = type_id.enable_recycling(max_free=1)
+
+        item = type_id.create('item0')
+        item.data = 7
+        item.set_transaction_id(3)
+        item.end_event.trigger()
+        self.assertTrue(type_id.release(item))
+        self.assertFalse(type_id.release(item))
+        self.assertFalse(type_id.release(RecycledItem('other')))
+
+        item2 = type_id.create('item1')
+        self.assertIs(item2, item)
+        self.assertEqual(item2.get_name(), 'item1')
+        self.assertEqual(item2.data, 0)
+        self.assertEqual(item2.get_transaction_id(), -1)
+        self.assertFalse(item2.end_event.is_on())
+        self.assertTrue(item2.randomize())
+        item2.rand_mode(0)
+        seed = item2._sv_seed
+        self.assertTrue(type_id.release(item2))
+        item3 = type_id.create('item1')
+        self.assertIs(item3, item)
+        self.assertTrue(item3._rand_mode)
+        self.assertIsNone(item3._sv_rand_state)
+        self.assertNotEqual(item3._sv_seed, seed)
+        self.assertTrue(item3.randomize())
+        self.assertIsNotNone(item3._sv_rand_state)
+        self.assertIsNot(type_id.create('item2'), item)
+        self.assertEqual((pool.hits, pool.misses, pool.released, pool.dropped),
+            (2, 2, 2, 1))
+        self.assertAlmostEqual(pool.get_hit_rate(), 1 / 2)
+        type_id.disable_recycling()
+        self.assertIsNone(type_id.get_recycle_pool())
+
+    def test_recycling_rejects_other_types(self):
+        class RecycledA(UVMSequenceItem):
+            pass
+        uvm_object_utils(RecycledA)
+
+        class RecycledB(UVMSequenceItem):
+            pass
+        uvm_object_utils(RecycledB)
+
+        class RecycledSubA(RecycledA):
+            pass
+
+        type_id = RecycledA.type_id
+        pool = type_id.enable_recycling()
+        self.assertFalse(type_id.release(RecycledB('b')))
+        self.assertFalse(type_id.release(RecycledSubA('sub_a')))
+        self.assertEqual((pool.released, pool.dropped), (0, 2))
+        self.assertEqual(type(type_id.create('a')), RecycledA)
+        type_id.disable_recycling()
+
+
     def test_component_registry(self):
         class ABC:
             def __init__(self, name, parent):
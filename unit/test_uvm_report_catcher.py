@@ -1,6 +1,10 @@
 
 import unittest
-from uvm.base.uvm_report_catcher import UVMReportCatcher
+from uvm.base.uvm_report_catcher import (UVMReportCatcher, UVMReportCb, CAUGHT,
+    THROW)
+from uvm.base.uvm_report_object import UVMReportObject
+from uvm.base.uvm_report_server import UVMReportServer
+from uvm.base.uvm_object_globals import UVM_ERROR, UVM_INFO, UVM_NONE
 
 
 class MyReportCatcher(UVMReportCatcher):
@@ -13,11 +17,82 @@ class MyReportCatcher(UVMReportCatcher):
         self._id = self.get_id()
 
 
+class CountingCatcher(UVMReportCatcher):
+
+    def __init__(self, name, action=THROW, new_id=None):
+        super().__init__(name)
+        self.ids = []
+        self.action = action
+        self.new_id = new_id
+
+    def catch(self):
+        self.ids.append(self.get_id())
+        if self.new_id is not None:
+            self.set_id(self.new_id)
+        return self.action
+
+
+class Demoter(UVMReportCatcher):
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.caught = 0
+
+    def catch(self):
+        self.caught += 1
+        if self.get_severity() == UVM_ERROR:
+            self.set_severity(UVM_INFO)
+        return THROW
+
+
 class TestUVMReportCatcher(unittest.TestCase):
 
     def test_catcher(self):
         rpt_catcher = MyReportCatcher('catcher')
 
+    def test_catch_filter(self):
+        ro = UVMReportObject("catch_ro")
+        renamer = CountingCatcher("renamer", new_id="MYID")
+        renamer.set_catch_filter("OLDID")
+        all_ids = CountingCatcher("all_ids")
+        my_id = CountingCatcher("my_id", action=CAUGHT)
+        my_id.set_catch_filter(["MYID"], UVM_ERROR)
+        UVMReportCb.add(ro, renamer)
+        UVMReportCb.add(ro, all_ids)
+        UVMReportCb.add(ro, my_id)
+
+        ro.uvm_report_error("OTHER", "msg", UVM_NONE)
+        ro.uvm_report_warning("MYID", "msg", UVM_NONE)
+        ro.uvm_report_error("MYID", "msg", UVM_NONE)
+        ro.uvm_report_error("OLDID", "msg", UVM_NONE)
+        self.assertEqual(renamer.ids, ["OLDID"])
+        self.assertEqual(all_ids.ids, ["OTHER", "MYID", "MYID", "MYID"])
+        self.assertEqual(my_id.ids, ["MYID", "MYID"])
+
+        all_ids.callback_mode(0)
+        ro.uvm_report_error("OTHER", "msg", UVM_NONE)
+        self.assertEqual(len(all_ids.ids), 4)
+
+    def test_single_catcher_demotes(self):
+        # Start without catchers registered by the other tests
+        UVMReportCb.get()
+        pool = UVMReportCb.m_base_inst.m_pool.pool
+        saved = dict(pool)
+        pool.clear()
+        UVMReportCatcher.m_catchers_gen = -1
+        try:
+            # Tracing is left at its default, so add() itself issues a report
+            ro = UVMReportObject("demote_ro")
+            demoter = Demoter("demoter")
+            UVMReportCb.add(ro, demoter)
+            svr = UVMReportServer.get_server()
+            n_errors = svr.get_severity_count(UVM_ERROR)
+            ro.uvm_report_error("EXP", "expected error", UVM_NONE)
+            self.assertEqual(demoter.caught, 1)
+            self.assertEqual(svr.get_severity_count(UVM_ERROR), n_errors)
+        finally:
+            pool.update(saved)
+            UVMReportCatcher.m_catchers_gen = -1
 
 if __name__ == '__main__':
     unittest.main()
@@ -27,6 +27,21 @@ class TestUVMReportHandler(unittest.TestCase):
         verb = rh.get_action(UVM_ERROR, "XYZ")
         self.assertEqual(verb, UVM_COUNT)
 
+    def test_decision_cache(self):
+        rh = UVMReportHandler("handler")
+        dec = rh.m_get_decision(UVM_INFO, "ID1")
+        self.assertEqual(dec, (UVM_MEDIUM, UVM_INFO, UVM_DISPLAY, rh.default_file_handle))
+        self.assertIn((UVM_INFO, "ID1"), rh.m_decisions)
+
+        rh.set_id_verbosity("ID1", UVM_HIGH)
+        self.assertEqual(len(rh.m_decisions), 0)
+        self.assertEqual(rh.m_get_decision(UVM_INFO, "ID1")[0], UVM_HIGH)
+
+        rh.set_severity_id_override(UVM_INFO, "ID1", UVM_ERROR)
+        rh.set_id_action("ID1", UVM_LOG)
+        dec = rh.m_get_decision(UVM_INFO, "ID1")
+        self.assertEqual(dec[1:3], (UVM_ERROR, UVM_LOG))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,7 +2,8 @@
 import unittest
 from uvm.base.uvm_report_object import UVMReportObject
 from uvm.base.uvm_object_globals import (
-    UVM_INFO, UVM_ERROR, UVM_LOG, UVM_DISPLAY, UVM_COUNT, UVM_MEDIUM, UVM_HIGH)
+    UVM_INFO, UVM_ERROR, UVM_LOG, UVM_DISPLAY, UVM_COUNT, UVM_LOW, UVM_MEDIUM,
+    UVM_HIGH)
 
 
 class TestUVMReportObject(unittest.TestCase):
@@ -33,6 +34,16 @@ class TestUVMReportObject(unittest.TestCase):
         act = obj.get_report_action(UVM_ERROR, id="")
         self.assertEqual(act, UVM_LOG)
 
+    def test_report_enabled_invalidation(self):
+        obj = UVMReportObject('rpt')
+        self.assertFalse(obj.uvm_report_enabled(UVM_HIGH, UVM_INFO, "ID"))
+        obj.set_report_id_verbosity("ID", UVM_HIGH)
+        self.assertTrue(obj.uvm_report_enabled(UVM_HIGH, UVM_INFO, "ID"))
+        obj.set_report_verbosity_level(UVM_LOW)
+        self.assertFalse(obj.uvm_report_enabled(UVM_MEDIUM, UVM_INFO, "OTHER"))
+        obj.reset_report_handler()
+        self.assertTrue(obj.uvm_report_enabled(UVM_MEDIUM, UVM_INFO, "OTHER"))
+
 
 
 if __name__ == '__main__':
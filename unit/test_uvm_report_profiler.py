@@ -0,0 +1,40 @@
+import unittest
+from uvm.base.uvm_report_profiler import UVMReportProfiler
+from uvm.base.uvm_report_object import UVMReportObject
+from uvm.base.uvm_report_server import UVMReportServer
+from uvm.base.uvm_object_globals import UVM_LOW, UVM_DEBUG, UVM_NO_ACTION
+
+
+class TestUVMReportProfiler(unittest.TestCase):
+
+    def test_profile(self):
+        orig_uvm_report = UVMReportObject.uvm_report
+        prof = UVMReportProfiler.get()
+        prof.reset()
+        ro = UVMReportObject("prof_ro")
+        prof.enable()
+        try:
+            self.assertIsNot(UVMReportObject.uvm_report, orig_uvm_report)
+            ro.uvm_report_info("SHOWN", "displayed", UVM_LOW)
+            ro.uvm_report_info("HIDDEN", "filtered", UVM_DEBUG)
+            ro.set_report_id_action("NO_ACT", UVM_NO_ACTION)
+            ro.uvm_report_info("NO_ACT", "no action", UVM_LOW)
+        finally:
+            prof.disable()
+        self.assertIs(UVMReportObject.uvm_report, orig_uvm_report)
+        ro.uvm_report_info("SHOWN", "not profiled", UVM_LOW)
+
+        self.assertEqual(prof.by_id["SHOWN"][:3:2], [0, 1])
+        self.assertEqual(prof.by_id["HIDDEN"][:3:2], [1, 0])
+        self.assertEqual(prof.by_id["NO_ACT"][:3:2], [1, 0])
+        self.assertEqual(prof.by_object["prof_ro"][:3:2], [2, 1])
+        self.assertGreater(prof.handler_time, 0)
+        summary = UVMReportServer.get_server().get_summary_string()
+        self.assertRegex(summary, r"Report profile")
+        self.assertRegex(summary, r"\[prof_ro\] ")
+        prof.reset()
+        self.assertEqual(prof.get_summary_string(), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -60,7 +60,45 @@ class TestUVMReportServer(unittest.TestCase):
         srv = UVMReportServer()
 
     def test_compose_report_message(self):
+        from uvm.base.uvm_report_message import UVMReportMessage
         srv = UVMReportServer()
+        rpt_msg = UVMReportMessage()
+        rpt_msg.set_report_message(UVM_ERROR, "ID", "msg {0}", UVM_LOW,
+            "file.py", 12, "ctxt")
+        self.assertEqual(srv.compose_report_message(rpt_msg, "top.env"),
+            "UVM_ERROR file.py(12) @ 0NS: top.env@@ctxt [ID] msg {0}")
+        rpt_msg.set_filename("")
+        rpt_msg.set_context("")
+        self.assertEqual(srv.compose_report_message(rpt_msg, "top.env"),
+            "UVM_ERROR @ 0NS: top.env [ID] msg {0}")
+
+        srv.set_message_format("{time} {severity} [{id}] {message} ({filename}:{line})")
+        rpt_msg.set_filename("file.py")
+        self.assertEqual(srv.compose_report_message(rpt_msg, "top.env"),
+            "0NS UVM_ERROR [ID] msg {0} (file.py:12)")
+        with self.assertRaises(Exception):
+            srv.set_message_format("{sev} {message}")
+        srv.set_message_format("{{{severity!r:>12}}} {line:04d}: {message}")
+        self.assertEqual(srv.compose_report_message(rpt_msg, "top.env"),
+            "{ 'UVM_ERROR'} 0012: msg {0}")
+        with self.assertRaises(Exception):
+            srv.set_message_format("{message!x}")
+
+        # Only the fields used by the template are computed
+        srv.set_message_format("[{id}] {message}{terminator}")
+        src = srv.m_compose.m_uvm_source
+        self.assertNotIn("uvm_sim_time", src)
+        self.assertNotIn("get_filename", src)
+        self.assertIn("severity = ", src)
+        srv.show_terminator = True
+        rpt_msg.add("addr", 0x40)
+        self.assertEqual(srv.compose_report_message(rpt_msg, "top.env").split("\n")[0],
+            "[ID] msg {0}")
+        composed = srv.compose_report_message(rpt_msg)
+        self.assertIn("element_container", composed)
+        self.assertTrue(composed.endswith(" -UVM_ERROR"))
+        srv.set_message_format("")
+        self.assertEqual(srv.compose_report_message(rpt_msg), "")
 
     def test_report_summarize(self):
         srv = UVMReportServer()
@@ -70,5 +108,95 @@ class TestUVMReportServer(unittest.TestCase):
         srv.process_report_message(rpt_msg)
         srv.report_summarize()
 
+    def test_report_sink(self):
+        import io, gzip, os, tempfile
+        from uvm.base.uvm_report_sink import UVMReportSink
+        srv = UVMReportServer()
+        out = io.StringIO()
+        sink = UVMReportSink(capacity=4, stdout=out)
+        srv.set_report_sink(sink)
+        for i in range(20):
+            srv.f_display(0, "msg" + str(i))
+        srv.flush()
+        self.assertEqual(out.getvalue(), "".join("msg{}\n".format(i) for i in range(20)))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, "id.log.gz")
+            fh = UVMReportSink.open_file(fname)
+            srv.f_display(fh, "to file")
+            srv.report_summarize()
+            sink.close()
+            fh.close()
+            with gzip.open(fname, "rt") as gz:
+                self.assertEqual(gz.read(), "to file\n")
+        srv.set_report_sink(None)
+
+    def test_report_sink_logger_and_closed_file(self):
+        import io
+        from uvm.base.uvm_report_sink import UVMReportSink
+        srv = UVMReportServer()
+        out = io.StringIO()
+        sink = UVMReportSink(stdout=out)
+        srv.set_report_sink(sink)
+        msgs = []
+        srv.set_logger(msgs.append)
+        srv.f_display(0, "to logger")
+        srv.flush()
+        self.assertEqual(msgs, ["to logger"])
+        self.assertEqual(out.getvalue(), "")
+
+        # Stream closed before the sink writes to it
+        fh = io.StringIO()
+        with sink.m_cond:
+            srv.f_display(fh, "lost")
+            fh.close()
+        srv.flush()
+        self.assertEqual(sink.dropped, 1)
+        self.assertEqual(msgs[1:], ["UVM_WARNING. File already closed for msg lost"])
+        srv.set_report_sink(None)
+        sink.close()
+
+    def test_report_throttle(self):
+        from uvm.base.uvm_report_message import UVMReportMessage
+        from uvm.base.uvm_report_object import UVMReportObject
+        prev_srv = UVMReportServer.get_server()
+        srv = UVMReportServer()
+        UVMReportServer.set_server(srv)
+        msgs = []
+        srv.set_logger(msgs.append)
+        ro = UVMReportObject("ro")
+
+        def report(sev, id, msg):
+            rpt_msg = UVMReportMessage()
+            rpt_msg.set_report_message(sev, id, msg, UVM_LOW, "", 0, "")
+            rpt_msg.set_report_handler(ro.get_report_handler())
+            rpt_msg.set_action(UVM_DISPLAY | UVM_COUNT)
+            srv.process_report_message(rpt_msg)
+
+        srv.set_report_throttle("NOISY", 3, severity=UVM_ERROR)
+        srv.set_report_throttle("_ALL_", 5)
+        for i in range(10):
+            report(UVM_ERROR, "NOISY", "err" + str(i))
+            report(UVM_WARNING, "NOISY", "warn" + str(i))
+            report(UVM_INFO, "OTHER", "info" + str(i))
+        self.assertEqual(len(msgs), 3 + 5 + 5)
+        self.assertEqual(srv.get_id_count("NOISY"), 20)
+        self.assertEqual(srv.get_severity_count(UVM_ERROR), 10)
+        self.assertEqual(srv.get_suppressed_count("NOISY", UVM_ERROR), 7)
+        self.assertEqual(srv.get_suppressed_count(), 7 + 5 + 5)
+        self.assertRegex(srv.get_summary_string(),
+            r"Suppressed report counts by id\n\[NOISY\] UVM_ERROR : 7")
+
+        srv.clear_report_throttles()
+        srv.collapse_duplicates = True
+        msgs.clear()
+        for i in range(4):
+            report(UVM_ERROR, "DUP", "same")
+        report(UVM_ERROR, "DUP", "different")
+        self.assertEqual(len(msgs), 3)
+        self.assertEqual(msgs[1], "Last message repeated 3 times")
+        self.assertEqual(srv.get_id_count("DUP"), 5)
+        UVMReportServer.set_server(prev_srv)
+
 if __name__ == '__main__':
     unittest.main()
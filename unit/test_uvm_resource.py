@@ -12,6 +12,27 @@ class TestUVMResource(unittest.TestCase):
         self.assertEqual(True, rr.match_scope(nname1))
         self.assertEqual(False, rr.match_scope(nname2))
 
+    def test_scope_match_compiled(self):
+        from uvm.base.sv import uvm_re_match, uvm_glob_to_re
+        scopes = ["", "*", "top.env", "top.*.agent", "top.u?", "/^top\\.(a|b)$/",
+            "top.env+", "a[0]"]
+        names = ["", "top", "top.env", "top.env.agent", "xtop.env", "top.u1",
+            "top.a", "top.b.c", "top.envv", "a0", "a[0]"]
+        for scope in scopes:
+            rr = UVMResource("fname", scope)
+            for name in names:
+                exp = uvm_re_match(uvm_glob_to_re(scope), name) == 0
+                for _ in range(2):  # Second round uses memoized results
+                    self.assertEqual(rr.match_scope(name), exp,
+                        "scope {} name {}".format(scope, name))
+        rr = UVMResource("fname", "top.env")
+        self.assertEqual(rr.m_scope_literal, "top.env")
+        rr.set_scope("top.*.x")
+        self.assertIsNone(rr.m_scope_literal)
+        self.assertFalse(rr.match_scope("env"))
+        rr.set_scope("*top.*")
+        self.assertEqual(rr.m_scope_literal, "top.")
+
 
     def test_write_read(self):
         rsc = UVMResource("rname", "scope_name")
@@ -67,6 +88,156 @@ class TestUVMResourcePool(unittest.TestCase):
         self.assertEqual(len(rq), 1)
         self.assertEqual(rq[0].read(), 567)
 
+    def test_scope_index(self):
+        from uvm.base.uvm_resource import NAME_OVERRIDE, PRI_LOW
+        scopes = ["", "*", "top.env", "top.env.*", "*.agent", "top.*.agent",
+            "top.u?", "/^top\\.(a|b)$/", "env.agent", "agent", "op.env.ag",
+            ".env.", "top.env.agent.drv", "a[0].b"]
+        names = ["", "top", "top.env", "top.env.agent", "xtop.env.agent2",
+            "top.u1", "top.a", "top.envv.agent", "a[0].b.c", "top.env.agent.drv"]
+        pool = UVMResourcePool()
+        rsrcs = []
+        for (i, scope) in enumerate(scopes):
+            r = UVMResource("idx_name", scope)
+            r.precedence = i % 3
+            pool.set(r, NAME_OVERRIDE if i % 4 == 0 else 0)
+            rsrcs.append(r)
+        self.assertGreaterEqual(len(rsrcs), UVMResourcePool.min_indexed_queue)
+
+        def check():
+            rq = pool.rtab["idx_name"]
+            for name in names:
+                exp = [r for r in rq if r.match_scope(name)]
+                q = pool.lookup_name(name, "idx_name")
+                self.assertEqual(q, exp, "scope " + name)
+                self.assertIs(pool.get_highest_precedence(q),
+                    pool.get_highest_precedence(exp))
+                self.assertEqual(list(pool.lookup_scope(name)), exp)
+        check()
+        pool.set_priority_name(rsrcs[0], PRI_LOW)
+        check()
+        rsrcs[5].set_scope("top.env")
+        check()
+
+    def test_lookup_scope_index(self):
+        from uvm.base.uvm_resource import PRI_HIGH
+        pool = UVMResourcePool()
+        scopes = ["*", "top.env.*", "top.env.agent", "*.drv", "top.u?"]
+        names = ["top.env.agent", "top.env.agent.drv", "top.u1", "top"]
+
+        def check():
+            for name in names:
+                exp = []
+                for rname in reversed(pool.rtab.key_list()):
+                    exp.extend(r for r in pool.rtab[rname] if r.match_scope(name))
+                self.assertEqual(list(pool.lookup_scope(name)), exp, name)
+
+        rsrcs = []
+        for (i, scope) in enumerate(scopes):
+            for fname in ["f1", "f2"]:
+                rsrcs.append(UVMResource(fname, scope))
+                pool.set(rsrcs[-1])
+                check()
+        pool.set_priority_queue(rsrcs[0], pool.rtab["f1"], PRI_HIGH)
+        check()
+        rsrcs[2].set_scope("top.u1")
+        check()
+
+    def test_bounded_get_records(self):
+        from uvm.base.uvm_resource import UVMResourceOptions
+        pool = UVMResourcePool()
+        rsrc = UVMResource("audit_name", "audit.scope")
+        pool.set(rsrc)
+        UVMResourceOptions.turn_on_auditing()
+        UVMResourceOptions.set_max_get_records(3)
+        try:
+            for _ in range(5):
+                pool.get_by_name("audit.scope", "audit_name", None)
+                pool.get_by_name("audit.scope", "no_name", None, rpterr=False)
+            self.assertEqual(len(pool.get_record), 3)
+            self.assertEqual(pool.get_get_stats("audit.scope", "audit_name"), (5, 0))
+            self.assertEqual(pool.get_get_stats("audit.scope", "no_name"), (0, 5))
+            UVMResourceOptions.turn_off_get_history()
+            pool.get_by_name("audit.scope", "audit_name", None)
+            self.assertEqual(pool.get_record[-1].name, "no_name")
+            self.assertEqual(pool.get_get_stats("audit.scope", "audit_name"), (6, 0))
+            pool.dump_get_records()
+        finally:
+            UVMResourceOptions.set_max_get_records(0)
+            UVMResourceOptions.turn_on_get_history()
+
+    def test_unused_resources(self):
+        from uvm.base.uvm_resource import UVMResourceOptions
+        from uvm.base.uvm_object import UVMObject
+        pool = UVMResourcePool()
+        accessor = UVMObject("accessor")
+        UVMResourceOptions.turn_on_auditing()
+        UVMResourceOptions.turn_off_accessor_records()
+        try:
+            used = UVMResource("used", "*")
+            unused = UVMResource("unused", "*")
+            for r in [used, unused]:
+                pool.set(r)
+                r.write(1, accessor)
+            used.read(accessor)
+            self.assertEqual(len(used.access), 0)
+            self.assertEqual(list(pool.find_unused_resources()), [unused])
+            pool.dump(audit=True)
+        finally:
+            UVMResourceOptions.turn_on_accessor_records()
+
+    def test_freeze(self):
+        from uvm.base.uvm_resource import FREEZE_ERROR, PRI_LOW
+        pool = UVMResourcePool()
+        rsrcs = [UVMResource("frz", scope) for scope in ["*", "top.*", "top.env"]]
+        for r in rsrcs:
+            pool.set(r)
+        rsrcs[1].precedence += 1
+        scopes = ["top", "top.env", "other"]
+
+        def query(s):
+            return (pool.get_by_name(s, "frz", None), list(pool.lookup_scope(s)),
+                pool.lookup_name(s, "frz"), pool.lookup_regex_names(s, "frz"))
+        exp = [query(s) for s in scopes]
+        self.assertEqual([e[0] for e in exp], [rsrcs[0], rsrcs[1], rsrcs[0]])
+
+        pool.freeze()
+        for _ in range(2):
+            self.assertEqual([query(s) for s in scopes], exp)
+        self.assertEqual(pool.m_name_snapshot[("top.env", "frz", None)], rsrcs[1])
+        self.assertEqual(len(pool.m_name_snapshot), 3)
+        self.assertEqual(len(pool.m_name_q_snapshot), 3)
+        self.assertIsNone(pool.get_by_name("top", "none", None, rpterr=False))
+        self.assertEqual(pool.lookup_name("top", "none", rpterr=False), [])
+        self.assertEqual(len(pool.m_name_snapshot), 3)
+        self.assertEqual(len(pool.m_name_q_snapshot), 3)
+
+        # Precedence change clears the snapshot
+        rsrcs[2].precedence += 2
+        self.assertEqual(pool.get_by_name("top.env", "frz", None), rsrcs[2])
+        rsrcs[2].precedence -= 2
+        self.assertEqual(pool.get_by_name("top.env", "frz", None), rsrcs[1])
+        self.assertTrue(pool.is_frozen())
+
+        # Scope change clears the snapshot
+        rsrcs[1].set_scope("other")
+        self.assertEqual(pool.get_by_name("top.env", "frz", None), rsrcs[0])
+        self.assertEqual(pool.get_by_name("other", "frz", None), rsrcs[1])
+        self.assertTrue(pool.is_frozen())
+
+        # Default policy thaws the pool on set
+        pool.set(UVMResource("frz", "other"))
+        self.assertFalse(pool.is_frozen())
+        self.assertEqual(len(pool.lookup_name("other", "frz")), 3)
+
+        pool.freeze(FREEZE_ERROR)
+        with self.assertRaises(Exception):
+            pool.set(UVMResource("frz2", "*"))
+        with self.assertRaises(Exception):
+            pool.set_priority_name(rsrcs[0], PRI_LOW)
+        self.assertNotIn("frz2", pool.rtab)
+        pool.thaw()
+
 
 if __name__ == '__main__':
     unittest.main()
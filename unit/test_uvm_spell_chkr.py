@@ -1,7 +1,7 @@
 
 import unittest
 
-from uvm.base.uvm_spell_chkr import UVMSpellChkr
+from uvm.base.uvm_spell_chkr import UVMSpellChkr, UVMSpellIndex
 
 
 class TestUVMSpellChkr(unittest.TestCase):
@@ -11,6 +11,29 @@ class TestUVMSpellChkr(unittest.TestCase):
         self.assertTrue(UVMSpellChkr.check(strtab, 'xxx'))
         self.assertFalse(UVMSpellChkr.check(strtab, 'vvv'))
 
+    def test_spell_index(self):
+        import random
+        rnd = random.Random(3)
+        words = ["".join(rnd.choice("abcd_") for _ in range(rnd.randint(1, 8)))
+            for _ in range(200)]
+        index = UVMSpellIndex()
+        for w in words:
+            index.add(w)
+        self.assertEqual(len(index), len(set(words)))
+        self.assertTrue(UVMSpellChkr.check(index, words[0]))
+        order = list(dict.fromkeys(words))
+        for _ in range(50):
+            s = "".join(rnd.choice("abcde") for _ in range(rnd.randint(1, 9)))
+            dists = [UVMSpellChkr.levenshtein_distance(w, s) for w in order]
+            exp = [w for (w, d) in zip(order, dists) if d == min(dists)]
+            self.assertEqual(index.closest(s), (min(dists), exp))
+            self.assertIn(s, index.m_cache)
+        self.assertFalse(UVMSpellChkr.check(index, "zzz"))
+        index.add("zzz_")
+        self.assertEqual(len(index.m_cache), 0)
+        self.assertEqual(index.closest("zzz"), (1, ["zzz_"]))
+        self.assertEqual(UVMSpellIndex().closest("x")[1], [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+from uvm.base.uvm_transaction import UVMTransaction
+from uvm.base.uvm_event import UVMEvent
+
+
+class TestUVMTransaction(unittest.TestCase):
+
+    def test_lazy_events(self):
+        tr = UVMTransaction("tr")
+        self.assertIsNone(tr.m_event_pool)
+        tr.accept_tr()
+        tr.begin_tr()
+        tr.end_tr()
+        self.assertIsNone(tr.m_event_pool)
+
+        # Events created later reflect the earlier triggers
+        self.assertTrue(tr.begin_event.is_on())
+        self.assertTrue(tr.end_event.is_on())
+        self.assertTrue(tr.events.get("accept").is_on())
+        self.assertTrue(tr.events.get("other").is_off())
+        self.assertIsNone(tr.m_pending_triggers)
+
+        tr2 = UVMTransaction("tr2")
+        self.assertTrue(tr2.end_event.is_off())
+        self.assertEqual(sorted(tr2.events.keys()), ["begin", "end"])
+        tr2.end_tr()
+        self.assertTrue(tr2.end_event.is_on())
+
+        ev = UVMEvent("my_end")
+        tr2.end_event = ev
+        self.assertIs(tr2.end_event, ev)
+
+
+if __name__ == '__main__':
+    unittest.main()